@@ -46,6 +46,7 @@ from binancebot.exchange.exchange_types import CcxtOrder
 # from binancebot.leverage.liquidation_price import update_liquidation_prices  # Module not available
 from binancebot.misc import safe_value_fallback, safe_value_fallback2
 from binancebot.mixins import LoggingMixin
+from binancebot.multi_account import MultiAccountManager
 from binancebot.persistence import Order, PairLocks, Trade, init_db
 from binancebot.persistence.key_value_store import set_startup_time
 from binancebot.plugins.pairlistmanager import PairListManager
@@ -76,13 +77,24 @@ class BinanceBot(LoggingMixin):
     This is from here the bot start its logic.
     """
 
-    def __init__(self, config: Config) -> None:
+    def __init__(
+        self,
+        config: Config,
+        *,
+        market_source: "BinanceBot | None" = None,
+        account_id: str = "",
+    ) -> None:
         """
         Init all variables and objects the bot needs to work
         :param config: configuration dict, you can use Configuration.get_config()
         to get the config dict.
+        :param market_source: Main bot providing markets, candles and analyzed dataframes.
+            Only set for additional accounts (see MultiAccountManager).
+        :param account_id: Identifier of the additional account this bot trades for.
         """
         self.active_pair_whitelist: list[str] = []
+        self._market_source = market_source
+        self.account_id = account_id
 
         # Init bot state
         self.state = State.STOPPED
@@ -93,9 +105,16 @@ class BinanceBot(LoggingMixin):
         # Remove credentials from original exchange config to avoid accidental credential exposure
         remove_exchange_credentials(config["exchange"], True)
 
-        self.exchange = ExchangeResolver.load_exchange(
-            self.config, exchange_config=exchange_config, load_leverage_tiers=True
-        )
+        if market_source is None:
+            self.exchange = ExchangeResolver.load_exchange(
+                self.config, exchange_config=exchange_config, load_leverage_tiers=True
+            )
+        else:
+            # Markets and leverage tiers are taken over from the main bot's exchange
+            self.exchange = ExchangeResolver.load_exchange(
+                self.config, exchange_config=exchange_config, validate=False
+            )
+            self.exchange.attach_market_data(market_source.exchange)
 
         self.strategy: IStrategy = StrategyResolver.load_strategy(self.config)
 
@@ -104,10 +123,13 @@ class BinanceBot(LoggingMixin):
         # Re-validate exchange compatibility
         self.exchange.validate_config(self.config)
 
-        init_db(self.config["db_url"])
+        init_db(self.config["db_url"], account_id)
 
         self.wallets = Wallets(self.config, self.exchange)
-        self.copy_trader = CopyTradingManager(self.config, self.exchange)
+        # Only the main account mirrors its trades to follower profiles
+        self.copy_trader = CopyTradingManager(
+            self.config, self.exchange, enabled=market_source is None
+        )
 
         PairLocks.timeframe = self.config["timeframe"]
 
@@ -122,10 +144,15 @@ class BinanceBot(LoggingMixin):
         # Keep this at the end of this initialization method.
         self.rpc: RPCManager = RPCManager(self)
 
-        self.dataprovider = DataProvider(self.config, self.exchange, rpc=self.rpc)
-        self.pairlists = PairListManager(self.exchange, self.config, self.dataprovider)
+        if market_source is None:
+            self.dataprovider = DataProvider(self.config, self.exchange, rpc=self.rpc)
+            self.pairlists = PairListManager(self.exchange, self.config, self.dataprovider)
 
-        self.dataprovider.add_pairlisthandler(self.pairlists)
+            self.dataprovider.add_pairlisthandler(self.pairlists)
+        else:
+            # Candles, analyzed dataframes and the pairlist are shared with the main bot
+            self.dataprovider = market_source.dataprovider
+            self.pairlists = market_source.pairlists
 
         # Attach Dataprovider to strategy instance
         self.strategy.dp = self.dataprovider
@@ -165,7 +192,8 @@ class BinanceBot(LoggingMixin):
                     t = str(time(time_slot, minutes, 2))
                     self._schedule.every().day.at(t).do(update)
 
-        self._schedule.every().day.at("00:02").do(self.exchange.ws_connection_reset)
+        if market_source is None:
+            self._schedule.every().day.at("00:02").do(self.exchange.ws_connection_reset)
 
         self.strategy.ft_bot_start()
         # Initialize protections AFTER bot start - otherwise parameters are not loaded.
@@ -181,6 +209,11 @@ class BinanceBot(LoggingMixin):
 
         self._measure_execution = MeasureTime(log_took_too_long, timeframe_secs * 0.25)
 
+        # Additional accounts sharing this bot's market data
+        self.accounts: MultiAccountManager | None = (
+            MultiAccountManager(self) if market_source is None else None
+        )
+
     def notify_status(self, msg: str, msg_type=RPCMessageType.STATUS) -> None:
         """
         Public method for users of this class (worker, etc.) to send notifications
@@ -207,6 +240,8 @@ class BinanceBot(LoggingMixin):
         finally:
             self.strategy.ft_bot_cleanup()
 
+        if self.accounts:
+            self.accounts.cleanup()
         self.rpc.cleanup()
         self.exchange.close()
         self.copy_trader.close()
@@ -236,6 +271,8 @@ class BinanceBot(LoggingMixin):
         self.startup_update_open_orders()
         self.update_all_liquidation_prices()
         self.update_funding_fees()
+        if self.accounts:
+            self.accounts.startup()
 
     def process(self) -> None:
         """
@@ -254,18 +291,28 @@ class BinanceBot(LoggingMixin):
 
         self.active_pair_whitelist = self._refresh_active_whitelist(trades)
 
-        # Refreshing candles
-        self.dataprovider.refresh(
-            self.pairlists.create_pair_list(self.active_pair_whitelist),
-            self.strategy.gather_informative_pairs(),
-        )
+        if self._market_source is None:
+            # Pairs with open trades on additional accounts need candles and signals, too
+            analyzed_pairs = (
+                self.accounts.market_pairs(self.active_pair_whitelist)
+                if self.accounts
+                else self.active_pair_whitelist
+            )
+            # Refreshing candles
+            self.dataprovider.refresh(
+                self.pairlists.create_pair_list(analyzed_pairs),
+                self.strategy.gather_informative_pairs(),
+            )
+            # Stream prices of tradable pairs for entry / exit pricing
+            self.exchange.schedule_price_streams(analyzed_pairs)
 
         strategy_safe_wrapper(self.strategy.bot_loop_start, supress_error=True)(
             current_time=datetime.now(UTC)
         )
 
-        with self._measure_execution:
-            self.strategy.analyze(self.active_pair_whitelist)
+        if self._market_source is None:
+            with self._measure_execution:
+                self.strategy.analyze(analyzed_pairs)
 
         with self._exit_lock:
             # Check for exchange cancellations, timeouts and user requested replace
@@ -290,7 +337,10 @@ class BinanceBot(LoggingMixin):
             self.enter_positions()
         self._schedule.run_pending()
         Trade.commit()
-        self.rpc.process_msg_queue(self.dataprovider._msg_queue)
+        if self._market_source is None:
+            self.rpc.process_msg_queue(self.dataprovider._msg_queue)
+            if self.accounts:
+                self.accounts.process()
         self.last_process = datetime.now(UTC)
 
     def process_stopped(self) -> None:
@@ -299,6 +349,8 @@ class BinanceBot(LoggingMixin):
         """
         if self.config["cancel_open_orders_on_exit"]:
             self.cancel_all_open_orders()
+        if self.accounts:
+            self.accounts.process_stopped()
 
     def check_for_open_trades(self):
         """
@@ -325,8 +377,13 @@ class BinanceBot(LoggingMixin):
         """
         # Refresh whitelist
         _prev_whitelist = self.pairlists.whitelist
-        self.pairlists.refresh_pairlist()
-        _whitelist = self.pairlists.whitelist
+        if self._market_source is None:
+            self.pairlists.refresh_pairlist()
+            _whitelist = self.pairlists.whitelist
+        else:
+            # The pairlist is refreshed by the main bot - don't extend its whitelist in place
+            _prev_whitelist = self.active_pair_whitelist
+            _whitelist = list(self.pairlists.whitelist)
 
         if trades:
             # Extend active-pair whitelist with pairs of open trades
@@ -1599,11 +1656,21 @@ class BinanceBot(LoggingMixin):
         Timeout setting takes priority over limit order adjustment request.
         :return: None
         """
-        for trade in Trade.get_open_trades():
+        open_trades = Trade.get_open_trades()
+        pair_orders: dict[str, list[str]] = {}
+        for trade in open_trades:
+            for open_order in trade.open_orders:
+                pair_orders.setdefault(trade.pair, []).append(open_order.order_id)
+        # Batched status of all open orders - only orders missing there are fetched one by one
+        exchange_orders = self.exchange.fetch_open_orders_by_id(pair_orders)
+
+        for trade in open_trades:
             open_order: Order
             for open_order in trade.open_orders:
                 try:
-                    order = self.exchange.fetch_order(open_order.order_id, trade.pair)
+                    order = exchange_orders.get(open_order.order_id) or self.exchange.fetch_order(
+                        open_order.order_id, trade.pair
+                    )
 
                 except ExchangeError:
                     logger.info(
@@ -7,7 +7,10 @@ Note: Be careful with file-scoped imports in these subfiles.
     as they are parsed on startup, nothing containing optional modules should be loaded.
 """
 
-from binancebot.commands.analyze_commands import start_analysis_entries_exits
+from binancebot.commands.analyze_commands import (
+    start_analysis_entries_exits,
+    start_analysis_montecarlo,
+)
 from binancebot.commands.arguments import Arguments
 from binancebot.commands.build_config_commands import start_new_config, start_show_config
 from binancebot.commands.data_commands import (
@@ -40,6 +43,7 @@ from binancebot.commands.optimize_commands import (
     start_hyperopt,
     start_lookahead_analysis,
     start_recursive_analysis,
+    start_walk_forward,
 )
 from binancebot.commands.pairlist_commands import start_test_pairlist
 from binancebot.commands.strategy_utils_commands import start_strategy_update
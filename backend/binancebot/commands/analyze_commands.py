@@ -22,3 +22,19 @@ def start_analysis_entries_exits(args: dict[str, Any]) -> None:
     logger.info("Starting binancebot in analysis mode")
 
     process_entry_exit_reasons(config)
+
+
+def start_analysis_montecarlo(args: dict[str, Any]) -> None:
+    """
+    Start Monte Carlo analysis of backtest results
+    :param args: Cli args from Arguments()
+    :return: None
+    """
+    from binancebot.configuration import setup_utils_configuration
+    from binancebot.data.montecarlo import process_montecarlo
+
+    config = setup_utils_configuration(args, RunMode.UTIL_NO_EXCHANGE)
+
+    logger.info("Starting binancebot in Monte Carlo analysis mode")
+
+    process_montecarlo(config)
@@ -60,6 +60,7 @@ ARGS_BACKTEST = [
     "backtest_cache",
     "AIML_backtest_live_models",
     "backtest_notes",
+    "backtest_workers",
 ]
 
 ARGS_HYPEROPT = [
@@ -83,6 +84,14 @@ ARGS_HYPEROPT = [
     "early_stop",
 ]
 
+ARGS_WALK_FORWARD = [
+    a for a in ARGS_HYPEROPT if a not in ("print_all", "print_json", "disableparamexport")
+] + [
+    "walk_forward_windows",
+    "walk_forward_oos_ratio",
+    "walk_forward_anchored",
+]
+
 ARGS_EDGE = [*ARGS_COMMON_OPTIMIZE]
 
 ARGS_LIST_STRATEGIES = [
@@ -254,12 +263,27 @@ ARGS_ANALYZE_ENTRIES_EXITS = [
 ]
 
 
+ARGS_ANALYZE_MONTECARLO = [
+    "exportfilename",
+    "exportdirectory",
+    "montecarlo_simulations",
+    "montecarlo_method",
+    "montecarlo_random_state",
+]
+
 ARGS_STRATEGY_UPDATER = ["strategy_list", "strategy_path", "recursive_strategy_search"]
 
 ARGS_LOOKAHEAD_ANALYSIS = [
     a
     for a in ARGS_BACKTEST
-    if a not in ("position_stacking", "backtest_cache", "backtest_breakdown", "backtest_notes")
+    if a
+    not in (
+        "position_stacking",
+        "backtest_cache",
+        "backtest_breakdown",
+        "backtest_notes",
+        "backtest_workers",
+    )
 ] + [
     "minimum_trade_amount",
     "targeted_trade_amount",
@@ -273,6 +297,7 @@ ARGS_RECURSIVE_ANALYSIS = ["timeframe", "timerange", "dataformat_ohlcv", "pairs"
 NO_CONF_REQURIED = [
     "backtest-filter",
     "backtesting-show",
+    "backtesting-montecarlo",
     "convert-data",
     "convert-trade-data",
     "download-data",
@@ -370,6 +395,7 @@ class Arguments:
 
         from binancebot.commands import (
             start_analysis_entries_exits,
+            start_analysis_montecarlo,
             start_backtesting,
             start_backtesting_show,
             start_convert_data,
@@ -398,6 +424,7 @@ class Arguments:
             start_strategy_update,
             start_test_pairlist,
             start_trading,
+            start_walk_forward,
             start_webserver,
         )
 
@@ -515,6 +542,15 @@ class Arguments:
         analysis_cmd.set_defaults(func=start_analysis_entries_exits)
         self._build_args(optionlist=ARGS_ANALYZE_ENTRIES_EXITS, parser=analysis_cmd)
 
+        # Add backtesting montecarlo subcommand
+        montecarlo_cmd = subparsers.add_parser(
+            "backtesting-montecarlo",
+            help="Monte Carlo analysis of backtest results.",
+            parents=[_common_parser],
+        )
+        montecarlo_cmd.set_defaults(func=start_analysis_montecarlo)
+        self._build_args(optionlist=ARGS_ANALYZE_MONTECARLO, parser=montecarlo_cmd)
+
         # Add edge subcommand
         edge_cmd = subparsers.add_parser(
             "edge",
@@ -533,6 +569,15 @@ class Arguments:
         hyperopt_cmd.set_defaults(func=start_hyperopt)
         self._build_args(optionlist=ARGS_HYPEROPT, parser=hyperopt_cmd)
 
+        # Add walk-forward subcommand
+        walk_forward_cmd = subparsers.add_parser(
+            "walk-forward",
+            help="Walk-forward analysis - hyperopt and backtest over moving windows.",
+            parents=[_common_parser, _strategy_parser],
+        )
+        walk_forward_cmd.set_defaults(func=start_walk_forward)
+        self._build_args(optionlist=ARGS_WALK_FORWARD, parser=walk_forward_cmd)
+
         # Add hyperopt-list subcommand
         hyperopt_list_cmd = subparsers.add_parser(
             "hyperopt-list",
@@ -258,6 +258,14 @@ AVAILABLE_CLI_OPTIONS = {
         default=constants.BACKTEST_CACHE_DEFAULT,
         choices=constants.BACKTEST_CACHE_AGE,
     ),
+    "backtest_workers": Arg(
+        "--backtest-workers",
+        help="Backtest the strategies of --strategy-list in this many worker processes, "
+        "sharing one data load. If -1, all CPUs are used, for -2, all CPUs but one are used, "
+        "etc. Default: 1 (sequential).",
+        type=int,
+        metavar="INT",
+    ),
     # Hyperopt
     "hyperopt_path": Arg(
         "--hyperopt-path",
@@ -354,6 +362,27 @@ AVAILABLE_CLI_OPTIONS = {
         f"{', '.join(HYPEROPT_LOSS_BUILTIN)}",
         metavar="NAME",
     ),
+    # Walk-forward
+    "walk_forward_windows": Arg(
+        "--wf-windows",
+        help="Number of walk-forward windows (default: %(default)d).",
+        type=check_int_positive,
+        metavar="INT",
+        default=constants.WALK_FORWARD_WINDOWS,
+    ),
+    "walk_forward_oos_ratio": Arg(
+        "--wf-oos-ratio",
+        help="Share of the out-of-sample part in each walk-forward window (default: %(default)s).",
+        type=float,
+        metavar="FLOAT",
+        default=constants.WALK_FORWARD_OOS_RATIO,
+    ),
+    "walk_forward_anchored": Arg(
+        "--wf-anchored",
+        help="Start all in-sample parts at the beginning of the timerange "
+        "instead of moving them along with the windows.",
+        action="store_true",
+    ),
     "hyperoptexportfilename": Arg(
         "--hyperopt-filename",
         help="Hyperopt result filename."
@@ -768,6 +797,26 @@ AVAILABLE_CLI_OPTIONS = {
             "if --analysis-to-csv is enabled. Default: user_data/basktesting_results/"
         ),
     ),
+    "montecarlo_simulations": Arg(
+        "--simulations",
+        help="Number of simulated trade sequences (default: %(default)d).",
+        type=check_int_positive,
+        metavar="INT",
+        default=constants.MONTECARLO_SIMULATIONS,
+    ),
+    "montecarlo_method": Arg(
+        "--method",
+        help="Reorder the trades (shuffle), or draw trades with replacement (bootstrap). "
+        "Default: %(default)s.",
+        choices=constants.MONTECARLO_METHODS,
+        default="shuffle",
+    ),
+    "montecarlo_random_state": Arg(
+        "--random-state",
+        help="Set random state to some positive integer for reproducible results.",
+        type=check_int_positive,
+        metavar="INT",
+    ),
     "AIMLmodel": Arg(
         "--AIMLmodel",
         help="Specify a custom AIMLmodels.",
@@ -123,6 +123,28 @@ def start_hyperopt(args: dict[str, Any]) -> None:
         # Same in Edge and Backtesting start() functions.
 
 
+def start_walk_forward(args: dict[str, Any]) -> None:
+    """
+    Start walk-forward analysis
+    :param args: Cli args from Arguments()
+    :return: None
+    """
+    try:
+        from binancebot.optimize.walk_forward import WalkForward
+    except ImportError as e:
+        raise OperationalException(
+            f"{e}. Please ensure that the hyperopt dependencies are installed."
+        ) from e
+
+    config = setup_optimize_configuration(args, RunMode.HYPEROPT)
+
+    logger.info("Starting binancebot in Walk-forward mode")
+
+    logging.getLogger("hyperopt.tpe").setLevel(logging.WARNING)
+    walk_forward = WalkForward(config)
+    walk_forward.start()
+
+
 def start_edge(args: dict[str, Any]) -> None:
     """
     Start Edge script
@@ -20,6 +20,8 @@ from binancebot.constants import (
     TIMEOUT_UNITS,
     TRADING_MODES,
     UNLIMITED_STAKE_AMOUNT,
+    WALK_FORWARD_OOS_RATIO,
+    WALK_FORWARD_WINDOWS,
     WEBHOOK_FORMAT_OPTIONS,
 )
 from binancebot.enums import RPCMessageType
@@ -236,6 +238,14 @@ CONF_SCHEMA = {
             "type": "string",
             "enum": BACKTEST_CACHE_AGE,
         },
+        "backtest_workers": {
+            "description": (
+                "Worker processes backtesting the strategies of a strategy list side by side "
+                "(-1: all CPUs, -2: all CPUs but one, ...)."
+            ),
+            "type": "integer",
+            "default": 1,
+        },
         # Hyperopt
         "hyperopt_path": {
             "description": "Specify additional lookup path for Hyperopt Loss functions.",
@@ -300,6 +310,27 @@ CONF_SCHEMA = {
             ),
             "type": "string",
         },
+        "walk_forward_windows": {
+            "description": "Number of windows of the walk-forward analysis.",
+            "type": "integer",
+            "minimum": 1,
+            "default": WALK_FORWARD_WINDOWS,
+        },
+        "walk_forward_oos_ratio": {
+            "description": "Share of the out-of-sample part in each walk-forward window.",
+            "type": "number",
+            "exclusiveMinimum": 0,
+            "exclusiveMaximum": 1,
+            "default": WALK_FORWARD_OOS_RATIO,
+        },
+        "walk_forward_anchored": {
+            "description": (
+                "Start all in-sample parts of the walk-forward analysis at the beginning "
+                "of the timerange."
+            ),
+            "type": "boolean",
+            "default": False,
+        },
         # end hyperopt
         "bot_name": {
             "description": "Name of the trading bot. Passed via API to a client.",
@@ -749,6 +780,39 @@ CONF_SCHEMA = {
                     "type": ["string", "array"],
                     "items": {"type": "string"},
                 },
+                "response_cache": {
+                    "description": (
+                        "Reuse responses of read-heavy endpoints (status, profit, balance, "
+                        "candles...) until the trades, locks or candles they show change, "
+                        "and answer requests with a matching ETag with 304."
+                    ),
+                    "type": "boolean",
+                    "default": True,
+                },
+                "background_workers": {
+                    "description": (
+                        "Worker processes for background jobs of the webserver (backtests, "
+                        "data downloads, pairlist evaluations)."
+                    ),
+                    "type": "integer",
+                    "minimum": 1,
+                    "default": 2,
+                },
+                "ws_queue_size": {
+                    "description": "Maximum number of queued messages per websocket client.",
+                    "type": "integer",
+                    "minimum": 1,
+                },
+                "ws_queue_policy": {
+                    "description": (
+                        "Handling of messages a websocket client can't keep up with. "
+                        "`coalesce` replaces queued market data messages (analyzed dataframes, "
+                        "new candles, whitelist) with newer ones for the same pair and drops "
+                        "them first, `drop_oldest` drops the oldest messages."
+                    ),
+                    "type": "string",
+                    "enum": ["coalesce", "drop_oldest"],
+                },
                 "jwt_secret_key": {
                     "description": "Secret key for JWT authentication.",
                     "type": "string",
@@ -771,6 +835,34 @@ CONF_SCHEMA = {
             "description": "Database connection URL.",
             "type": "string",
         },
+        "multi_account": {
+            "description": (
+                "Run API profiles (`api_server.profiles`) as additional accounts in this "
+                "process, sharing markets, candles and analyzed dataframes."
+            ),
+            "type": "object",
+            "properties": {
+                "enabled": {
+                    "description": "Enable multi-account mode.",
+                    "type": "boolean",
+                    "default": False,
+                },
+                "profiles": {
+                    "description": (
+                        "Profile ids to run. Defaults to all profiles except the active one."
+                    ),
+                    "type": "array",
+                    "items": {"type": "string"},
+                },
+                "db_url": {
+                    "description": (
+                        "Database URL template per account. `{account_id}` is replaced "
+                        "by the profile id."
+                    ),
+                    "type": "string",
+                },
+            },
+        },
         "export": {
             "description": "Type of data to export.",
             "type": "string",
@@ -811,6 +903,14 @@ CONF_SCHEMA = {
                     "description": "Enable systemd notify.",
                     "type": "boolean",
                 },
+                "rpc_queue_size": {
+                    "description": (
+                        "Maximum number of queued RPC messages per consumer. "
+                        "Market data messages beyond are dropped."
+                    ),
+                    "type": "integer",
+                    "minimum": 1,
+                },
             },
         },
         "dataformat_ohlcv": {
@@ -977,6 +1077,15 @@ CONF_SCHEMA = {
                     "type": "boolean",
                     "default": True,
                 },
+                "coalesce_max_age": {
+                    "description": (
+                        "Seconds a ticker result may be shared with identical, "
+                        "later requests. Concurrent identical requests are always coalesced."
+                    ),
+                    "type": "number",
+                    "minimum": 0,
+                    "default": 1,
+                },
                 "unknown_fee_rate": {
                     "description": "Fee rate for unknown markets.",
                     "type": "number",
@@ -330,6 +330,7 @@ class Configuration:
             ("disableparamexport", "Parameter --disableparamexport detected: {} ..."),
             ("AIML_backtest_live_models", "Parameter --AIML-backtest-live-models detected ..."),
             ("backtest_notes", "Parameter --notes detected: {} ..."),
+            ("backtest_workers", "Parameter --backtest-workers detected: {} ..."),
         ]
         self._args_to_config_loop(config, configurations)
 
@@ -382,6 +383,9 @@ class Configuration:
             ("hyperopt_list_no_details", "Parameter --no-details detected: {}"),
             ("hyperopt_show_no_header", "Parameter --no-header detected: {}"),
             ("hyperopt_ignore_missing_space", "Parameter --ignore-missing-space detected: {}"),
+            ("walk_forward_windows", "Parameter --wf-windows detected: {}"),
+            ("walk_forward_oos_ratio", "Parameter --wf-oos-ratio detected: {}"),
+            ("walk_forward_anchored", "Parameter --wf-anchored detected."),
         ]
 
         self._args_to_config_loop(config, configurations)
@@ -441,6 +445,10 @@ class Configuration:
             ("analysis_rejected", "Analyse rejected signals: {}"),
             ("analysis_to_csv", "Store analysis tables to CSV: {}"),
             ("analysis_csv_path", "Path to store analysis CSVs: {}"),
+            # Monte Carlo analysis
+            ("montecarlo_simulations", "Monte Carlo simulations: {}"),
+            ("montecarlo_method", "Monte Carlo method: {}"),
+            ("montecarlo_random_state", "Monte Carlo random state: {}"),
             # Lookahead analysis results
             ("targeted_trade_amount", "Targeted Trade amount: {}"),
             ("minimum_trade_amount", "Minimum Trade amount: {}"),
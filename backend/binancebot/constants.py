@@ -13,11 +13,17 @@ DOCS_LINK = "https://github.com/dangdoday/SE2025-9.4#readme"
 DEFAULT_CONFIG = "config.json"
 PROCESS_THROTTLE_SECS = 5  # sec
 HYPEROPT_EPOCH = 100  # epochs
+WALK_FORWARD_WINDOWS = 4
+WALK_FORWARD_OOS_RATIO = 0.25
+MONTECARLO_SIMULATIONS = 10000
+MONTECARLO_METHODS = ["shuffle", "bootstrap"]
 RETRY_TIMEOUT = 30  # sec
 TIMEOUT_UNITS = ["minutes", "seconds"]
 EXPORT_OPTIONS = ["none", "trades", "signals"]
 DEFAULT_DB_PROD_URL = "sqlite:///data/tradesv3.sqlite"
 DEFAULT_DB_DRYRUN_URL = "sqlite:///data/tradesv3.dryrun.sqlite"
+# Matches the per-profile database used by the web UI when switching profiles
+DEFAULT_ACCOUNT_DB_URL = "sqlite:///tradesv3_{account_id}.sqlite"
 UNLIMITED_STAKE_AMOUNT = "unlimited"
 DEFAULT_AMOUNT_RESERVE_PERCENT = 0.05
 REQUIRED_ORDERTIF = ["entry", "exit"]
@@ -121,6 +127,8 @@ USERPATH_AIMLMODELS = "aimlmodels"
 TELEGRAM_SETTING_OPTIONS = ["on", "off", "silent"]
 WEBHOOK_FORMAT_OPTIONS = ["form", "json", "raw"]
 FULL_DATAFRAME_THRESHOLD = 100
+# Most recent rows of analyzed dataframes checked for updates when sending deltas
+DATAFRAME_DELTA_WINDOW = 100
 CUSTOM_TAG_MAX_LENGTH = 255
 DL_DATA_TIMEFRAMES = ["1m", "5m"]
 
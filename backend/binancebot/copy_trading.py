@@ -10,6 +10,7 @@ from typing import Any
 import ccxt
 
 from binancebot.misc import deep_merge_dicts
+from binancebot.multi_account import get_account_profiles
 
 
 logger = logging.getLogger(__name__)
@@ -32,9 +33,10 @@ class CopyTradingManager:
     Mirror master trades to enabled follower profiles.
     """
 
-    def __init__(self, config: dict[str, Any], exchange) -> None:
+    def __init__(self, config: dict[str, Any], exchange, enabled: bool = True) -> None:
         self._config = config
         self._exchange = exchange
+        self._enabled = enabled
         self._clients: dict[str, dict[str, Any]] = {}
         self._state_path = Path(config.get("datadir", "data")) / "copy_trades.json"
         self._state: dict[str, Any] = self._load_state()
@@ -77,6 +79,8 @@ class CopyTradingManager:
         master_key = cfg.get("exchange", {}).get("key") or self._get_master_key()
         active_profile_id = api_cfg.get("active_profile_id")
         raw_profiles = api_cfg.get("profiles", [])
+        # Profiles hosted as additional accounts trade on their own
+        hosted_ids = {p.get("id") for p in get_account_profiles(cfg)}
         profiles: list[CopyProfile] = []
 
         for p in raw_profiles:
@@ -90,6 +94,8 @@ class CopyTradingManager:
                 continue
             if active_profile_id and p.get("id") == active_profile_id:
                 continue
+            if p.get("id") in hosted_ids:
+                continue
             if master_key and api_key == master_key:
                 continue
             profiles.append(
@@ -130,6 +136,8 @@ class CopyTradingManager:
         ccxt_config["options"] = options
 
         client = exchange_cls(ccxt_config)
+        # Same IP - share the bot's request weight budget
+        self._exchange.install_rate_limiter(client)
         client.load_markets()
         return client
 
@@ -182,7 +190,7 @@ class CopyTradingManager:
         stake_currency: str,
         mode: str,
     ) -> None:
-        if mode not in ("initial", "force_entry"):
+        if not self._enabled or mode not in ("initial", "force_entry"):
             return
         profiles = self._get_copy_profiles()
         if not profiles:
@@ -226,6 +234,8 @@ class CopyTradingManager:
         pair: str,
         side: str,
     ) -> None:
+        if not self._enabled:
+            return
         profiles = self._get_copy_profiles()
         if not profiles:
             return
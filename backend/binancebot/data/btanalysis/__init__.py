@@ -22,7 +22,7 @@ from .bt_fileutils import (
     trade_list_to_dataframe,
     update_backtest_metadata,
 )
-from .historic_precision import get_tick_size_over_time
+from .historic_precision import get_tick_size_over_time, get_tick_size_over_time_cached
 from .trade_parallelism import (
     analyze_trade_parallelism,
     evaluate_result_multi,
@@ -1,6 +1,64 @@
+import threading
+from collections.abc import Hashable
+
+import numpy as np
+from cachetools import LRUCache
 from pandas import DataFrame, Series
 
 
+# Tick sizes per data version and candle span - repeated backtests of the same data reuse them
+TICK_SIZE_CACHE_SIZE = 1024
+_tick_size_cache: LRUCache = LRUCache(maxsize=TICK_SIZE_CACHE_SIZE)
+_tick_size_lock = threading.Lock()
+
+# Prices are rounded to 14 decimals and inspected with 15 decimals
+PRICE_DECIMALS = 15
+
+
+def _split(values: np.ndarray | float) -> tuple[np.ndarray | float, np.ndarray | float]:
+    # Dekker's split into two halves of 26 bits - their products are exact
+    scaled = 134217729.0 * values
+    high = scaled - (scaled - values)
+    return high, values - high
+
+
+def _scale_fraction(fraction: np.ndarray) -> np.ndarray:
+    """
+    fraction * 10**PRICE_DECIMALS, rounded half to even like "{:.15f}".format rounds the
+    exact binary value. The rounding error of the float product is recovered exactly.
+    """
+    factor = float(10**PRICE_DECIMALS)
+    product = fraction * factor
+    frac_high, frac_low = _split(fraction)
+    factor_high, factor_low = _split(factor)
+    error = (
+        ((frac_high * factor_high - product) + frac_high * factor_low + frac_low * factor_high)
+        + frac_low * factor_low
+    )
+    whole = np.floor(product)
+    remainder = (product - whole) + error
+    whole = whole.astype(np.int64)
+    round_up = (remainder > 0.5) | ((remainder == 0.5) & (whole % 2 == 1))
+    return whole + round_up
+
+
+def _count_decimals(prices: np.ndarray) -> np.ndarray:
+    """
+    Number of decimals up to the last non-zero one, nan for whole numbers.
+    The fraction is scaled to an integer, and its trailing zeros are stripped.
+    """
+    rounded = np.abs(np.round(prices, PRICE_DECIMALS - 1))
+    valid = np.isfinite(rounded)
+    rounded = np.where(valid, rounded, 0.0)
+    scaled = _scale_fraction(rounded - np.trunc(rounded)) % 10**PRICE_DECIMALS
+
+    count = np.full(len(scaled), float(PRICE_DECIMALS))
+    for exponent in range(1, PRICE_DECIMALS):
+        count -= scaled % 10**exponent == 0
+    count[(scaled == 0) | ~valid] = np.nan
+    return count
+
+
 def get_tick_size_over_time(candles: DataFrame) -> Series:
     """
     Calculate the number of significant digits for candles over time.
@@ -8,20 +66,36 @@ def get_tick_size_over_time(candles: DataFrame) -> Series:
     :param candles: DataFrame with OHLCV data
     :return: Series with the average number of significant digits for each month
     """
-    # count the number of significant digits for the open and close prices
+    # count the number of significant digits for the open, high, low and close prices
+    max_count = np.full(len(candles), np.nan)
     for col in ["open", "high", "low", "close"]:
-        candles[f"{col}_count"] = (
-            candles[col].round(14).apply("{:.15f}".format).str.extract(r"\.(\d*[1-9])")[0].str.len()
-        )
-    candles["max_count"] = candles[["open_count", "close_count", "high_count", "low_count"]].max(
-        axis=1
-    )
+        max_count = np.fmax(max_count, _count_decimals(candles[col].to_numpy(dtype=float)))
 
-    candles1 = candles.set_index("date", drop=True)
     # Group by month and calculate the average number of significant digits
-    monthly_count_avg1 = candles1["max_count"].resample("MS").max()
-    # monthly_open_count_avg
+    monthly_count_avg1 = (
+        Series(max_count, index=candles["date"], name="max_count").resample("MS").max()
+    )
     # convert monthly_open_count_avg from 5.0 to 0.00001, 4.0 to 0.0001, ...
     monthly_open_count_avg = 1 / 10**monthly_count_avg1
 
     return monthly_open_count_avg
+
+
+def get_tick_size_over_time_cached(candles: DataFrame, data_key: Hashable | None) -> Series:
+    """
+    get_tick_size_over_time, cached per data version and candle span.
+    :param candles: DataFrame with OHLCV data
+    :param data_key: Identifies pair and version of the data, e.g. the data file's mtime and size.
+        None disables the cache.
+    :return: Series with the tick size for each month
+    """
+    if data_key is None or candles.empty:
+        return get_tick_size_over_time(candles)
+    key = (data_key, candles["date"].iloc[0], candles["date"].iloc[-1], len(candles))
+    with _tick_size_lock:
+        cached = _tick_size_cache.get(key)
+    if cached is None:
+        cached = get_tick_size_over_time(candles)
+        with _tick_size_lock:
+            _tick_size_cache[key] = cached
+    return cached
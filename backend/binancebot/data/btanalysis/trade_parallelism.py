@@ -11,45 +11,46 @@ logger = logging.getLogger(__name__)
 
 def analyze_trade_parallelism(trades: pd.DataFrame, timeframe: str) -> pd.DataFrame:
     """
-    Find overlapping trades by expanding each trade once per period it was open
-    and then counting overlaps.
+    Find overlapping trades with a sweep over the candles: +1 at the candle a trade opened in,
+    -1 after the last candle it was open in, cumulated.
+    A trade counts for all periods from its open date up to (excluding) its close date,
+    and at least for the period it opened in.
     :param trades: Trades Dataframe - can be loaded from backtest, or created
         via trade_list_to_dataframe
     :param timeframe: Timeframe used for backtest
     :return: dataframe with open-counts per time-period in timeframe
     """
-    from binancebot.exchange import timeframe_to_resample_freq
-
-    timeframe_freq = timeframe_to_resample_freq(timeframe)
-    dates = [
-        pd.Series(
-            pd.date_range(
-                row[1]["open_date"],
-                row[1]["close_date"],
-                freq=timeframe_freq,
-                # Exclude right boundary - the date is the candle open date.
-                inclusive="left",
-            )
-        )
-        for row in trades[["open_date", "close_date"]].iterrows()
-    ]
-    deltas = [len(x) for x in dates]
-    dates = pd.Series(pd.concat(dates).values, name="date")
-    df2 = pd.DataFrame(np.repeat(trades.values, deltas, axis=0), columns=trades.columns)
-
-    df2 = pd.concat([dates, df2], axis=1)
-    df2 = df2.set_index("date")
-    df_final = df2.resample(timeframe_freq)[["pair"]].count()
-    df_final = df_final.rename({"pair": "open_trades"}, axis=1)
-    return df_final
+    from binancebot.exchange import timeframe_to_seconds
+
+    tf_ns = timeframe_to_seconds(timeframe) * 1_000_000_000
+    open_ns = pd.DatetimeIndex(trades["open_date"]).as_unit("ns").asi8
+    close_ns = pd.DatetimeIndex(trades["close_date"]).as_unit("ns").asi8
+
+    start = open_ns // tf_ns
+    # Candles the trade was open in - one per started timeframe, at least the open candle
+    stop = start + np.maximum(-((open_ns - close_ns) // tf_ns), 1)
+
+    if len(start) == 0:
+        index = pd.DatetimeIndex([], dtype="datetime64[ns]", name="date")
+        return pd.DataFrame({"open_trades": np.array([], dtype=np.int64)}, index=index)
+
+    offset = start.min()
+    size = stop.max() - offset
+    deltas = np.bincount(start - offset, minlength=size + 1) - np.bincount(
+        stop - offset, minlength=size + 1
+    )
+    # Dates in UTC, without timezone
+    index = pd.DatetimeIndex(
+        (offset + np.arange(size)) * tf_ns, dtype="datetime64[ns]", name="date"
+    )
+    return pd.DataFrame({"open_trades": deltas[:-1].cumsum()}, index=index)
 
 
 def evaluate_result_multi(
     trades: pd.DataFrame, timeframe: str, max_open_trades: IntOrInf
 ) -> pd.DataFrame:
     """
-    Find overlapping trades by expanding each trade once per period it was open
-    and then counting overlaps
+    Find periods with more overlapping trades than max_open_trades
     :param trades: Trades Dataframe - can be loaded from backtest, or created
         via trade_list_to_dataframe
     :param timeframe: Frequency used for the backtest
@@ -10,10 +10,11 @@ from collections import deque
 from datetime import UTC, datetime
 from typing import Any
 
-from pandas import DataFrame, Timedelta, Timestamp, to_timedelta
+from pandas import DataFrame, Index, Timedelta, Timestamp, to_timedelta
 
 from binancebot.configuration import TimeRange
 from binancebot.constants import (
+    DATAFRAME_DELTA_WINDOW,
     FULL_DATAFRAME_THRESHOLD,
     Config,
     ListPairsWithTimeframes,
@@ -24,7 +25,7 @@ from binancebot.enums import CandleType, RPCMessageType, RunMode, TradingMode
 from binancebot.exceptions import ExchangeError, OperationalException
 from binancebot.exchange import Exchange, timeframe_to_prev_date, timeframe_to_seconds
 from binancebot.exchange.exchange_types import FundingRate, OrderBook
-from binancebot.misc import append_candles_to_dataframe
+from binancebot.misc import append_candles_to_dataframe, dataframe_delta
 from binancebot.rpc import RPCManager
 from binancebot.rpc.rpc_types import RPCAnalyzedDFMsg
 from binancebot.util import PeriodicCache
@@ -57,6 +58,9 @@ class DataProvider:
             str, dict[PairWithTimeframe, tuple[DataFrame, datetime]]
         ] = {}
         self.__producer_pairs: dict[str, list[str]] = {}
+        # Last dataframe sent as ANALYZED_DF message, per pair: its most recent rows, the
+        # dates of all its rows and its sequence number. Kept while messages are received.
+        self.__emitted_dfs: dict[PairWithTimeframe, tuple[DataFrame, Index, int]] = {}
         self._msg_queue: deque = deque()
 
         self._default_candle_type = self._config.get("candle_type_def", CandleType.SPOT)
@@ -119,22 +123,34 @@ class DataProvider:
 
     def _emit_df(self, pair_key: PairWithTimeframe, dataframe: DataFrame, new_candle: bool) -> None:
         """
-        Send this dataframe as an ANALYZED_DF message to RPC
+        Send this dataframe as an ANALYZED_DF message to RPC.
+        While a websocket consumer subscribes to analyzed_df messages, the first message
+        of a pair contains the full dataframe, later ones only the rows which were added
+        or changed since (misc.dataframe_delta). `seq` numbers the messages of each pair -
+        a delta applies to the dataframe of `base_seq`.
+        Without subscribers, the message only carries the last candle.
 
         :param pair_key: PairWithTimeframe tuple
         :param dataframe: Dataframe to emit
         :param new_candle: This is a new candle
         """
         if self.__rpc:
-            msg: RPCAnalyzedDFMsg = {
-                "type": RPCMessageType.ANALYZED_DF,
-                "data": {
-                    "key": pair_key,
-                    "df": dataframe.tail(1),
-                    "la": datetime.now(UTC),
-                },
-            }
-            self.__rpc.send_msg(msg)
+            if self.__rpc.has_subscribers(RPCMessageType.ANALYZED_DF):
+                if (msg := self._analyzed_df_delta(pair_key, dataframe)) is not None:
+                    self.__rpc.send_msg(msg)
+            else:
+                # The next subscriber starts with full dataframes
+                self.__emitted_dfs.clear()
+                self.__rpc.send_msg(
+                    {
+                        "type": RPCMessageType.ANALYZED_DF,
+                        "data": {
+                            "key": pair_key,
+                            "df": dataframe.tail(1),
+                            "la": datetime.now(UTC),
+                        },
+                    }
+                )
             if new_candle:
                 self.__rpc.send_msg(
                     {
@@ -143,6 +159,45 @@ class DataProvider:
                     }
                 )
 
+    def _analyzed_df_delta(
+        self, pair_key: PairWithTimeframe, dataframe: DataFrame
+    ) -> RPCAnalyzedDFMsg | None:
+        """
+        ANALYZED_DF message with the rows of this dataframe changed since the last message
+        of the pair - None if nothing changed.
+        """
+        previous, previous_dates, seq = self.__emitted_dfs.get(pair_key, (None, None, 0))
+        if previous is None:
+            delta = dataframe
+        else:
+            delta = dataframe_delta(previous, dataframe, old_dates=previous_dates)
+            if delta.empty and delta.columns.equals(previous.columns):
+                # Nothing changed - e.g. analysis of the same candle
+                return None
+        # Copies - the dataframe itself is released once it's replaced by the next analysis
+        self.__emitted_dfs[pair_key] = (
+            dataframe.tail(DATAFRAME_DELTA_WINDOW).copy(),
+            Index(dataframe["date"], copy=True),
+            seq + 1,
+        )
+        return {
+            "type": RPCMessageType.ANALYZED_DF,
+            "data": {
+                "key": pair_key,
+                "df": delta,
+                "la": datetime.now(UTC),
+                "seq": seq + 1,
+                "base_seq": seq,
+                "length": len(dataframe),
+            },
+        }
+
+    def _get_emitted_seq(self, pair_key: PairWithTimeframe) -> int:
+        """
+        Sequence number of the last ANALYZED_DF message sent for this pair (0 if none)
+        """
+        return self.__emitted_dfs.get(pair_key, (None, None, 0))[2]
+
     def _replace_external_df(
         self,
         pair: str,
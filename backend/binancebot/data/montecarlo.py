@@ -0,0 +1,208 @@
+"""
+Monte Carlo analysis of backtest results.
+
+The trades of a backtest are re-ordered (shuffle) or drawn with replacement (bootstrap)
+thousands of times. Profit and drawdown of all simulated trade sequences give confidence
+intervals, independent of the one trade order the backtest happened to produce.
+
+Simulations are computed in batches - a matrix of simulations x trades, cumulated per row.
+"""
+
+import logging
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from binancebot.constants import MONTECARLO_SIMULATIONS, Config
+from binancebot.data.btanalysis import load_backtest_data, load_backtest_stats
+from binancebot.data.metrics import calculate_csum, calculate_max_drawdown
+from binancebot.exceptions import ConfigurationError
+from binancebot.util import fmt_coin, print_rich_table
+
+
+logger = logging.getLogger(__name__)
+
+# Cells (simulations x trades) of one batch - a handful of matrices of this size are in memory
+BATCH_CELLS = 1_000_000
+# Batches are computed in worker processes from this number of cells on
+PARALLEL_MIN_CELLS = 50_000_000
+PERCENTILES = [5, 25, 50, 75, 95]
+
+
+def _simulate_batch(
+    profits: np.ndarray,
+    simulations: int,
+    method: str,
+    seed: np.random.SeedSequence,
+    starting_balance: float,
+) -> dict[str, np.ndarray]:
+    """
+    Simulate trade sequences, and calculate their metrics like calculate_max_drawdown and
+    calculate_csum do for one sequence.
+    """
+    rng = np.random.default_rng(seed)
+    trade_count = len(profits)
+    if method == "bootstrap":
+        order = rng.integers(0, trade_count, size=(simulations, trade_count))
+    else:
+        order = np.tile(np.arange(trade_count), (simulations, 1))
+        rng.permuted(order, axis=1, out=order)
+
+    cumulative = profits[order].cumsum(axis=1)
+    # Highs include the start (0) - like the zero row of the drawdown series
+    high_value = np.maximum(np.maximum.accumulate(cumulative, axis=1), 0)
+    drawdown = high_value - cumulative
+    with np.errstate(divide="ignore", invalid="ignore"):
+        drawdown_relative = np.fmax.reduce(
+            drawdown / (starting_balance + high_value), axis=1, initial=0.0
+        )
+    return {
+        "profit_abs": cumulative[:, -1],
+        "max_drawdown_abs": drawdown.max(axis=1),
+        "max_drawdown_relative": drawdown_relative,
+        "csum_min": cumulative.min(axis=1) + starting_balance,
+        "csum_max": cumulative.max(axis=1) + starting_balance,
+    }
+
+
+def simulate_trades(
+    trades: pd.DataFrame,
+    *,
+    starting_balance: float,
+    simulations: int = MONTECARLO_SIMULATIONS,
+    method: str = "shuffle",
+    seed: int | None = None,
+    n_jobs: int = -1,
+) -> dict[str, np.ndarray]:
+    """
+    Monte Carlo simulation of the trade sequence
+    :param trades: DataFrame containing trades (requires column profit_abs)
+    :param starting_balance: Portfolio starting balance
+    :param method: "shuffle" - reorder the trades, "bootstrap" - draw trades with replacement
+    :param seed: Random seed. Results don't depend on the number of processes.
+    :param n_jobs: Worker processes for large simulations (joblib semantics)
+    :return: Dict of metric name: array with one value per simulation
+    :raise: ValueError if trade-dataframe was found empty.
+    """
+    if len(trades) == 0:
+        raise ValueError("Trade dataframe empty.")
+
+    profits = trades["profit_abs"].to_numpy(dtype=float)
+    per_batch = max(1, BATCH_CELLS // len(profits))
+    sizes = [min(per_batch, simulations - start) for start in range(0, simulations, per_batch)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if len(sizes) > 1 and simulations * len(profits) >= PARALLEL_MIN_CELLS:
+        from joblib import Parallel, delayed
+
+        batches = Parallel(n_jobs=n_jobs)(
+            delayed(_simulate_batch)(profits, size, method, batch_seed, starting_balance)
+            for size, batch_seed in zip(sizes, seeds, strict=True)
+        )
+    else:
+        batches = [
+            _simulate_batch(profits, size, method, batch_seed, starting_balance)
+            for size, batch_seed in zip(sizes, seeds, strict=True)
+        ]
+    return {key: np.concatenate([batch[key] for batch in batches]) for key in batches[0]}
+
+
+def _backtest_metrics(trades: pd.DataFrame, starting_balance: float) -> dict[str, float]:
+    """
+    Metrics of the actual trade sequence - the reference for the simulations
+    """
+    trades = trades.sort_values("close_date").reset_index(drop=True)
+    drawdown = calculate_max_drawdown(trades, starting_balance=starting_balance)
+    # Largest relative drawdown - not the relative drawdown at the largest absolute one
+    drawdown_relative = calculate_max_drawdown(
+        trades, starting_balance=starting_balance, relative=True
+    )
+    csum_min, csum_max = calculate_csum(trades, starting_balance)
+    return {
+        "profit_abs": trades["profit_abs"].sum(),
+        "max_drawdown_abs": drawdown.drawdown_abs,
+        "max_drawdown_relative": drawdown_relative.relative_account_drawdown,
+        "csum_min": csum_min,
+        "csum_max": csum_max,
+    }
+
+
+def show_montecarlo_results(
+    strategy: str,
+    backtest: dict[str, float],
+    simulated: dict[str, np.ndarray],
+    stake_currency: str,
+    method: str,
+) -> None:
+    metrics = [
+        ("profit_abs", "Total profit"),
+        ("max_drawdown_abs", "Max drawdown"),
+        ("max_drawdown_relative", "Max drawdown %"),
+        ("csum_min", "Lowest balance"),
+        ("csum_max", "Highest balance"),
+    ]
+
+    def fmt(key: str, value: float) -> str:
+        if key == "max_drawdown_relative":
+            return f"{value:.2%}"
+        return fmt_coin(value, stake_currency)
+
+    rows = []
+    for key, label in metrics:
+        percentiles = np.percentile(simulated[key], PERCENTILES)
+        rows.append(
+            [
+                label,
+                fmt(key, backtest[key]),
+                fmt(key, simulated[key].mean()),
+                *[fmt(key, value) for value in percentiles],
+            ]
+        )
+    simulations = len(simulated["profit_abs"])
+    print_rich_table(
+        rows,
+        ["Metric", "Backtest", "Mean", *[f"{p}%" for p in PERCENTILES]],
+        summary=f"Monte Carlo analysis of {strategy} ({simulations} simulations, {method})",
+    )
+    worse_drawdown = (simulated["max_drawdown_relative"] > backtest["max_drawdown_relative"]).mean()
+    print(f"Drawdown worse than in the backtest: {worse_drawdown:.2%} of simulations.")
+    if method == "bootstrap":
+        print(f"Losing simulations: {(simulated['profit_abs'] < 0).mean():.2%}.")
+
+
+def process_montecarlo(config: Config) -> dict[str, dict[str, Any]]:
+    """
+    Monte Carlo analysis of all strategies of a backtest result
+    :return: Dict of strategy: backtest metrics and simulated metrics
+    """
+    simulations = config.get("montecarlo_simulations", MONTECARLO_SIMULATIONS)
+    method = config.get("montecarlo_method", "shuffle")
+    seed = config.get("montecarlo_random_state")
+    try:
+        backtest_stats = load_backtest_stats(config["exportdirectory"], config["exportfilename"])
+    except ValueError as e:
+        raise ConfigurationError(e) from e
+
+    results = {}
+    for strategy_name, stats in backtest_stats["strategy"].items():
+        trades = load_backtest_data(
+            config["exportdirectory"], strategy_name, config["exportfilename"]
+        )
+        if trades.empty:
+            logger.info(f"No trades for {strategy_name}, skipping.")
+            continue
+        starting_balance = stats["starting_balance"]
+        backtest = _backtest_metrics(trades, starting_balance)
+        simulated = simulate_trades(
+            trades,
+            starting_balance=starting_balance,
+            simulations=simulations,
+            method=method,
+            seed=seed,
+        )
+        show_montecarlo_results(
+            strategy_name, backtest, simulated, stats["stake_currency"], method
+        )
+        results[strategy_name] = {"backtest": backtest, "simulated": simulated}
+    return results
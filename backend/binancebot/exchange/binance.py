@@ -43,7 +43,33 @@ class Binance(Exchange):
         "trades_pagination_arg": "fromId",
         "trades_has_history": True,
         "fetch_orders_limit_minutes": None,
+        "order_fetch_weights": {
+            "fetch_order": 4,
+            "fetch_open_orders": 6,
+            "fetch_open_orders_all": 80,
+        },
         "l2_limit_range": [5, 10, 20, 50, 100, 500, 1000],
+        # Per IP limits - ccxt endpoint costs are scaled differently per API
+        "request_weight_limits": [
+            {
+                "apis": ["public", "private"],
+                "limit": 6000,
+                "cost_per_weight": 0.2,
+                "header": "x-mbx-used-weight-1m",
+            },
+            {
+                "apis": ["fapi"],
+                "limit": 2400,
+                "cost_per_weight": 1,
+                "header": "x-mbx-used-weight-1m",
+            },
+            {
+                "apis": ["sapi"],
+                "limit": 12000,
+                "cost_per_weight": 0.1,
+                "header": "x-sapi-used-ip-weight-1m",
+            },
+        ],
         "ws_enabled": True,
         "has_delisting": True,
     }
@@ -52,6 +78,8 @@ class Binance(Exchange):
         "options": {
             "adjustForTimeDifference": True,
             "recvWindow": 60000,
+            # All-symbol open order requests are only used where cheaper than per-pair calls
+            "warnOnFetchOpenOrdersWithoutSymbol": False,
         },
         "enableRateLimit": True,
     }
@@ -63,6 +91,11 @@ class Binance(Exchange):
         "tickers_have_price": False,
         "floor_leverage": True,
         "fetch_orders_limit_minutes": 7 * 1440,  # "fetch_orders" is limited to 7 days
+        "order_fetch_weights": {
+            "fetch_order": 1,
+            "fetch_open_orders": 1,
+            "fetch_open_orders_all": 40,
+        },
         "stop_price_type_field": "workingType",
         "order_props_in_contracts": ["amount", "cost", "filled", "remaining"],
         "stop_price_type_value_mapping": {
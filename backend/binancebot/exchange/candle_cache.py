@@ -0,0 +1,212 @@
+"""
+In-memory candle cache of the exchange class.
+"""
+
+import logging
+import threading
+from collections.abc import Iterator, MutableMapping
+
+import numpy as np
+from pandas import DataFrame, to_datetime
+
+from binancebot.constants import DEFAULT_DATAFRAME_COLUMNS, PairWithTimeframe
+from binancebot.exchange.exchange_utils_timeframe import timeframe_to_msecs, timeframe_to_seconds
+
+
+logger = logging.getLogger(__name__)
+
+# Monthly and yearly candles have no fixed length
+_MAX_FIXED_TIMEFRAME_SEC = 43200 * 60
+
+
+class CandleRingBuffer:
+    """
+    Fixed capacity, gap free OHLCV buffer of one pair / timeframe / candle type.
+    Updated and extended candles are written in place, with the same results as
+    concatenating and cleaning (converter.clean_ohlcv_dataframe) the cached dataframe.
+    The dataframe is only built when requested, and reused until the next update.
+    """
+
+    def __init__(self, dates: np.ndarray, values: np.ndarray, step: int, max_length: int) -> None:
+        """
+        :param dates: Candle open times in ms, ascending and evenly spaced by step
+        :param values: OHLCV values, shape (5, len(dates))
+        :param step: Candle length in ms
+        :param max_length: Candles to keep - older candles are dropped on update
+        """
+        length = len(dates)
+        capacity = max(length, max_length)
+        self._step = step
+        self._max_length = max_length
+        self._dates = np.zeros(capacity, dtype=np.int64)
+        self._values = np.zeros((5, capacity), dtype=np.float64)
+        self._dates[:length] = dates
+        self._values[:, :length] = values
+        self._head = 0
+        self._length = length
+        self._df: DataFrame | None = None
+
+    @classmethod
+    def from_dataframe(
+        cls, df: DataFrame, timeframe: str, max_length: int
+    ) -> "CandleRingBuffer | None":
+        """
+        Create a buffer from a cleaned OHLCV dataframe.
+        :return: Buffer, or None if the dataframe can't be represented (empty or with gaps)
+        """
+        if df.empty or timeframe_to_seconds(timeframe) >= _MAX_FIXED_TIMEFRAME_SEC:
+            return None
+        step = timeframe_to_msecs(timeframe)
+        dates = df["date"].to_numpy(dtype="datetime64[ms]").astype(np.int64)
+        if len(dates) > 1 and (np.diff(dates) != step).any():
+            return None
+        values = df[DEFAULT_DATAFRAME_COLUMNS[1:]].to_numpy(dtype=np.float64).T
+        buffer = cls(dates, values, step, max_length)
+        buffer._df = df
+        return buffer
+
+    def _positions(self, offset: int, count: int) -> np.ndarray:
+        return (self._head + offset + np.arange(count)) % len(self._dates)
+
+    def update(self, ticks: list[list], drop_incomplete: bool) -> bool:
+        """
+        Apply candles as returned by the exchange.
+        :param ticks: OHLCV rows (as returned by ccxt.fetch_ohlcv)
+        :param drop_incomplete: Ignore the last candle
+        :return: False if the candles can't be applied in place - the buffer is unchanged then.
+        """
+        rows = np.asarray(ticks, dtype=np.float64)
+        if rows.size == 0:
+            rows = rows.reshape(0, 6)
+        if rows.ndim != 2 or rows.shape[1] != 6:
+            return False
+        if drop_incomplete and len(rows):
+            rows = rows[rows[:, 0] != rows[-1, 0]]
+        dates = rows[:, 0].astype(np.int64)
+        if np.isnan(rows).any() or (np.diff(dates) <= 0).any():
+            # Missing values and unsorted or duplicate candles need the full cleanup
+            return False
+
+        first = self._dates[self._head]
+        last = self._dates[(self._head + self._length - 1) % len(self._dates)]
+        if len(dates) and (dates[0] < first or ((dates - first) % self._step).any()):
+            return False
+
+        values = rows[:, 1:].T
+        known = dates <= last
+        if known.any():
+            # Same aggregation as clean_ohlcv_dataframe: keep open, max high / volume, min low
+            pos = (self._head + (dates[known] - first) // self._step) % len(self._dates)
+            current = self._values[:, pos]
+            update = values[:, known]
+            current[1] = np.maximum(current[1], update[1])
+            current[2] = np.minimum(current[2], update[2])
+            current[3] = update[3]
+            current[4] = np.maximum(current[4], update[4])
+            self._values[:, pos] = current
+
+        if not known.all():
+            self._append(dates[~known], values[:, ~known], last)
+
+        if self._length > self._max_length:
+            # Age out old candles
+            self._head = (self._head + self._length - self._max_length) % len(self._dates)
+            self._length = self._max_length
+        self._df = None
+        return True
+
+    def _append(self, dates: np.ndarray, values: np.ndarray, last: int) -> None:
+        """
+        Append new candles, filling gaps like converter.ohlcv_fill_up_missing_data.
+        """
+        count = int((dates[-1] - last) // self._step)
+        present = (dates - last) // self._step - 1
+        close = np.full(count, np.nan)
+        close[present] = values[3]
+        # Forward fill close - starting with the last cached close
+        source = np.where(np.isnan(close), -1, np.arange(count))
+        source = np.maximum.accumulate(source)
+        prev_close = self._values[3, (self._head + self._length - 1) % len(self._dates)]
+        filled = np.where(source >= 0, close[np.maximum(source, 0)], prev_close)
+        block = np.empty((5, count), dtype=np.float64)
+        block[:4] = filled
+        block[4] = 0.0
+        block[:, present] = values
+        block_dates = last + self._step * np.arange(1, count + 1, dtype=np.int64)
+
+        capacity = len(self._dates)
+        if count >= capacity:
+            self._dates[:] = block_dates[-capacity:]
+            self._values[:] = block[:, -capacity:]
+            self._head = 0
+            self._length = capacity
+            return
+        pos = self._positions(self._length, count)
+        self._dates[pos] = block_dates
+        self._values[:, pos] = block
+        self._length += count
+        if self._length > capacity:
+            self._head = (self._head + self._length - capacity) % capacity
+            self._length = capacity
+
+    def to_dataframe(self) -> DataFrame:
+        if self._df is None:
+            pos = self._positions(0, self._length)
+            values = self._values[:, pos]
+            data = {"date": to_datetime(self._dates[pos], unit="ms", utc=True)}
+            data.update(zip(DEFAULT_DATAFRAME_COLUMNS[1:], values, strict=True))
+            self._df = DataFrame(data)
+        return self._df
+
+
+class CandleCache(MutableMapping[PairWithTimeframe, DataFrame]):
+    """
+    Candle dataframes per (pair, timeframe, candle_type).
+    Candles are held in ring buffers where possible, so live updates don't rebuild
+    the whole dataframe. Dataframes which can't be buffered are stored as they are.
+    """
+
+    def __init__(self) -> None:
+        self._data: dict[PairWithTimeframe, CandleRingBuffer | DataFrame] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, key: PairWithTimeframe) -> DataFrame:
+        entry = self._data[key]
+        if isinstance(entry, CandleRingBuffer):
+            with self._lock:
+                return entry.to_dataframe()
+        return entry
+
+    def __setitem__(self, key: PairWithTimeframe, df: DataFrame) -> None:
+        self.store(key, df, len(df))
+
+    def __delitem__(self, key: PairWithTimeframe) -> None:
+        del self._data[key]
+
+    def __iter__(self) -> Iterator[PairWithTimeframe]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def store(self, key: PairWithTimeframe, df: DataFrame, max_length: int) -> None:
+        """
+        Replace the candles of key.
+        :param max_length: Candles to keep on later updates
+        """
+        buffer = CandleRingBuffer.from_dataframe(df, key[1], max_length)
+        self._data[key] = buffer if buffer is not None else df
+
+    def update(self, key: PairWithTimeframe, ticks: list[list], drop_incomplete: bool) -> bool:
+        """
+        Apply new candles to the cached candles of key, in place.
+        :return: False if the candles could not be applied in place.
+        """
+        entry = self._data.get(key)
+        if not isinstance(entry, CandleRingBuffer):
+            return False
+        with self._lock:
+            return entry.update(ticks, drop_incomplete)
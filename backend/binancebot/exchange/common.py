@@ -34,6 +34,14 @@ def _get_logging_mixin():
 # Functions are always called RETRY_COUNT + 1 times (for the original call)
 API_RETRY_COUNT = 4
 API_FETCH_ORDER_RETRY_COUNT = 5
+# Seconds between full open order reconciliations while order updates are streamed
+OPEN_ORDERS_RECONCILE_INTERVAL = 60
+# Format version of the markets snapshot on disk
+MARKETS_SNAPSHOT_VERSION = 1
+# Maximum age (ms) of the markets snapshot used to start trading (refreshed right after)
+MARKETS_SNAPSHOT_MAX_AGE = 24 * 60 * 60 * 1000
+# Order book depth dry-run orders are filled against
+DRY_RUN_ORDER_BOOK_DEPTH = 20
 
 BAD_EXCHANGES = {
     "bitmex": "Various reasons.",
@@ -11,7 +11,8 @@ from collections.abc import Coroutine, Generator
 from copy import deepcopy
 from datetime import UTC, datetime, timedelta
 from math import floor, isnan
-from threading import Lock
+from pathlib import Path
+from threading import Lock, RLock, Thread
 from typing import Any, Literal, TypeGuard, TypeVar
 
 import ccxt
@@ -63,8 +64,13 @@ from binancebot.exceptions import (
     RetryableOrderError,
     TemporaryError,
 )
+from binancebot.exchange.candle_cache import CandleCache
 from binancebot.exchange.common import (
     API_FETCH_ORDER_RETRY_COUNT,
+    DRY_RUN_ORDER_BOOK_DEPTH,
+    MARKETS_SNAPSHOT_MAX_AGE,
+    MARKETS_SNAPSHOT_VERSION,
+    OPEN_ORDERS_RECONCILE_INTERVAL,
     retrier,
     retrier_async,
 )
@@ -100,6 +106,7 @@ from binancebot.exchange.exchange_utils_timeframe import (
     timeframe_to_seconds,
 )
 from binancebot.exchange.exchange_ws import ExchangeWS
+from binancebot.exchange.rate_limiter import get_rate_limiter
 from binancebot.misc import (
     chunks,
     deep_merge_dicts,
@@ -110,6 +117,7 @@ from binancebot.misc import (
 from binancebot.util import dt_from_ts, dt_now
 from binancebot.util.datetime_helpers import dt_humanize_delta, dt_ts, format_ms_time
 from binancebot.util.periodic_cache import PeriodicCache
+from binancebot.util.single_flight import SingleFlight
 
 
 logger = logging.getLogger(__name__)
@@ -160,6 +168,15 @@ class Exchange:
         "needs_trading_fees": False,  # use fetch_trading_fees to cache fees
         "order_props_in_contracts": ["amount", "filled", "remaining"],
         "fetch_orders_limit_minutes": None,  # "fetch_orders" is not time-limited by default
+        # Request weights, to pick between per-order and batched open order polling.
+        # "fetch_open_orders_all" (all symbols in one call) is None if not supported.
+        "order_fetch_weights": {
+            "fetch_order": 1,
+            "fetch_open_orders": 1,
+            "fetch_open_orders_all": None,
+        },
+        # Weight based rate limits (see exchange/rate_limiter.py) - ccxt's throttling if empty
+        "request_weight_limits": [],
         # Override createMarketBuyOrderRequiresPrice where ccxt has it wrong
         "marketOrderRequiresPrice": False,
         "exchange_has_overrides": {},  # Dictionary overriding ccxt's "has".
@@ -227,6 +244,10 @@ class Exchange:
         self._pairs_last_refresh_time: dict[PairWithTimeframe, int] = {}
         # Timestamp of last markets refresh
         self._last_markets_refresh: int = 0
+        # Held while markets are reloaded (possibly in the background after startup)
+        self._markets_lock = RLock()
+        # Exchange instance providing markets and market data caches (multi-account mode)
+        self._market_data_source: Exchange | None = None
 
         self._cache_lock = Lock()
         # Cache for 10 minutes ...
@@ -237,9 +258,12 @@ class Exchange:
         # Shouldn't be too high either, as it'll freeze UI updates in case of open orders.
         self._exit_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
         self._entry_rate_cache: TTLCache = TTLCache(maxsize=100, ttl=300)
+        # Concurrent identical requests (bot loop / API threads) share one exchange call
+        self._single_flight = SingleFlight()
+        self._coalesce_max_age: float = exchange_conf.get("coalesce_max_age", 1)
 
         # Holds candles
-        self._klines: dict[PairWithTimeframe, DataFrame] = {}
+        self._klines = CandleCache()
         self._expiring_candle_cache: dict[tuple[str, int], PeriodicCache] = {}
 
         # Holds public_trades
@@ -248,6 +272,11 @@ class Exchange:
         # Holds all open sell orders for dry_run
         self._dry_run_open_orders: dict[str, Any] = {}
 
+        # Last open orders snapshot (by order id), the pairs it covers and its time (ms)
+        self._open_orders_snapshot: dict[str, CcxtOrder] = {}
+        self._open_orders_snapshot_pairs: set[str] = set()
+        self._open_orders_snapshot_time: int = 0
+
         if config["dry_run"]:
             logger.info("Instance is running with dry_run enabled")
         logger.info(f"Using CCXT {ccxt.__version__}")
@@ -406,8 +435,19 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(f"Initialization of ccxt failed. Reason: {e}") from e
 
+        self.install_rate_limiter(api)
         return api
 
+    def install_rate_limiter(self, api: ccxt.Exchange) -> None:
+        """
+        Throttle a ccxt instance of this exchange by request weight, if the exchange
+        defines weight limits. The limiter is shared by all instances of the process.
+        No-op if rate limiting was disabled for the instance.
+        """
+        limits = self._ft_has.get("request_weight_limits")
+        if limits and api.enableRateLimit:
+            get_rate_limiter(api.id, limits).install(api)
+
     @property
     def _ccxt_config(self) -> dict:
         # Parameters to add directly to ccxt sync/async initialization.
@@ -687,19 +727,169 @@ class Exchange:
             logger.warning("Could not load markets. Reason: %s", e)
             raise TemporaryError from e
 
-    def reload_markets(self, force: bool = False, *, load_leverage_tiers: bool = True) -> None:
+    def attach_market_data(self, source: "Exchange") -> None:
         """
-        Reload / Initialize markets both sync and async if refresh interval has passed
+        Share markets and public market data caches with another exchange instance.
+        Used to run additional trading accounts against the market data of the main account,
+        so candles, tickers and markets are only downloaded once.
+        Both instances must use the same exchange and trading mode.
+        :param source: Exchange instance owning the market data
+        """
+        if source.id != self.id or source.trading_mode != self.trading_mode:
+            raise OperationalException(
+                "Market data can only be shared between instances of the same exchange "
+                "and trading mode."
+            )
+        self._market_data_source = source
+        self._klines = source._klines
+        self._expiring_candle_cache = source._expiring_candle_cache
+        self._trades = source._trades
+        self._pairs_last_refresh_time = source._pairs_last_refresh_time
+        self._fetch_tickers_cache = source._fetch_tickers_cache
+        self._entry_rate_cache = source._entry_rate_cache
+        self._exit_rate_cache = source._exit_rate_cache
+        self._cache_lock = source._cache_lock
+        self._sync_markets_from_source()
+
+    def _sync_markets_from_source(self) -> None:
+        """
+        Take over markets (and related state) from the market data source.
+        """
+        source = self._market_data_source
+        if source is None or source._last_markets_refresh <= self._last_markets_refresh:
+            return
+        self._markets = source._markets
+        self._api.set_markets_from_exchange(source._api_async)
+        self._api.options = source._api.options
+        self._api_async.set_markets_from_exchange(source._api_async)
+        self._api_async.options = source._api.options
+        if self._exchange_ws:
+            self._ws_async.set_markets_from_exchange(source._api_async)
+            self._ws_async.options = source._api.options
+        self._trading_fees = source._trading_fees
+        self._leverage_tiers = source._leverage_tiers
+        self._last_markets_refresh = source._last_markets_refresh
 
+    def _set_markets(self, markets: dict[str, Any], currencies: dict[str, Any] | None) -> None:
         """
-        # Check whether markets have to be reloaded
-        is_initial = self._last_markets_refresh == 0
-        if (
-            not force
-            and self._last_markets_refresh > 0
-            and (self._last_markets_refresh + self.markets_refresh_interval > dt_ts())
-        ):
+        Assign markets to the sync, async and websocket ccxt instances.
+        """
+        self._api_async.set_markets(markets, currencies)
+        self._markets = self._api_async.markets
+        self._api.set_markets_from_exchange(self._api_async)
+        self._api.options = self._api_async.options
+        if self._exchange_ws:
+            self._ws_async.set_markets_from_exchange(self._api_async)
+            self._ws_async.options = self._api.options
+
+    @property
+    def _markets_snapshot_file(self) -> Path | None:
+        if not self._config.get("datadir"):
             return None
+        return Path(self._config["datadir"]) / f"markets_{self.id}_{self.trading_mode.value}.json"
+
+    def cache_markets(self) -> None:
+        """
+        Store the loaded markets on disk, for a fast start of the next instance.
+        """
+        if (filename := self._markets_snapshot_file) is None:
+            return
+        data = {
+            "version": MARKETS_SNAPSHOT_VERSION,
+            "ccxt_version": ccxt.__version__,
+            "updated": self._last_markets_refresh,
+            "markets": self._markets,
+            "currencies": self._api_async.currencies,
+        }
+        try:
+            filename.parent.mkdir(parents=True, exist_ok=True)
+            # Replace atomically - other processes may be reading the snapshot
+            tmp_file = filename.with_name(f"{filename.name}.tmp")
+            file_dump_json(tmp_file, data, log=False)
+            tmp_file.replace(filename)
+        except OSError as e:
+            logger.warning(f"Could not store markets snapshot: {e}")
+
+    def load_cached_markets(self, max_age: int) -> bool:
+        """
+        Load markets from the snapshot on disk.
+        Snapshots of another format or ccxt version are ignored.
+        :param max_age: Maximum age of the snapshot in ms
+        :return: True if markets were loaded
+        """
+        filename = self._markets_snapshot_file
+        if filename is None or not filename.is_file():
+            return False
+        try:
+            data = file_load_json(filename)
+            if (
+                data.get("version") != MARKETS_SNAPSHOT_VERSION
+                or data.get("ccxt_version") != ccxt.__version__
+            ):
+                logger.info("Markets snapshot was created by another version. Ignoring it.")
+                return False
+            if data["updated"] < dt_ts() - max_age or not data["markets"]:
+                logger.info("Markets snapshot is outdated. Ignoring it.")
+                return False
+            self._set_markets(data["markets"], data.get("currencies"))
+            self._last_markets_refresh = data["updated"]
+        except Exception:
+            logger.exception("Error loading markets snapshot. Reloading markets.")
+            return False
+        logger.info(
+            f"Loaded {len(self._markets)} markets from snapshot "
+            f"({dt_humanize_delta(dt_from_ts(data['updated']))})."
+        )
+        return True
+
+    def _after_markets_load(self, is_initial: bool, load_leverage_tiers: bool) -> None:
+        if is_initial and self._ft_has["needs_trading_fees"]:
+            self._trading_fees = self.fetch_trading_fees()
+
+        if load_leverage_tiers and self.trading_mode == TradingMode.FUTURES:
+            self.fill_leverage_tiers()
+
+    def reload_markets(self, force: bool = False, *, load_leverage_tiers: bool = True) -> None:
+        """
+        Reload / Initialize markets both sync and async if refresh interval has passed
+        The initial load uses the markets snapshot on disk if it's recent enough -
+        trading modes then refresh markets in the background.
+        """
+        if self._market_data_source is not None:
+            # Markets are refreshed by the owning instance
+            self._sync_markets_from_source()
+            return
+        # A forced reload waits for a running reload, scheduled reloads skip
+        if not self._markets_lock.acquire(blocking=force):
+            return
+        try:
+            # Check whether markets have to be reloaded
+            is_initial = self._last_markets_refresh == 0
+            if (
+                not force
+                and self._last_markets_refresh > 0
+                and (self._last_markets_refresh + self.markets_refresh_interval > dt_ts())
+            ):
+                return
+            trade_mode = self._config.get("runmode") in TRADE_MODES
+            if is_initial and self.load_cached_markets(
+                MARKETS_SNAPSHOT_MAX_AGE if trade_mode else self.markets_refresh_interval
+            ):
+                self._after_markets_load(is_initial, load_leverage_tiers)
+                if trade_mode:
+                    Thread(
+                        name="markets_refresh",
+                        target=self.reload_markets,
+                        args=(True,),
+                        kwargs={"load_leverage_tiers": load_leverage_tiers},
+                        daemon=True,
+                    ).start()
+                return
+            self._reload_markets(is_initial, force, load_leverage_tiers)
+        finally:
+            self._markets_lock.release()
+
+    def _reload_markets(self, is_initial: bool, force: bool, load_leverage_tiers: bool) -> None:
         logger.debug("Performing scheduled market reload..")
         try:
             # on initial load, we retry 3 times to ensure we get the markets
@@ -716,12 +906,9 @@ class Exchange:
                 self._ws_async.set_markets_from_exchange(self._api_async)
                 self._ws_async.options = self._api.options
             self._last_markets_refresh = dt_ts()
+            self.cache_markets()
 
-            if is_initial and self._ft_has["needs_trading_fees"]:
-                self._trading_fees = self.fetch_trading_fees()
-
-            if load_leverage_tiers and self.trading_mode == TradingMode.FUTURES:
-                self.fill_leverage_tiers()
+            self._after_markets_load(is_initial, load_leverage_tiers)
         except (ccxt.BaseError, TemporaryError):
             logger.exception("Could not load markets.")
 
@@ -1159,7 +1346,7 @@ class Exchange:
             dry_order["ft_order_type"] = "stoploss"
         orderbook: OrderBook | None = None
         if self.exchange_has("fetchL2OrderBook"):
-            orderbook = self.fetch_l2_order_book(pair, 20)
+            orderbook = self.fetch_l2_order_book(pair, DRY_RUN_ORDER_BOOK_DEPTH)
         if ordertype == "limit" and orderbook:
             # Allow a 1% price difference
             allowed_diff = 0.01
@@ -1219,7 +1406,7 @@ class Exchange:
         """
         if self.exchange_has("fetchL2OrderBook"):
             if not orderbook:
-                orderbook = self.fetch_l2_order_book(pair, 20)
+                orderbook = self.fetch_l2_order_book(pair, DRY_RUN_ORDER_BOOK_DEPTH)
             ob_type: OBLiteral = "asks" if side == "buy" else "bids"
             slippage = 0.05
             max_slippage_val = rate * ((1 + slippage) if side == "buy" else (1 - slippage))
@@ -1281,51 +1468,112 @@ class Exchange:
             pass
         return False
 
+    @staticmethod
+    def _is_pending_dry_limit_order(order: CcxtOrder) -> bool:
+        return (
+            order["status"] != "closed"
+            and order["type"] in ["limit"]
+            and not order.get("ft_order_type")
+        )
+
+    def _set_dry_order_filled(
+        self, pair: str, order: CcxtOrder, taker_or_maker: MakerTaker
+    ) -> None:
+        order.update(
+            {
+                "status": "closed",
+                "filled": order["amount"],
+                "remaining": 0,
+            }
+        )
+        self.add_dry_order_fee(pair, order, taker_or_maker)
+
     def check_dry_limit_order_filled(
         self, order: CcxtOrder, immediate: bool = False, orderbook: OrderBook | None = None
     ) -> CcxtOrder:
         """
         Check dry-run limit order fill and update fee (if it filled).
         """
-        if (
-            order["status"] != "closed"
-            and order["type"] in ["limit"]
-            and not order.get("ft_order_type")
-        ):
+        if self._is_pending_dry_limit_order(order):
             pair = order["symbol"]
             if self._dry_is_price_crossed(pair, order["side"], order["price"], orderbook):
-                order.update(
-                    {
-                        "status": "closed",
-                        "filled": order["amount"],
-                        "remaining": 0,
-                    }
-                )
-
-                self.add_dry_order_fee(
-                    pair,
-                    order,
-                    "taker" if immediate else "maker",
-                )
+                self._set_dry_order_filled(pair, order, "taker" if immediate else "maker")
 
         return order
 
-    def fetch_dry_run_order(self, order_id: str) -> CcxtOrder:
+    def fill_dry_run_orders(
+        self, pair: str, orders: list[CcxtOrder], orderbook: OrderBook | None
+    ) -> None:
         """
-        Return dry-run order
-        Only call if running in dry-run mode.
+        Fill the pending dry-run limit orders of one pair against one order book snapshot.
+        Orders are matched in price priority, each consuming the book volume at the prices
+        it crosses. Orders only fill once their full amount is covered by crossed volume -
+        the first one that isn't stays open, as do all orders queued behind it.
+        :param orderbook: Order book of pair - None if the exchange doesn't provide order books
+        """
+        pending = [order for order in orders if self._is_pending_dry_limit_order(order)]
+        if orderbook is None:
+            for order in pending:
+                self.check_dry_limit_order_filled(order)
+            return
+
+        for side, ob_type in (("buy", "asks"), ("sell", "bids")):
+            levels = [[entry[0], entry[1]] for entry in orderbook[ob_type]]
+            level = 0
+            for order in sorted(
+                (order for order in pending if order["side"] == side),
+                key=lambda order: order["price"],
+                reverse=side == "buy",
+            ):
+                if level >= len(levels) or not self._limit_crosses(
+                    side, order["price"], levels[level][0]
+                ):
+                    # Orders with worse prices can't fill either
+                    break
+                remaining = order["amount"]
+                while (
+                    remaining > 0
+                    and level < len(levels)
+                    and self._limit_crosses(side, order["price"], levels[level][0])
+                ):
+                    consumed = min(remaining, levels[level][1])
+                    levels[level][1] -= consumed
+                    remaining -= consumed
+                    if levels[level][1] <= 0:
+                        level += 1
+                if remaining > 0:
+                    # Not enough crossed volume left - stays open until a later snapshot
+                    break
+                self._set_dry_order_filled(pair, order, "maker")
+
+    @staticmethod
+    def _limit_crosses(side: str, limit: float, book_price: float) -> bool:
+        return limit >= book_price if side == "buy" else limit <= book_price
+
+    def _dry_run_order_book(self, pair: str) -> OrderBook | None:
+        """
+        Order book snapshot to fill dry-run orders against - streamed if available.
+        None if the exchange doesn't provide order books.
+        """
+        if not self.exchange_has("fetchL2OrderBook"):
+            return None
+        return self._get_streamed_order_book(
+            pair, DRY_RUN_ORDER_BOOK_DEPTH
+        ) or self.fetch_l2_order_book(pair, DRY_RUN_ORDER_BOOK_DEPTH)
+
+    def _get_dry_run_order(self, order_id: str) -> CcxtOrder:
+        """
+        Dry-run order from memory - or from the database (e.g. after a restart).
+        :raises InvalidOrderException: If the order is unknown
         """
         try:
-            order = self._dry_run_open_orders[order_id]
-            order = self.check_dry_limit_order_filled(order)
-            return order
+            return self._dry_run_open_orders[order_id]
         except KeyError as e:
             from binancebot.persistence import Order
 
             order_obj = Order.order_by_id(order_id)
             if order_obj:
                 order = order_obj.to_ccxt_object(self._ft_has["stop_price_prop"])
-                order = self.check_dry_limit_order_filled(order)
                 self._dry_run_open_orders[order_id] = order
                 return order
             # Gracefully handle errors with dry-run orders.
@@ -1333,6 +1581,37 @@ class Exchange:
                 f"Tried to get an invalid dry-run-order (id: {order_id}). Message: {e}"
             ) from e
 
+    def fetch_dry_run_order(self, order_id: str) -> CcxtOrder:
+        """
+        Return dry-run order
+        Only call if running in dry-run mode.
+        """
+        return self.check_dry_limit_order_filled(self._get_dry_run_order(order_id))
+
+    def _fetch_dry_run_orders_by_id(
+        self, pair_orders: dict[str, list[str]]
+    ) -> dict[str, CcxtOrder]:
+        """
+        Dry-run counterpart of fetch_open_orders_by_id - fills the pending orders of each pair
+        against one order book snapshot, instead of one order book request per order.
+        """
+        result: dict[str, CcxtOrder] = {}
+        for pair, order_ids in pair_orders.items():
+            orders = []
+            for order_id in order_ids:
+                try:
+                    orders.append(self._get_dry_run_order(order_id))
+                except InvalidOrderException:
+                    continue
+            if any(self._is_pending_dry_limit_order(order) for order in orders):
+                try:
+                    self.fill_dry_run_orders(pair, orders, self._dry_run_order_book(pair))
+                except (TemporaryError, OperationalException) as e:
+                    # Still open - checked again with the next iteration
+                    logger.warning(f"Could not check dry-run orders of {pair} for fills. {e}")
+            result.update((order["id"], order) for order in orders)
+        return result
+
     # Order handling
 
     def _lev_prep(self, pair: str, leverage: float, side: BuySell, accept_fail: bool = False):
@@ -1399,6 +1678,7 @@ class Exchange:
                 rate_for_order,
                 params,
             )
+            self._single_flight.invalidate("fetch_balance")
             if order.get("status") is None:
                 # Map empty status to open.
                 order["status"] = "open"
@@ -1555,6 +1835,7 @@ class Exchange:
                 price=limit_rate,
                 params=params,
             )
+            self._single_flight.invalidate("fetch_balance")
             self._log_exchange_response("create_stoploss_order", order)
             order = self._order_contracts_to_amount(order)
             logger.info(
@@ -1690,6 +1971,7 @@ class Exchange:
             params = {}
         try:
             order = self._api.cancel_order(order_id, pair, params=params)
+            self._single_flight.invalidate("fetch_balance")
             self._log_exchange_response("cancel_order", order)
             order = self._order_contracts_to_amount(order)
             return order
@@ -1768,15 +2050,26 @@ class Exchange:
 
         return order
 
+    def coalescing_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Hit counts of coalesced exchange requests, per request type.
+        """
+        return self._single_flight.stats()
+
     @retrier
     def get_balances(self) -> CcxtBalances:
-        try:
+        def fetch_balance() -> CcxtBalances:
             balances = self._api.fetch_balance()
             # Remove additional info from ccxt results
             balances.pop("info", None)
             balances.pop("free", None)
             balances.pop("total", None)
             balances.pop("used", None)
+            return balances
+
+        try:
+            # Only concurrent calls are shared - balances change with every order
+            balances = self._single_flight.do("fetch_balance", fetch_balance)
 
             self._log_exchange_response("fetch_balances", balances)
             return balances
@@ -1881,6 +2174,103 @@ class Exchange:
         else:
             return self._fetch_orders(pair, since, params=params)
 
+    @retrier
+    def _fetch_open_orders(self, pair: str | None) -> list[CcxtOrder]:
+        """
+        Fetch open orders of one pair, or of all pairs if pair is None.
+        """
+        try:
+            orders: list[CcxtOrder] = self._api.fetch_open_orders(pair)
+            self._log_exchange_response("fetch_open_orders", orders)
+            return [self._order_contracts_to_amount(o) for o in orders]
+        except ccxt.DDoSProtection as e:
+            raise DDosProtection(e) from e
+        except (ccxt.OperationFailed, ccxt.ExchangeError) as e:
+            raise TemporaryError(
+                f"Could not fetch open orders due to {e.__class__.__name__}. Message: {e}"
+            ) from e
+        except ccxt.BaseError as e:
+            raise OperationalException(e) from e
+
+    def _refresh_open_orders_snapshot(self, pair_orders: dict[str, int], complete: bool) -> None:
+        """
+        Fetch open orders with the cheapest combination of batched requests.
+        Pairs where fetching each order individually is cheaper are skipped,
+        unless complete is set.
+        :param pair_orders: Number of open orders per pair
+        :param complete: Cover all pairs
+        """
+        weights = self._ft_has["order_fetch_weights"]
+        batched_cost = {
+            pair: min(count * weights["fetch_order"], weights["fetch_open_orders"])
+            for pair, count in pair_orders.items()
+        }
+        all_cost = weights.get("fetch_open_orders_all")
+        snapshot_time = dt_ts()
+        if all_cost is not None and (
+            all_cost < sum(batched_cost.values())
+            or (complete and all_cost < len(pair_orders) * weights["fetch_open_orders"])
+        ):
+            orders = self._fetch_open_orders(None)
+            pairs = set(pair_orders)
+        else:
+            pairs = {
+                pair
+                for pair, count in pair_orders.items()
+                if complete or weights["fetch_open_orders"] < count * weights["fetch_order"]
+            }
+            orders = [order for pair in sorted(pairs) for order in self._fetch_open_orders(pair)]
+        self._open_orders_snapshot = {order["id"]: order for order in orders}
+        self._open_orders_snapshot_pairs = pairs
+        self._open_orders_snapshot_time = snapshot_time
+
+    def fetch_open_orders_by_id(self, pair_orders: dict[str, list[str]]) -> dict[str, CcxtOrder]:
+        """
+        Current state of open orders, with fewer requests than calling fetch_order per order.
+        Uses batched open order requests - and, where available, the account's order stream
+        with a full reconciliation every OPEN_ORDERS_RECONCILE_INTERVAL seconds.
+        Orders not contained in the result (no longer open, or not covered by a batched request)
+        have to be fetched with fetch_order.
+        In dry-run, pending orders are filled against one order book snapshot per pair.
+        :param pair_orders: Order ids per pair
+        :return: dict of order id -> order
+        """
+        if self._config["dry_run"]:
+            return self._fetch_dry_run_orders_by_id(pair_orders)
+        if not pair_orders or not self.exchange_has("fetchOpenOrders"):
+            return {}
+        stream = self._exchange_ws if self.exchange_has("watchOrders") else None
+        if stream:
+            stream.schedule_orders()
+        wanted = {order_id for order_ids in pair_orders.values() for order_id in order_ids}
+        try:
+            updates = stream.orders_since(self._open_orders_snapshot_time) if stream else None
+            if (
+                updates is None
+                or dt_ts() - self._open_orders_snapshot_time
+                > OPEN_ORDERS_RECONCILE_INTERVAL * 1000
+                or not self._open_orders_snapshot_pairs.issuperset(pair_orders)
+            ):
+                self._refresh_open_orders_snapshot(
+                    {pair: len(order_ids) for pair, order_ids in pair_orders.items()},
+                    complete=stream is not None,
+                )
+                updates = {}
+        except (TemporaryError, OperationalException) as e:
+            logger.warning(f"Could not fetch open orders, querying orders one by one. {e}")
+            self._open_orders_snapshot_pairs = set()
+            return {}
+
+        result = {
+            order_id: order
+            for order_id, order in self._open_orders_snapshot.items()
+            if order_id in wanted
+        }
+        for order_id, order in updates.items():
+            if order_id in wanted:
+                result[order_id] = self._order_contracts_to_amount(order)
+        return result
+
     @retrier
     def fetch_trading_fees(self) -> dict[str, Any]:
         """
@@ -1921,7 +2311,12 @@ class Exchange:
             if tickers:
                 return tickers
         try:
-            tickers = self._api.fetch_bids_asks(symbols)
+            tickers = self._single_flight.do(
+                ("fetch_bids_asks", tuple(symbols) if symbols else None),
+                self._api.fetch_bids_asks,
+                symbols,
+                max_age=self._coalesce_max_age,
+            )
             with self._cache_lock:
                 self._fetch_tickers_cache["fetch_bids_asks"] = tickers
             return tickers
@@ -1968,7 +2363,13 @@ class Exchange:
                 TradingMode.FUTURES: "swap",
             }
             params = {"type": market_types.get(market_type, market_type)} if market_type else {}
-            tickers = self._api.fetch_tickers(symbols, params)
+            tickers = self._single_flight.do(
+                ("fetch_tickers", tuple(symbols) if symbols else None, params.get("type")),
+                self._api.fetch_tickers,
+                symbols,
+                params,
+                max_age=self._coalesce_max_age,
+            )
             with self._cache_lock:
                 self._fetch_tickers_cache[cache_key] = tickers
             return tickers
@@ -2046,7 +2447,12 @@ class Exchange:
         try:
             if pair not in self.markets or self.markets[pair].get("active", False) is False:
                 raise ExchangeError(f"Pair {pair} not available")
-            data: Ticker = self._api.fetch_ticker(pair)
+            data: Ticker = self._single_flight.do(
+                ("fetch_ticker", pair),
+                self._api.fetch_ticker,
+                pair,
+                max_age=self._coalesce_max_age,
+            )
             return data
         except ccxt.DDoSProtection as e:
             raise DDosProtection(e) from e
@@ -2131,6 +2537,58 @@ class Exchange:
         except ccxt.BaseError as e:
             raise OperationalException(e) from e
 
+    @property
+    def _price_stream(self) -> ExchangeWS | None:
+        """
+        Websocket with ticker / order book streams - the market data source's for accounts.
+        """
+        if self._market_data_source is not None:
+            return self._market_data_source._exchange_ws
+        return self._exchange_ws
+
+    def schedule_price_streams(self, pairs: list[str]) -> None:
+        """
+        Stream tickers or order books (depending on the pricing configuration) of the
+        given pairs via websocket, so get_rate / get_rates don't need REST calls.
+        """
+        if not self._exchange_ws:
+            return
+        entry_pricing = self._config.get("entry_pricing", {})
+        exit_pricing = self._config.get("exit_pricing", {})
+        use_order_book = [
+            conf.get("use_order_book", False) for conf in (entry_pricing, exit_pricing)
+        ]
+        self._exchange_ws.schedule_price_streams(
+            pairs,
+            tickers=not all(use_order_book) and self.exchange_has("watchTickers"),
+            order_books=any(use_order_book) and self.exchange_has("watchOrderBook"),
+            order_book_depth=max(
+                entry_pricing.get("order_book_top", 1), exit_pricing.get("order_book_top", 1)
+            ),
+        )
+
+    def _get_streamed_ticker(self, pair: str, price_side: BidAsk | None = None) -> Ticker | None:
+        """
+        Fresh ticker from the websocket stream, if it contains the prices needed.
+        """
+        if (stream := self._price_stream) is None or (ticker := stream.ticker(pair)) is None:
+            return None
+        if not ticker.get("last") or not all(
+            ticker.get(side) for side in ((price_side,) if price_side else ("bid", "ask"))
+        ):
+            # e.g. futures ticker streams without bid / ask
+            return None
+        logger.debug(f"Using streamed ticker for {pair}.")
+        return ticker
+
+    def _get_streamed_order_book(self, pair: str, depth: int) -> OrderBook | None:
+        """
+        Fresh order book from the websocket stream.
+        """
+        if (stream := self._price_stream) is None:
+            return None
+        return stream.order_book(pair, depth)
+
     def _get_price_side(self, side: str, is_short: bool, conf_strategy: dict) -> BidAsk:
         price_side = conf_strategy["price_side"]
 
@@ -2187,12 +2645,14 @@ class Exchange:
         if conf_strategy.get("use_order_book", False):
             order_book_top = conf_strategy.get("order_book_top", 1)
             if order_book is None:
-                order_book = self.fetch_l2_order_book(pair, order_book_top)
+                order_book = self._get_streamed_order_book(
+                    pair, order_book_top
+                ) or self.fetch_l2_order_book(pair, order_book_top)
             rate = self._get_rate_from_ob(pair, side, order_book, name, price_side, order_book_top)
         else:
             logger.debug(f"Using Last {price_side.capitalize()} / Last Price")
             if ticker is None:
-                ticker = self.fetch_ticker(pair)
+                ticker = self._get_streamed_ticker(pair, price_side) or self.fetch_ticker(pair)
             rate = self._get_rate_from_ticker(side, ticker, conf_strategy, price_side)
 
         if rate is None:
@@ -2268,10 +2728,12 @@ class Exchange:
             order_book_top = max(
                 entry_pricing.get("order_book_top", 1), exit_pricing.get("order_book_top", 1)
             )
-            order_book = self.fetch_l2_order_book(pair, order_book_top)
+            order_book = self._get_streamed_order_book(
+                pair, order_book_top
+            ) or self.fetch_l2_order_book(pair, order_book_top)
             entry_rate = self.get_rate(pair, refresh, "entry", is_short, order_book=order_book)
         elif not entry_rate:
-            ticker = self.fetch_ticker(pair)
+            ticker = self._get_streamed_ticker(pair) or self.fetch_ticker(pair)
             entry_rate = self.get_rate(pair, refresh, "entry", is_short, ticker=ticker)
         if not exit_rate:
             exit_rate = self.get_rate(
@@ -2705,13 +3167,18 @@ class Exchange:
             idx = -2 if drop_incomplete and len(ticks) > 1 else -1
             self._pairs_last_refresh_time[(pair, timeframe, c_type)] = ticks[idx][0]
         has_cache = cache and (pair, timeframe, c_type) in self._klines
+        if has_cache and self._klines.update((pair, timeframe, c_type), ticks, drop_incomplete):
+            # Applied in place to the cached candles
+            return self._klines[(pair, timeframe, c_type)]
         # in case of existing cache, fill_missing happens after concatenation
         ohlcv_df = ohlcv_to_dataframe(
             ticks, timeframe, pair=pair, fill_missing=not has_cache, drop_incomplete=drop_incomplete
         )
         # keeping parsed dataframe in cache
         if cache:
-            if (pair, timeframe, c_type) in self._klines:
+            candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
+            max_length = candle_limit + self._startup_candle_count
+            if has_cache:
                 old = self._klines[(pair, timeframe, c_type)]
                 # Reassign so we return the updated, combined df
                 ohlcv_df = clean_ohlcv_dataframe(
@@ -2721,13 +3188,10 @@ class Exchange:
                     fill_missing=True,
                     drop_incomplete=False,
                 )
-                candle_limit = self.ohlcv_candle_limit(timeframe, self._config["candle_type_def"])
                 # Age out old candles
-                ohlcv_df = ohlcv_df.tail(candle_limit + self._startup_candle_count)
+                ohlcv_df = ohlcv_df.tail(max_length)
                 ohlcv_df = ohlcv_df.reset_index(drop=True)
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
-            else:
-                self._klines[(pair, timeframe, c_type)] = ohlcv_df
+            self._klines.store((pair, timeframe, c_type), ohlcv_df, max_length)
         return ohlcv_df
 
     def refresh_latest_ohlcv(
@@ -47,6 +47,8 @@ class FtHas(TypedDict, total=False):
     l2_limit_upper: int | None
     # fetch_orders
     fetch_orders_limit_minutes: int | None
+    order_fetch_weights: dict[str, int | None]
+    request_weight_limits: list[dict[str, Any]]
     # Futures
     ccxt_futures_name: str  # usually swap
     mark_ohlcv_price: str
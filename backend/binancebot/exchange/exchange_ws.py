@@ -12,12 +12,19 @@ from binancebot.enums.candletype import CandleType
 from binancebot.exceptions import TemporaryError
 from binancebot.exchange.common import retrier
 from binancebot.exchange.exchange import timeframe_to_seconds
-from binancebot.exchange.exchange_types import OHLCVResponse
+from binancebot.exchange.exchange_types import CcxtOrder, OHLCVResponse, OrderBook, Ticker
 from binancebot.util import dt_ts, format_ms_time, format_ms_time_det
 
 
 logger = logging.getLogger(__name__)
 
+# Ticker / order book snapshots older than this (in ms) are not used for pricing
+PRICE_STREAM_MAX_AGE = 5000
+# Time (ms) after starting the order stream before it's assumed to receive all order updates
+ORDER_STREAM_GRACE = 10000
+# Order updates are kept for this long (ms)
+ORDER_STREAM_RETENTION = 3600 * 1000
+
 
 class ExchangeWS:
     def __init__(self, config: Config, ccxt_object: ccxt.Exchange) -> None:
@@ -29,6 +36,20 @@ class ExchangeWS:
         self._klines_scheduled: set[PairWithTimeframe] = set()
         self.klines_last_refresh: dict[PairWithTimeframe, float] = {}
         self.klines_last_request: dict[PairWithTimeframe, float] = {}
+
+        # Latest ticker / order book per pair, with the time (ms) it was received
+        self._tickers_watching: set[str] = set()
+        self._tickers_task: asyncio.Task | None = None
+        self._order_books_watching: set[str] = set()
+        self._order_books_scheduled: set[str] = set()
+        self._order_book_depth = 1
+        self._tickers: dict[str, tuple[int, Ticker]] = {}
+        self._order_books: dict[str, tuple[int, OrderBook]] = {}
+
+        # Order updates of the account (user data stream), with the time (ms) they were received
+        self._orders_task: asyncio.Task | None = None
+        self._orders_stream_start: int | None = None
+        self._orders: dict[str, tuple[int, CcxtOrder]] = {}
         self._thread = Thread(name="ccxt_ws", target=self._start_forever)
         self._thread.start()
         self.__cleanup_called = False
@@ -44,6 +65,9 @@ class ExchangeWS:
     def cleanup(self) -> None:
         logger.debug("Cleanup called - stopping")
         self._klines_watching.clear()
+        self._tickers_watching.clear()
+        self._order_books_watching.clear()
+        self._orders_stream_start = None
         for task in self._background_tasks:
             task.cancel()
         if hasattr(self, "_loop") and not self._loop.is_closed():
@@ -74,6 +98,10 @@ class ExchangeWS:
             # Clear the cache.
             # Not doing this will cause problems on startup with dynamic pairlists
             self._ccxt_object.ohlcvs.clear()
+            self._tickers.clear()
+            self._order_books.clear()
+            self._orders.clear()
+            self._orders_stream_start = None
         except Exception:
             logger.exception("Exception in _cleanup_async")
         finally:
@@ -225,3 +253,168 @@ class ExchangeWS:
             f"candle_ts={format_ms_time(candle_ts)}, {drop_hint=}"
         )
         return pair, timeframe, candle_type, candles, drop_hint
+
+    def schedule_price_streams(
+        self, pairs: list[str], *, tickers: bool, order_books: bool, order_book_depth: int = 1
+    ) -> None:
+        """
+        Watch tickers and / or order books of the given pairs.
+        Replaces the previous selection - pairs not passed are no longer watched.
+        :param pairs: Pairs to watch (whitelist and pairs with open trades)
+        :param tickers: Watch tickers
+        :param order_books: Watch order books
+        :param order_book_depth: Order book levels to keep
+        """
+        self._order_book_depth = order_book_depth
+        pairs_set = set(pairs)
+        new_tickers = pairs_set if tickers else set()
+        new_order_books = pairs_set if order_books else set()
+        if new_tickers == self._tickers_watching and new_order_books == self._order_books_watching:
+            return
+        if new_tickers != self._tickers_watching:
+            logger.info(f"Watching tickers of {len(new_tickers)} pairs.")
+        self._tickers_watching = new_tickers
+        self._order_books_watching = new_order_books
+        for pair in list(self._tickers):
+            if pair not in new_tickers:
+                self._tickers.pop(pair, None)
+        for pair in list(self._order_books):
+            if pair not in new_order_books:
+                self._order_books.pop(pair, None)
+        asyncio.run_coroutine_threadsafe(self._schedule_price_streams(), loop=self._loop)
+
+    async def _schedule_price_streams(self) -> None:
+        if self._tickers_task is not None:
+            # The symbol list changed - restart with the new list
+            self._tickers_task.cancel()
+            self._tickers_task = None
+        if self._tickers_watching:
+            task = asyncio.create_task(
+                self._continuously_async_watch_tickers(sorted(self._tickers_watching))
+            )
+            self._tickers_task = task
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+        for pair in self._order_books_watching - self._order_books_scheduled:
+            self._order_books_scheduled.add(pair)
+            task = asyncio.create_task(self._continuously_async_watch_order_book(pair))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+    async def _continuously_async_watch_tickers(self, pairs: list[str]) -> None:
+        try:
+            while set(pairs) == self._tickers_watching:
+                tickers = await self._ccxt_object.watch_tickers(pairs)
+                received = dt_ts()
+                for pair, ticker in tickers.items():
+                    if pair in self._tickers_watching:
+                        self._tickers[pair] = (received, ticker)
+        except ccxt.ExchangeClosedByUser:
+            logger.debug("Exchange connection closed by user")
+        except ccxt.BaseError:
+            logger.exception("Exception in continuously_async_watch_tickers")
+        finally:
+            if self._tickers_task is asyncio.current_task():
+                # Stopped unexpectedly - restarted with the next schedule_price_streams call
+                self._tickers_task = None
+                self._tickers_watching = set()
+
+    async def _continuously_async_watch_order_book(self, pair: str) -> None:
+        try:
+            while pair in self._order_books_watching:
+                order_book = await self._ccxt_object.watch_order_book(pair)
+                # Copy the top levels - ccxt keeps updating its order book in place
+                depth = self._order_book_depth
+                self._order_books[pair] = (
+                    dt_ts(),
+                    {
+                        "symbol": pair,
+                        "bids": [tuple(level[:2]) for level in order_book["bids"][:depth]],
+                        "asks": [tuple(level[:2]) for level in order_book["asks"][:depth]],
+                        "timestamp": order_book.get("timestamp"),
+                        "datetime": order_book.get("datetime"),
+                        "nonce": order_book.get("nonce"),
+                    },
+                )
+        except ccxt.ExchangeClosedByUser:
+            logger.debug("Exchange connection closed by user")
+        except ccxt.BaseError:
+            logger.exception(f"Exception in continuously_async_watch_order_book for {pair}")
+        finally:
+            self._order_books_scheduled.discard(pair)
+            self._order_books_watching.discard(pair)
+            self._order_books.pop(pair, None)
+
+    def ticker(self, pair: str) -> Ticker | None:
+        """
+        Latest ticker received for pair, if it's not older than PRICE_STREAM_MAX_AGE.
+        """
+        if (entry := self._tickers.get(pair)) and dt_ts() - entry[0] <= PRICE_STREAM_MAX_AGE:
+            return entry[1]
+        return None
+
+    def order_book(self, pair: str, depth: int) -> OrderBook | None:
+        """
+        Latest order book received for pair, if it's not older than PRICE_STREAM_MAX_AGE
+        and contains at least `depth` levels on both sides.
+        """
+        entry = self._order_books.get(pair)
+        if not entry or dt_ts() - entry[0] > PRICE_STREAM_MAX_AGE:
+            return None
+        order_book = entry[1]
+        if len(order_book["bids"]) < depth or len(order_book["asks"]) < depth:
+            return None
+        return order_book
+
+    def schedule_orders(self) -> None:
+        """
+        Watch order updates of the account. Restarts the stream if it stopped.
+        """
+        if self._orders_task is None:
+            asyncio.run_coroutine_threadsafe(self._schedule_orders(), loop=self._loop)
+
+    async def _schedule_orders(self) -> None:
+        if self._orders_task is not None:
+            return
+        task = asyncio.create_task(self._continuously_async_watch_orders())
+        self._orders_task = task
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _continuously_async_watch_orders(self) -> None:
+        self._orders_stream_start = dt_ts()
+        try:
+            while self._orders_stream_start is not None:
+                orders = await self._ccxt_object.watch_orders()
+                received = dt_ts()
+                for order in orders:
+                    # Copy - ccxt updates cached orders in place
+                    self._orders[order["id"]] = (received, dict(order))
+        except ccxt.ExchangeClosedByUser:
+            logger.debug("Exchange connection closed by user")
+        except ccxt.BaseError:
+            logger.exception("Exception in continuously_async_watch_orders")
+        finally:
+            if self._orders_task is asyncio.current_task():
+                self._orders_task = None
+                self._orders_stream_start = None
+
+    def orders_since(self, since_ms: int) -> dict[str, CcxtOrder] | None:
+        """
+        Order updates received since since_ms, by order id.
+        :return: Order updates, or None if the order stream wasn't established at since_ms -
+            updates may have been missed then.
+        """
+        start = self._orders_stream_start
+        if start is None or start + ORDER_STREAM_GRACE > since_ms:
+            return None
+        now = dt_ts()
+        for order_id, (received, _) in list(self._orders.items()):
+            if now - received > ORDER_STREAM_RETENTION:
+                self._orders.pop(order_id, None)
+        return {
+            order_id: order
+            for order_id, (received, order) in list(self._orders.items())
+            if received >= since_ms
+        }
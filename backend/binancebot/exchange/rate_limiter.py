@@ -0,0 +1,250 @@
+"""
+Request weight based rate limiting of ccxt instances.
+"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from collections.abc import Mapping
+from functools import wraps
+from typing import Any
+
+import ccxt
+
+
+logger = logging.getLogger(__name__)
+
+# Share of the budget kept free for order placement / cancellation
+PRIORITY_RESERVE = 0.1
+# Longest single wait (s) before re-checking the budget
+MAX_WAIT = 1.0
+# Endpoints (ccxt paths) of order placement / cancellation
+ORDER_PATHS = {
+    "order",
+    "order/oco",
+    "orderList/oco",
+    "orderList/oto",
+    "openOrders",
+    "allOpenOrders",
+    "batchOrders",
+}
+
+
+class TokenBucket:
+    """
+    Request weight budget of one rate limit (e.g. 6000 weight per minute).
+    Refills continuously, and follows the used weight reported by the exchange.
+    """
+
+    def __init__(self, limit: int, interval: float = 60) -> None:
+        """
+        :param limit: Weight per interval
+        :param interval: Interval in seconds
+        """
+        self.capacity = float(limit)
+        self.rate = limit / interval
+        self.tokens = self.capacity
+        self.blocked_until = 0.0
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, weight: float, priority: bool) -> float:
+        """
+        Take weight from the budget if available.
+        Regular requests leave PRIORITY_RESERVE of the budget to priority requests.
+        :return: 0 if acquired, otherwise seconds to wait before trying again
+        """
+        now = time.monotonic()
+        if self.blocked_until > now:
+            return self.blocked_until - now
+        self._refill(now)
+        floor = 0.0 if priority else self.capacity * PRIORITY_RESERVE
+        # Requests heavier than the usable budget run once the bucket is full
+        needed = min(weight + floor, self.capacity)
+        if self.tokens >= needed:
+            self.tokens -= weight
+            return 0
+        return (needed - self.tokens) / self.rate
+
+    def used_weight(self, used: float) -> None:
+        """
+        Adapt to the weight used within the current interval, as reported by the exchange.
+        Other clients on the same IP reduce the budget - lower estimates are taken over
+        immediately, higher ones half way to avoid bursts from stale responses.
+        """
+        self._refill(time.monotonic())
+        reported = self.capacity - used
+        if reported < self.tokens:
+            self.tokens = reported
+        else:
+            self.tokens += (reported - self.tokens) / 2
+
+    def block(self, seconds: float) -> None:
+        self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+        self.tokens = min(self.tokens, 0)
+
+
+class WeightRateLimiter:
+    """
+    Weight based rate limiter of one exchange, shared by all ccxt instances (sync, async,
+    websocket and copy trading clients) of the process - limits apply per IP.
+    Replaces ccxt's fixed-delay throttling for the configured APIs.
+    """
+
+    def __init__(self, limits: list[dict[str, Any]]) -> None:
+        """
+        :param limits: Rate limits - dicts with
+            "apis": ccxt API name prefixes (e.g. "fapi"),
+            "limit": weight per minute,
+            "cost_per_weight": ccxt endpoint cost of one weight unit,
+            "header": response header with the used weight
+        """
+        self._lock = threading.Lock()
+        self._limits = limits
+        self._buckets = [TokenBucket(limit["limit"]) for limit in limits]
+
+    def _bucket(self, api: Any) -> tuple[TokenBucket, dict[str, Any]] | None:
+        name = api if isinstance(api, str) else str(api[0]) if api else ""
+        for bucket, limit in zip(self._buckets, self._limits, strict=True):
+            if any(name.startswith(prefix) for prefix in limit["apis"]):
+                return bucket, limit
+        return None
+
+    @staticmethod
+    def is_priority(path: str, method: str) -> bool:
+        return method in ("POST", "DELETE", "PUT") and path in ORDER_PATHS
+
+    def limits(self, api: Any) -> bool:
+        """
+        Whether requests of this ccxt API are limited by this limiter.
+        """
+        return self._bucket(api) is not None
+
+    def _try_acquire(self, api: Any, method: str, path: str, cost: float) -> float:
+        if (entry := self._bucket(api)) is None:
+            return 0
+        bucket, limit = entry
+        weight = cost / limit["cost_per_weight"]
+        with self._lock:
+            return bucket.try_acquire(weight, self.is_priority(path, method))
+
+    def acquire(self, api: Any, method: str, path: str, cost: float) -> None:
+        while (wait := self._try_acquire(api, method, path, cost)) > 0:
+            time.sleep(min(wait, MAX_WAIT))
+
+    async def acquire_async(self, api: Any, method: str, path: str, cost: float) -> None:
+        # Sleeps until the bucket has refilled - there's no event to wait for
+        while (wait := self._try_acquire(api, method, path, cost)) > 0:  # noqa: ASYNC110
+            await asyncio.sleep(min(wait, MAX_WAIT))
+
+    def on_response(self, api: Any, headers: Mapping | None, error: Exception | None) -> None:
+        """
+        Adapt to the response headers of a request - and back off if rate limited.
+        """
+        if (entry := self._bucket(api)) is None:
+            return
+        bucket, limit = entry
+        values = {k.lower(): v for k, v in (headers or {}).items()}
+        with self._lock:
+            if (used := values.get(limit["header"])) is not None:
+                try:
+                    bucket.used_weight(float(used))
+                except ValueError:
+                    pass
+            if isinstance(error, ccxt.DDoSProtection):
+                try:
+                    retry_after = float(values.get("retry-after", 0))
+                except ValueError:
+                    retry_after = 0
+                retry_after = max(retry_after, 60 - time.time() % 60)
+                logger.warning(f"Rate limit hit, pausing requests for {retry_after:.0f}s.")
+                bucket.block(retry_after)
+
+    def install(self, api: ccxt.Exchange) -> None:
+        """
+        Route the requests of a ccxt instance through this limiter.
+        """
+        fetch2 = api.fetch2
+
+        def request_cost(path, api_name, method, params, config) -> float:
+            return api.calculate_rate_limiter_cost(api_name, method, path, params, config)
+
+        if inspect.iscoroutinefunction(fetch2):
+
+            @wraps(fetch2)
+            async def fetch2_async(
+                path,
+                api_name="public",
+                method="GET",
+                params=None,
+                headers=None,
+                body=None,
+                config=None,
+            ):
+                params = {} if params is None else params
+                config = {} if config is None else config
+                cost = request_cost(path, api_name, method, params, config)
+                if self.limits(api_name):
+                    await self.acquire_async(api_name, method, path, cost)
+                else:
+                    await api.throttle(cost)
+                error = None
+                try:
+                    return await fetch2(path, api_name, method, params, headers, body, config)
+                except Exception as e:
+                    error = e
+                    raise
+                finally:
+                    self.on_response(api_name, api.last_response_headers, error)
+
+            api.fetch2 = fetch2_async
+        else:
+
+            @wraps(fetch2)
+            def fetch2_sync(
+                path,
+                api_name="public",
+                method="GET",
+                params=None,
+                headers=None,
+                body=None,
+                config=None,
+            ):
+                params = {} if params is None else params
+                config = {} if config is None else config
+                cost = request_cost(path, api_name, method, params, config)
+                if self.limits(api_name):
+                    self.acquire(api_name, method, path, cost)
+                else:
+                    api.throttle(cost)
+                error = None
+                try:
+                    return fetch2(path, api_name, method, params, headers, body, config)
+                except Exception as e:
+                    error = e
+                    raise
+                finally:
+                    self.on_response(api_name, api.last_response_headers, error)
+
+            api.fetch2 = fetch2_sync
+        # Throttled by the wrapper instead
+        api.enableRateLimit = False
+
+
+_limiters: dict[str, WeightRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(exchange_id: str, limits: list[dict[str, Any]]) -> WeightRateLimiter:
+    """
+    Rate limiter shared by all users of exchange_id in this process.
+    """
+    with _limiters_lock:
+        if exchange_id not in _limiters:
+            _limiters[exchange_id] = WeightRateLimiter(limits)
+        return _limiters[exchange_id]
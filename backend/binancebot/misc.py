@@ -4,15 +4,18 @@ Various tool function for Freqtrade and scripts
 
 import gzip
 import logging
+from base64 import b64decode, b64encode
 from collections.abc import Iterator, Mapping
 from io import StringIO
 from pathlib import Path
 from typing import Any, TextIO
 from urllib.parse import urlparse
 
+import numpy as np
 import pandas as pd
 import rapidjson
 
+from binancebot.constants import DATAFRAME_DELTA_WINDOW
 from binancebot.enums import SignalTagType, SignalType
 
 
@@ -204,6 +207,112 @@ def json_to_dataframe(data: str) -> pd.DataFrame:
     return dataframe
 
 
+def dataframe_to_columns(dataframe: pd.DataFrame) -> dict[str, Any]:
+    """
+    Column-oriented encoding of a DataFrame.
+    Numeric, boolean and date columns are base64 encoded little-endian typed arrays
+    (dates as float64 milliseconds, integers as int32 if their values fit), with a
+    validity bitmap (least significant bit first, as in Arrow) when values are missing -
+    NaN, +/-inf and NaT count as missing. "dtype" keeps the pandas dtype of the column,
+    so columns_to_dataframe can restore it. Other columns are plain lists with None for
+    missing values.
+    :param dataframe: A pandas DataFrame
+    :returns: {"length": rows, "columns": [{"name", "type", "dtype", "data", "validity"}]}
+    """
+    return {
+        "length": len(dataframe),
+        "columns": [
+            _encode_column(str(name), series) for name, series in dataframe.items()
+        ],
+    }
+
+
+def _encode_column(name: str, series: pd.Series) -> dict[str, Any]:
+    valid = series.notna().to_numpy()
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        col_type = "timestamp[ms]"
+        values = series.dt.tz_convert(None) if series.dt.tz is not None else series
+        values = values.to_numpy(dtype="datetime64[ms]").astype(np.int64).astype("<f8")
+    elif pd.api.types.is_bool_dtype(series.dtype):
+        col_type = "bool"
+        values = series.to_numpy(dtype="u1", na_value=0)
+    elif pd.api.types.is_integer_dtype(series.dtype):
+        values = series.to_numpy(dtype=np.int64, na_value=0)
+        if len(values) == 0 or (
+            values.min() >= np.iinfo(np.int32).min and values.max() <= np.iinfo(np.int32).max
+        ):
+            col_type, values = "int32", values.astype("<i4")
+        else:
+            col_type, values = "int64", values.astype("<i8")
+    elif pd.api.types.is_float_dtype(series.dtype):
+        dtype = "<f4" if series.dtype == np.float32 else "<f8"
+        col_type = "float32" if dtype == "<f4" else "float64"
+        values = series.to_numpy(dtype=dtype, na_value=np.nan)
+        valid &= np.isfinite(values)
+    else:
+        return {
+            "name": name,
+            "type": "object",
+            "dtype": str(series.dtype),
+            "data": series.astype(object).where(valid, None).tolist(),
+            "validity": None,
+        }
+    return {
+        "name": name,
+        "type": col_type,
+        "dtype": str(series.dtype),
+        "data": b64encode(np.ascontiguousarray(values).tobytes()).decode(),
+        "validity": None
+        if valid.all()
+        else b64encode(np.packbits(valid, bitorder="little").tobytes()).decode(),
+    }
+
+
+_COLUMN_DTYPES = {
+    "timestamp[ms]": "<f8",
+    "bool": "u1",
+    "int32": "<i4",
+    "int64": "<i8",
+    "float32": "<f4",
+    "float64": "<f8",
+}
+
+
+def columns_to_dataframe(data: dict[str, Any]) -> pd.DataFrame:
+    """
+    Decode a DataFrame encoded by dataframe_to_columns, restoring the dtype of each typed
+    column. Missing values become NaN (NaT for dates, NA for nullable dtypes) - "object"
+    columns stay object.
+    :param data: Column-oriented encoding of a DataFrame
+    :returns: A pandas DataFrame
+    """
+    length = data["length"]
+    columns: dict[str, Any] = {}
+    for column in data["columns"]:
+        col_type = column["type"]
+        if col_type == "object":
+            columns[column["name"]] = pd.Series(column["data"], dtype=object)
+            continue
+        values = np.frombuffer(b64decode(column["data"]), dtype=_COLUMN_DTYPES[col_type])
+        if col_type == "bool":
+            values = values.astype(bool)
+        if column["validity"] is not None:
+            valid = np.unpackbits(
+                np.frombuffer(b64decode(column["validity"]), dtype=np.uint8),
+                count=length,
+                bitorder="little",
+            ).astype(bool)
+            values = np.where(valid, values, np.nan)
+        series = pd.Series(values)
+        dtype = column.get("dtype")
+        if col_type == "timestamp[ms]":
+            series = pd.Series(pd.to_datetime(values, unit="ms", utc=True))
+            if dtype and getattr(pd.api.types.pandas_dtype(dtype), "tz", None) is None:
+                series = series.dt.tz_localize(None)
+        columns[column["name"]] = series.astype(dtype) if dtype else series
+    return pd.DataFrame(columns, index=pd.RangeIndex(length))
+
+
 def remove_entry_exit_signals(dataframe: pd.DataFrame):
     """
     Remove Entry and Exit signals from a DataFrame
@@ -236,3 +345,69 @@ def append_candles_to_dataframe(left: pd.DataFrame, right: pd.DataFrame) -> pd.D
     left.reset_index(drop=True, inplace=True)
 
     return left
+
+
+def dataframe_delta(
+    old: pd.DataFrame,
+    new: pd.DataFrame,
+    window: int = DATAFRAME_DELTA_WINDOW,
+    old_dates: pd.Index | None = None,
+) -> pd.DataFrame:
+    """
+    Rows of the `new` dataframe which are not in the `old` dataframe (by date), or which
+    differ from it within the last `window` rows - including rows with values in columns
+    `old` doesn't have. Older rows are considered final: indicators recalculated on a
+    sliding window (e.g. exponential averages) differ slightly on every row.
+
+    :param old: The dataframe previously sent
+    :param new: The current dataframe
+    :param window: Number of most recent rows checked for updates
+    :param old_dates: Dates of all rows previously sent, if `old` only holds the most
+        recent rows
+    :returns: The changed and new rows of `new`, with all its columns
+    """
+    if old.empty or new.empty:
+        return new
+    if old_dates is None:
+        old_dates = pd.Index(old["date"])
+    start = max(len(new) - window, 0)
+    positions = pd.Index(old["date"]).get_indexer(new["date"].iloc[start:])
+    known = positions >= 0
+    old_rows = positions[known]
+
+    changed = np.zeros(len(old_rows), dtype=bool)
+    for column in new.columns:
+        if column == "date":
+            continue
+        values = new[column].to_numpy()[start:][known]
+        if column not in old.columns:
+            changed |= pd.notna(values)
+            continue
+        previous = old[column].to_numpy()[old_rows]
+        if values.dtype.kind == "f" and previous.dtype.kind == "f":
+            # Rolling calculations differ in the last digits when the window moves
+            changed |= ~np.isclose(values, previous, rtol=1e-9, atol=0, equal_nan=True)
+        else:
+            changed |= ~((values == previous) | (pd.isna(values) & pd.isna(previous)))
+
+    mask = ~known
+    mask[known] = changed
+    # Rows before the window which are not in `old` yet
+    older = ~new["date"].iloc[:start].isin(old_dates).to_numpy()
+    return new[np.concatenate([older, mask])]
+
+
+def apply_dataframe_delta(base: pd.DataFrame, delta: pd.DataFrame, length: int) -> pd.DataFrame:
+    """
+    Update a dataframe with a delta built by dataframe_delta.
+    Rows are replaced or appended by date, columns missing from the delta are removed.
+
+    :param base: The dataframe to update
+    :param delta: The changed and new rows
+    :param length: Length of the dataframe the delta was built from - older rows are dropped
+    :returns: The updated dataframe
+    """
+    kept = base[~base["date"].isin(delta["date"])].reindex(columns=delta.columns)
+    dataframe = pd.concat([kept, delta]) if not delta.empty else kept
+    dataframe = dataframe.sort_values("date", kind="stable").tail(length)
+    return dataframe.reset_index(drop=True)
@@ -0,0 +1,126 @@
+"""
+Host additional trading accounts within the main bot process.
+"""
+
+import logging
+from copy import deepcopy
+from typing import Any
+
+from binancebot.constants import DEFAULT_ACCOUNT_DB_URL, Config
+from binancebot.exceptions import ConfigurationError
+from binancebot.persistence import Trade, use_db_account
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_account_profiles(config: Config) -> list[dict[str, Any]]:
+    """
+    Return the API profiles which should run as additional accounts.
+    Profiles are taken from `api_server.profiles`. Without an explicit `multi_account.profiles`
+    list, all profiles except the active (main) one are used.
+    :param config: Configuration (or raw config file content)
+    :return: List of profile dicts
+    """
+    ma_config = config.get("multi_account", {})
+    if not ma_config.get("enabled", False):
+        return []
+    api_cfg = config.get("api_server", {})
+    profiles = api_cfg.get("profiles", [])
+    profile_ids = ma_config.get("profiles")
+    if profile_ids is not None:
+        return [p for p in profiles if p.get("id") in profile_ids]
+
+    active_profile_id = api_cfg.get("active_profile_id")
+    return [p for p in profiles if p.get("id") and p.get("id") != active_profile_id]
+
+
+class MultiAccountManager:
+    """
+    Runs additional trading accounts on top of the main bot.
+    Each account has its own exchange credentials, wallet, database and strategy instance,
+    while markets, candles, tickers and analyzed dataframes come from the main bot - so
+    exchange API weight and analysis cost scale with the number of pairs, not accounts.
+    """
+
+    def __init__(self, binancebot) -> None:
+        self._bot = binancebot
+        self.accounts: dict[str, Any] = {}
+
+        for profile in get_account_profiles(binancebot.config):
+            account_id = profile["id"]
+            account_config = self._build_account_config(profile)
+            logger.info(f"Starting account '{profile.get('name', account_id)}' ({account_id}).")
+            with use_db_account(account_id):
+                # Uses the main bot's class to avoid a circular import
+                self.accounts[account_id] = type(binancebot)(
+                    account_config, market_source=binancebot, account_id=account_id
+                )
+
+    def _build_account_config(self, profile: dict[str, Any]) -> Config:
+        """
+        Derive the configuration of an account from the main configuration.
+        """
+        config = self._bot.config
+        profile_mode = profile.get("trading_mode", "spot")
+        if profile_mode != config["trading_mode"]:
+            raise ConfigurationError(
+                f"Profile '{profile.get('name', profile['id'])}' uses trading mode "
+                f"'{profile_mode}', but the bot runs in '{config['trading_mode']}'. "
+                "All accounts must use the trading mode of the main account."
+            )
+        account_config = deepcopy(config)
+        account_config["exchange"]["key"] = profile.get("api_key", "")
+        account_config["exchange"]["secret"] = profile.get("secret_key", "")
+        # Candles are streamed by the main account only
+        account_config["exchange"]["enable_ws"] = False
+        if profile.get("is_testnet", False):
+            for ccxt_conf in ("ccxt_config", "ccxt_async_config"):
+                account_config["exchange"].setdefault(ccxt_conf, {})["sandbox"] = True
+
+        db_url_template = config["multi_account"].get("db_url", DEFAULT_ACCOUNT_DB_URL)
+        account_config["db_url"] = db_url_template.format(account_id=profile["id"])
+        # The API server and notifications stay with the main account
+        account_config["api_server"] = {"enabled": False}
+        account_config["bot_name"] = f"{config.get('bot_name', 'binancebot')}-{profile['id']}"
+        return account_config
+
+    def market_pairs(self, whitelist: list[str]) -> list[str]:
+        """
+        Extend the given whitelist with pairs of open trades of all accounts,
+        so candles are downloaded and analyzed for these pairs as well.
+        """
+        pairs = list(whitelist)
+        for account_id in self.accounts:
+            with use_db_account(account_id):
+                pairs.extend(t.pair for t in Trade.get_open_trades() if t.pair not in pairs)
+        return pairs
+
+    def _run(self, method: str) -> None:
+        for account_id, bot in self.accounts.items():
+            with use_db_account(account_id):
+                try:
+                    getattr(bot, method)()
+                except Exception:
+                    logger.exception(f"Account {account_id}: error during {method}.")
+                finally:
+                    Trade.session.remove()
+
+    def startup(self) -> None:
+        self._run("startup")
+
+    def process(self) -> None:
+        """
+        Run one iteration for all accounts.
+        Must be called after the main bot analyzed the current candles.
+        """
+        for bot in self.accounts.values():
+            bot.state = self._bot.state
+        self._run("process")
+
+    def process_stopped(self) -> None:
+        self._run("process_stopped")
+
+    def cleanup(self) -> None:
+        self._run("cleanup")
+        self.accounts.clear()
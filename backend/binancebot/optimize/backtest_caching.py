@@ -1,9 +1,17 @@
 import hashlib
+import logging
 from copy import deepcopy
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import rapidjson
 
+from binancebot.configuration import TimeRange
+from binancebot.util import dt_now
+
+
+logger = logging.getLogger(__name__)
+
 
 def get_strategy_run_id(strategy) -> str:
     """
@@ -37,6 +45,23 @@ def get_strategy_run_id(strategy) -> str:
     return digest.hexdigest().lower()
 
 
+def get_min_cached_backtest_date(backtest_cache_age: str, timerange: TimeRange) -> datetime | None:
+    """
+    Oldest date of backtest results which may be reused, according to the backtest_cache setting.
+    None if no results may be reused.
+    """
+    min_backtest_date = None
+    if timerange.stopts == 0 or timerange.stopdt > dt_now():
+        logger.warning("Backtest result caching disabled due to use of open-ended timerange.")
+    elif backtest_cache_age == "day":
+        min_backtest_date = dt_now() - timedelta(days=1)
+    elif backtest_cache_age == "week":
+        min_backtest_date = dt_now() - timedelta(weeks=1)
+    elif backtest_cache_age == "month":
+        min_backtest_date = dt_now() - timedelta(weeks=4)
+    return min_backtest_date
+
+
 def get_backtest_metadata_filename(filename: Path | str) -> Path:
     """Return metadata filename for specified backtest results file."""
     filename = Path(filename)
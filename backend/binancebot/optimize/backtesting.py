@@ -6,8 +6,11 @@ This module contains the backtesting logic
 
 import logging
 from collections import defaultdict
+from collections.abc import Hashable
 from copy import deepcopy
 from datetime import datetime, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from numpy import isnan, nan
 from pandas import DataFrame, Series
@@ -18,7 +21,7 @@ from binancebot.constants import DATETIME_PRINT_FORMAT, Config, IntOrInf, LongSh
 from binancebot.data import history
 from binancebot.data.btanalysis import (
     find_existing_backtest_stats,
-    get_tick_size_over_time,
+    get_tick_size_over_time_cached,
     trade_list_to_dataframe,
 )
 from binancebot.data.converter import trim_dataframe, trim_dataframes
@@ -48,7 +51,10 @@ from binancebot.ft_types import (
 )
 # from binancebot.leverage.liquidation_price import update_liquidation_prices  # Module not available
 from binancebot.mixins import LoggingMixin
-from binancebot.optimize.backtest_caching import get_strategy_run_id
+from binancebot.optimize.backtest_caching import (
+    get_min_cached_backtest_date,
+    get_strategy_run_id,
+)
 from binancebot.optimize.bt_progress import BTProgress
 from binancebot.optimize.optimize_reports import (
     generate_backtest_stats,
@@ -213,6 +219,9 @@ class Backtesting:
         self.enable_protections: bool = self.config.get("enable_protections", False)
         self.dynamic_pairlist: bool = self.config.get("enable_dynamic_pairlist", False)
         migrate_data(config, self.exchange)
+        # Candles of a larger timerange, loaded beforehand (walk-forward windows) - cut to the
+        # timerange instead of loading from disk. detail_data / futures_data are set with them.
+        self.preloaded_data: dict[str, DataFrame] | None = None
 
         self.init_backtest()
 
@@ -308,16 +317,19 @@ class Backtesting:
         """
         self.progress.init_step(BacktestState.DATALOAD, 1)
 
-        data = history.load_data(
-            datadir=self.config["datadir"],
-            pairs=self.pairlists.whitelist,
-            timeframe=self.timeframe,
-            timerange=self.timerange,
-            startup_candles=self.required_startup,
-            fail_without_data=True,
-            data_format=self.config["dataformat_ohlcv"],
-            candle_type=self.config.get("candle_type_def", CandleType.SPOT),
-        )
+        if self.preloaded_data is not None:
+            data = self._slice_preloaded_data(self.preloaded_data)
+        else:
+            data = history.load_data(
+                datadir=self.config["datadir"],
+                pairs=self.pairlists.whitelist,
+                timeframe=self.timeframe,
+                timerange=self.timerange,
+                startup_candles=self.required_startup,
+                fail_without_data=True,
+                data_format=self.config["dataformat_ohlcv"],
+                candle_type=self.config.get("candle_type_def", CandleType.SPOT),
+            )
 
         min_date, max_date = history.get_timerange(data)
 
@@ -333,14 +345,53 @@ class Backtesting:
         )
 
         self.progress.set_new_value(1)
-        self._load_bt_data_detail()
+        if self.preloaded_data is None:
+            self._load_bt_data_detail()
         self.price_pair_prec = {}
         for pair in self.pairlists.whitelist:
             if pair in data:
                 # Load price precision logic
-                self.price_pair_prec[pair] = get_tick_size_over_time(data[pair])
+                self.price_pair_prec[pair] = get_tick_size_over_time_cached(
+                    data[pair], self._price_data_version(pair)
+                )
         return data, self.timerange
 
+    def _price_data_version(self, pair: str) -> Hashable | None:
+        """
+        Data file of the pair, with its mtime and size - changes whenever the candles may have.
+        None if there's no such file.
+        """
+        candle_type = self.config.get("candle_type_def", CandleType.SPOT)
+        datahandler = history.get_datahandler(
+            self.config["datadir"], self.config["dataformat_ohlcv"]
+        )
+        file = datahandler._pair_data_filename(
+            self.config["datadir"], pair, self.timeframe, candle_type
+        )
+        try:
+            stat = file.stat()
+        except OSError:
+            return None
+        return str(file), stat.st_mtime_ns, stat.st_size
+
+    def _slice_preloaded_data(self, preloaded: dict[str, DataFrame]) -> dict[str, DataFrame]:
+        """
+        Candles of the timerange, including startup candles - like history.load_data
+        would load them from disk.
+        """
+        timerange_startup = deepcopy(self.timerange)
+        timerange_startup.subtract_start(self.timeframe_secs * self.required_startup)
+        data: dict[str, DataFrame] = {}
+        for pair in self.pairlists.whitelist:
+            if pair not in preloaded:
+                continue
+            pairdata = trim_dataframe(preloaded[pair], timerange_startup)
+            if not pairdata.empty:
+                data[pair] = pairdata.reset_index(drop=True)
+        if not data:
+            raise OperationalException("No data found. Terminating.")
+        return data
+
     def _load_bt_data_detail(self) -> None:
         """
         Loads backtest detail data (smaller timeframe) if necessary.
@@ -1795,18 +1846,60 @@ class Backtesting:
 
         return min_date, max_date
 
+    def backtest_strategies_parallel(
+        self,
+        strategies: list[IStrategy],
+        data: dict[str, DataFrame],
+        timerange: TimeRange,
+        n_jobs: int,
+    ) -> tuple[datetime, datetime]:
+        """
+        Run backtest_one_strategy for each strategy in worker processes.
+        The loaded data is dumped to a file once, and memory-mapped by all workers.
+        Results are merged into all_bt_content / analysis_results, like sequential runs.
+        """
+        from joblib import Parallel, delayed, dump
+
+        with TemporaryDirectory(prefix="backtest_") as tmpdir:
+            data_file = Path(tmpdir) / "backtest_data.pkl"
+            dump(
+                {
+                    "data": data,
+                    "detail_data": self.detail_data,
+                    "futures_data": self.futures_data,
+                    "price_pair_prec": self.price_pair_prec,
+                },
+                data_file,
+            )
+            logger.info(
+                f"Backtesting {len(strategies)} strategies in {n_jobs} worker processes."
+            )
+            with Parallel(n_jobs=n_jobs) as parallel:
+                results = parallel(
+                    delayed(_backtest_strategy_in_worker)(
+                        self.config,
+                        strat.get_strategy_name(),
+                        self.run_ids.get(strat.get_strategy_name(), ""),
+                        data_file,
+                        timerange,
+                        self.required_startup,
+                    )
+                    for strat in strategies
+                )
+
+        for strat, (bt_content, analysis_results, min_date, max_date) in zip(
+            strategies, results, strict=True
+        ):
+            strategy_name = strat.get_strategy_name()
+            self.all_bt_content[strategy_name] = bt_content
+            for key, value in analysis_results.items():
+                self.analysis_results[key][strategy_name] = value
+        return min_date, max_date
+
     def _get_min_cached_backtest_date(self):
-        min_backtest_date = None
-        backtest_cache_age = self.config.get("backtest_cache", constants.BACKTEST_CACHE_DEFAULT)
-        if self.timerange.stopts == 0 or self.timerange.stopdt > dt_now():
-            logger.warning("Backtest result caching disabled due to use of open-ended timerange.")
-        elif backtest_cache_age == "day":
-            min_backtest_date = dt_now() - timedelta(days=1)
-        elif backtest_cache_age == "week":
-            min_backtest_date = dt_now() - timedelta(weeks=1)
-        elif backtest_cache_age == "month":
-            min_backtest_date = dt_now() - timedelta(weeks=4)
-        return min_backtest_date
+        return get_min_cached_backtest_date(
+            self.config.get("backtest_cache", constants.BACKTEST_CACHE_DEFAULT), self.timerange
+        )
 
     def load_prior_backtest(self):
         self.run_ids = {
@@ -1833,12 +1926,22 @@ class Backtesting:
 
         self.load_prior_backtest()
 
+        strategies = []
         for strat in self.strategylist:
             if self.results and strat.get_strategy_name() in self.results["strategy"]:
                 # When previous result hash matches - reuse that result and skip backtesting.
                 logger.info(f"Reusing result of previous backtest for {strat.get_strategy_name()}")
                 continue
-            min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
+            strategies.append(strat)
+
+        workers = self.config.get("backtest_workers", 1)
+        if workers != 1 and len(strategies) > 1:
+            min_date, max_date = self.backtest_strategies_parallel(
+                strategies, data, timerange, workers
+            )
+        else:
+            for strat in strategies:
+                min_date, max_date = self.backtest_one_strategy(strat, data, timerange)
 
         # Update old results with new ones.
         if len(self.all_bt_content) > 0:
@@ -1883,3 +1986,42 @@ class Backtesting:
         if len(self.strategylist) > 0:
             # Show backtest results
             show_backtest_results(self.config, self.results)
+
+
+def _backtest_strategy_in_worker(
+    config: Config,
+    strategy_name: str,
+    run_id: str,
+    data_file: Path,
+    timerange: TimeRange,
+    required_startup: int,
+) -> tuple[BacktestContentType, dict[str, DataFrame], datetime, datetime]:
+    """
+    Backtest one strategy of a strategy list in a worker process,
+    on the data loaded by the main process.
+    """
+    from joblib import load
+
+    config = deepcopy(config)
+    config["strategy_list"] = [strategy_name]
+    backtesting = Backtesting(config)
+    with data_file.open("rb") as f:
+        shared = load(f, mmap_mode="r")
+    # Same state as the main process after loading data for all strategies
+    backtesting.timerange = timerange
+    backtesting.required_startup = required_startup
+    backtesting.config["startup_candle_count"] = required_startup
+    backtesting.detail_data = shared["detail_data"]
+    backtesting.futures_data = shared["futures_data"]
+    backtesting.price_pair_prec = shared["price_pair_prec"]
+    backtesting.run_ids = {strategy_name: run_id}
+
+    min_date, max_date = backtesting.backtest_one_strategy(
+        backtesting.strategylist[0], shared["data"], timerange
+    )
+    analysis_results = {
+        key: results[strategy_name]
+        for key, results in backtesting.analysis_results.items()
+        if strategy_name in results
+    }
+    return backtesting.all_bt_content[strategy_name], analysis_results, min_date, max_date
@@ -41,7 +41,11 @@ class Hyperopt:
     hyperopt.start()
     """
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, file_suffix: str = "") -> None:
+        """
+        :param file_suffix: Appended to the names of the results and data files,
+            keeping side by side runs (walk-forward windows) apart
+        """
         self._hyper_out: HyperoptOutput = HyperoptOutput(streaming=True)
 
         self.config = config
@@ -54,10 +58,12 @@ class Hyperopt:
         self.results_file: Path = (
             self.config["user_data_dir"]
             / "hyperopt_results"
-            / f"strategy_{strategy}_{time_now}.fthypt"
+            / f"strategy_{strategy}_{time_now}{file_suffix}.fthypt"
         )
         self.data_pickle_file = (
-            self.config["user_data_dir"] / "hyperopt_results" / "hyperopt_tickerdata.pkl"
+            self.config["user_data_dir"]
+            / "hyperopt_results"
+            / f"hyperopt_tickerdata{file_suffix}.pkl"
         )
         self.total_epochs = config.get("epochs", 0)
 
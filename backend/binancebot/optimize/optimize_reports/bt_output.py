@@ -296,6 +296,11 @@ def text_table_add_metrics(strat_results: dict) -> None:
             ("Backtesting to", strat_results["backtest_end"]),
             *trading_mode,
             ("Max open trades", strat_results["max_open_trades"]),
+            *(
+                [("Max parallel trades", strat_results["max_parallel_trades"])]
+                if "max_parallel_trades" in strat_results
+                else []
+            ),
             ("", ""),  # Empty line to improve readability
             (
                 "Total/Daily Avg Trades",
@@ -7,6 +7,7 @@ import numpy as np
 from pandas import DataFrame, Series, concat, to_datetime
 
 from binancebot.constants import BACKTEST_BREAKDOWNS, DATETIME_PRINT_FORMAT
+from binancebot.data.btanalysis import analyze_trade_parallelism
 from binancebot.data.metrics import (
     calculate_cagr,
     calculate_calmar,
@@ -485,6 +486,11 @@ def generate_strategy_stats(
         return {}
     config = content["config"]
     max_open_trades = min(config["max_open_trades"], len(pairlist))
+    max_parallel_trades = (
+        int(analyze_trade_parallelism(results, config["timeframe"])["open_trades"].max())
+        if len(results) > 0
+        else 0
+    )
     start_balance = get_dry_run_wallet(config)
     stake_currency = config["stake_currency"]
 
@@ -616,6 +622,7 @@ def generate_strategy_stats(
         "canceled_entry_orders": content["canceled_entry_orders"],
         "replaced_entry_orders": content["replaced_entry_orders"],
         "max_open_trades": max_open_trades,
+        "max_parallel_trades": max_parallel_trades,
         "max_open_trades_setting": (
             config["max_open_trades"] if config["max_open_trades"] != float("inf") else -1
         ),
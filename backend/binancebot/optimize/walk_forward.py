@@ -0,0 +1,364 @@
+"""
+Walk-forward analysis.
+
+The timerange is split into windows of an in-sample and an out-of-sample part. Each window is
+hyperopted on its in-sample part, and the best parameters are backtested on the following
+out-of-sample part. The out-of-sample parts follow each other without gaps - their trades form
+one equity curve of a strategy that is re-optimized periodically.
+
+Windows run side by side in worker processes, on the data of the whole timerange loaded once.
+"""
+
+import logging
+from copy import deepcopy
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+import pandas as pd
+import rapidjson
+
+from binancebot.configuration import TimeRange
+from binancebot.constants import (
+    DATETIME_PRINT_FORMAT,
+    WALK_FORWARD_OOS_RATIO,
+    WALK_FORWARD_WINDOWS,
+    Config,
+)
+from binancebot.data import history
+from binancebot.data.converter import trim_dataframes
+from binancebot.data.metrics import calculate_max_drawdown
+from binancebot.enums import RunMode
+from binancebot.exceptions import OperationalException
+from binancebot.exchange import timeframe_to_seconds
+from binancebot.misc import deep_merge_dicts
+from binancebot.optimize.backtesting import Backtesting
+from binancebot.optimize.hyperopt_tools import hyperopt_serializer
+from binancebot.util import dt_from_ts, fmt_coin, get_dry_run_wallet, print_rich_table
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class WalkForwardWindow:
+    index: int
+    in_sample: TimeRange
+    out_of_sample: TimeRange
+
+
+@dataclass
+class WalkForwardResult:
+    window: WalkForwardWindow
+    # Best epoch of the in-sample hyperopt, None if no epoch was better than the loss limit
+    params: dict[str, Any] | None
+    in_sample_metrics: dict[str, Any] = field(default_factory=dict)
+    out_of_sample_trades: pd.DataFrame = field(default_factory=pd.DataFrame)
+
+
+def _timerange_arg(timerange: TimeRange) -> str:
+    # timerange_str only keeps the day
+    return f"{timerange.startts}-{timerange.stopts}"
+
+
+def split_timerange(
+    start: datetime,
+    end: datetime,
+    timeframe: str,
+    windows: int,
+    oos_ratio: float,
+    anchored: bool = False,
+) -> list[WalkForwardWindow]:
+    """
+    Split start - end into walk-forward windows, aligned to candles of the timeframe.
+    The out-of-sample parts cover the end of the timerange without gaps and overlaps.
+    :param oos_ratio: Share of the out-of-sample part in a window
+    :param anchored: In-sample parts all begin at start, growing with each window
+    """
+    tf_secs = timeframe_to_seconds(timeframe)
+    candles = int((end - start).total_seconds()) // tf_secs
+    oos_candles = int(candles / (windows + (1 - oos_ratio) / oos_ratio))
+    is_candles = candles - windows * oos_candles
+    if oos_candles < 1 or is_candles < 1:
+        raise OperationalException(
+            f"Timerange of {candles} candles is too short for {windows} walk-forward windows."
+        )
+
+    start_ts = int(start.timestamp())
+    result = []
+    for index in range(windows):
+        oos_start = start_ts + (is_candles + index * oos_candles) * tf_secs
+        is_start = start_ts if anchored else oos_start - is_candles * tf_secs
+        oos_stop = oos_start + oos_candles * tf_secs
+        # Timerange stops are inclusive - end right before the next part begins
+        result.append(
+            WalkForwardWindow(
+                index=index + 1,
+                in_sample=TimeRange("date", "date", is_start, oos_start - 1),
+                out_of_sample=TimeRange("date", "date", oos_start, oos_stop - 1),
+            )
+        )
+    return result
+
+
+def _timerange_text(timerange: TimeRange) -> str:
+    # Up to the start of the next part
+    stop = dt_from_ts(timerange.stopts + 1)
+    return f"{timerange.startdt:%Y-%m-%d %H:%M} - {stop:%Y-%m-%d %H:%M}"
+
+
+def _use_shared_data(backtesting: Backtesting, shared: dict[str, Any]) -> None:
+    backtesting.preloaded_data = shared["data"]
+    backtesting.detail_data = shared["detail_data"]
+    backtesting.futures_data = shared["futures_data"]
+
+
+def _out_of_sample_config(config: Config, window: WalkForwardWindow, params: dict) -> Config:
+    """
+    Backtest configuration of the out-of-sample part - with the optimized roi, stoploss,
+    trailing and max_open_trades, which take precedence over the strategy attributes.
+    """
+    oos_config = deepcopy(config)
+    oos_config["runmode"] = RunMode.BACKTEST
+    oos_config["timerange"] = _timerange_arg(window.out_of_sample)
+    if "roi" in params:
+        oos_config["minimal_roi"] = params["roi"]
+    if "stoploss" in params:
+        oos_config["stoploss"] = params["stoploss"]["stoploss"]
+    # None values can't be in the configuration
+    oos_config.update({k: v for k, v in params.get("trailing", {}).items() if v is not None})
+    if "max_open_trades" in params:
+        max_open_trades = params["max_open_trades"]["max_open_trades"]
+        oos_config["max_open_trades"] = float("inf") if max_open_trades == -1 else max_open_trades
+    return oos_config
+
+
+def _run_window(config: Config, window: WalkForwardWindow, data_file: Path) -> WalkForwardResult:
+    """
+    Optimize the in-sample part of a window, backtest the out-of-sample part with the best
+    parameters. Runs in a worker process, on the data loaded by the main process.
+    """
+    from joblib import load
+
+    from binancebot.optimize.hyperopt import Hyperopt
+
+    with data_file.open("rb") as f:
+        shared = load(f, mmap_mode="r")
+
+    is_config = deepcopy(config)
+    is_config.update(
+        {
+            "timerange": _timerange_arg(window.in_sample),
+            # Windows run in parallel already, and must not overwrite the parameter file
+            "hyperopt_jobs": 1,
+            "disableparamexport": True,
+            "print_json": False,
+        }
+    )
+    hyperopt = Hyperopt(is_config, file_suffix=f"_wf{window.index}")
+    _use_shared_data(hyperopt.hyperopter.backtesting, shared)
+    try:
+        hyperopt.start()
+    finally:
+        hyperopt.data_pickle_file.unlink(missing_ok=True)
+
+    best = hyperopt.current_best_epoch
+    if not best:
+        logger.warning(f"No in-sample result for walk-forward window {window.index}.")
+        return WalkForwardResult(window, None)
+    # Same parameters as exported to the parameter file by hyperopt
+    params = deep_merge_dicts(best["params_details"], deepcopy(best["params_not_optimized"]))
+
+    backtesting = Backtesting(_out_of_sample_config(config, window, params))
+    strategy = backtesting.strategylist[0]
+    # Instead of the parameter file - loaded into the hyperoptable parameters on bot start
+    strategy._ft_params_from_file = params
+    _use_shared_data(backtesting, shared)
+    data, timerange = backtesting.load_bt_data()
+    backtesting.backtest_one_strategy(strategy, data, timerange)
+
+    return WalkForwardResult(
+        window,
+        params,
+        in_sample_metrics=best["results_metrics"],
+        out_of_sample_trades=backtesting.all_bt_content[strategy.get_strategy_name()]["results"],
+    )
+
+
+class WalkForward:
+    """
+    Walk-forward analysis of one strategy
+
+    walk_forward = WalkForward(config)
+    walk_forward.start()
+    """
+
+    def __init__(self, config: Config) -> None:
+        self.config = config
+        self.windows = config.get("walk_forward_windows", WALK_FORWARD_WINDOWS)
+        self.oos_ratio = config.get("walk_forward_oos_ratio", WALK_FORWARD_OOS_RATIO)
+        self.anchored = config.get("walk_forward_anchored", False)
+        if not 0 < self.oos_ratio < 1:
+            raise OperationalException("Walk-forward out-of-sample ratio must be between 0 and 1.")
+
+        self.starting_balance = get_dry_run_wallet(config)
+        # Loads the data of the whole timerange, shared by all windows
+        self.backtesting = Backtesting(config)
+        self.strategy_name = self.backtesting.strategylist[0].get_strategy_name()
+
+    def start(self) -> None:
+        from joblib import Parallel, delayed, dump
+
+        data, timerange = self.backtesting.load_bt_data()
+        trimmed = trim_dataframes(data, timerange, self.backtesting.required_startup)
+        min_date, max_date = history.get_timerange(trimmed)
+        windows = split_timerange(
+            min_date,
+            max_date + self.backtesting.timeframe_td,
+            self.backtesting.timeframe,
+            self.windows,
+            self.oos_ratio,
+            self.anchored,
+        )
+
+        with TemporaryDirectory(prefix="walk_forward_") as tmpdir:
+            data_file = Path(tmpdir) / "walk_forward_data.pkl"
+            dump(
+                {
+                    "data": data,
+                    "detail_data": self.backtesting.detail_data,
+                    "futures_data": self.backtesting.futures_data,
+                },
+                data_file,
+            )
+            with Parallel(n_jobs=self.config.get("hyperopt_jobs", -1)) as parallel:
+                logger.info(
+                    f"Running {len(windows)} walk-forward windows "
+                    f"in {parallel._effective_n_jobs()} worker processes."
+                )
+                results: list[WalkForwardResult] = parallel(
+                    delayed(_run_window)(self.config, window, data_file) for window in windows
+                )
+
+        equity = self.stitch_equity(results)
+        self.show_results(results, equity)
+        self.export_results(results, equity)
+
+    def stitch_equity(self, results: list[WalkForwardResult]) -> pd.DataFrame:
+        """
+        Out-of-sample trades of all windows, with the balance after each trade.
+        Each window starts from the starting balance, so the profits are added up.
+        """
+        trades = [r.out_of_sample_trades for r in results if not r.out_of_sample_trades.empty]
+        if not trades:
+            return pd.DataFrame(columns=["close_date", "profit_abs", "balance"])
+        equity = pd.concat(trades).sort_values("close_date").reset_index(drop=True)
+        equity["balance"] = equity["profit_abs"].cumsum() + self.starting_balance
+        return equity
+
+    def _window_row(self, result: WalkForwardResult) -> list[str]:
+        window = result.window
+        row = [
+            str(window.index),
+            _timerange_text(window.in_sample),
+            _timerange_text(window.out_of_sample),
+        ]
+        if result.params is None:
+            return row + ["-"] * 5
+        is_metrics = result.in_sample_metrics
+        trades = result.out_of_sample_trades
+        profit_abs = float(trades["profit_abs"].sum()) if not trades.empty else 0.0
+        drawdown = (
+            calculate_max_drawdown(trades, starting_balance=self.starting_balance)
+            if not trades.empty
+            else None
+        )
+        return row + [
+            str(is_metrics["total_trades"]),
+            f"{is_metrics['profit_total']:.2%}",
+            str(len(trades)),
+            fmt_coin(profit_abs, self.config["stake_currency"]),
+            f"{drawdown.relative_account_drawdown:.2%}" if drawdown else "-",
+        ]
+
+    def show_results(self, results: list[WalkForwardResult], equity: pd.DataFrame) -> None:
+        headers = [
+            "Window",
+            "In-sample",
+            "Out-of-sample",
+            "IS trades",
+            "IS profit",
+            "OOS trades",
+            "OOS profit",
+            "OOS drawdown",
+        ]
+        print_rich_table(
+            [self._window_row(r) for r in results],
+            headers,
+            summary=f"Walk-forward windows of {self.strategy_name}",
+        )
+        if equity.empty:
+            print("No out-of-sample trades.")
+            return
+        profit_abs = equity["balance"].iloc[-1] - self.starting_balance
+        drawdown = calculate_max_drawdown(equity, starting_balance=self.starting_balance)
+        stake_currency = self.config["stake_currency"]
+        print_rich_table(
+            [
+                ["Out-of-sample trades", str(len(equity))],
+                ["Starting balance", fmt_coin(self.starting_balance, stake_currency)],
+                ["Final balance", fmt_coin(equity["balance"].iloc[-1], stake_currency)],
+                [
+                    "Total profit",
+                    (
+                        f"{fmt_coin(profit_abs, stake_currency)} "
+                        f"({profit_abs / self.starting_balance:.2%})"
+                    ),
+                ],
+                ["Max drawdown", f"{drawdown.relative_account_drawdown:.2%}"],
+                [
+                    "Drawdown start / end",
+                    (
+                        f"{drawdown.high_date:{DATETIME_PRINT_FORMAT}} / "
+                        f"{drawdown.low_date:{DATETIME_PRINT_FORMAT}}"
+                    ),
+                ],
+            ],
+            ["Metric", "Value"],
+            summary="Stitched out-of-sample result",
+            justify="left",
+        )
+
+    def export_results(self, results: list[WalkForwardResult], equity: pd.DataFrame) -> None:
+        time_now = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        filename = (
+            self.config["user_data_dir"]
+            / "hyperopt_results"
+            / f"walk_forward_{self.strategy_name}_{time_now}.json"
+        )
+        export = {
+            "strategy": self.strategy_name,
+            "starting_balance": self.starting_balance,
+            "windows": [
+                {
+                    "window": r.window.index,
+                    "in_sample": _timerange_arg(r.window.in_sample),
+                    "out_of_sample": _timerange_arg(r.window.out_of_sample),
+                    "params": r.params,
+                    "out_of_sample_trades": len(r.out_of_sample_trades),
+                    "out_of_sample_profit_abs": float(r.out_of_sample_trades["profit_abs"].sum())
+                    if not r.out_of_sample_trades.empty
+                    else 0.0,
+                }
+                for r in results
+            ],
+            "equity": [
+                {"date": int(row.close_date.timestamp() * 1000), "balance": row.balance}
+                for row in equity[["close_date", "balance"]].itertuples()
+            ],
+        }
+        logger.info(f"Dumping walk-forward results to {filename}")
+        with filename.open("w") as f:
+            rapidjson.dump(export, f, indent=2, default=hyperopt_serializer)
@@ -1,10 +1,12 @@
 # flake8: noqa: F401
 
 from binancebot.persistence.custom_data import CustomDataWrapper
+from binancebot.persistence.daily_profit import DailyProfit
 from binancebot.persistence.key_value_store import KeyStoreKeys, KeyValueStore
-from binancebot.persistence.models import init_db
+from binancebot.persistence.models import init_db, use_db_account
 from binancebot.persistence.pairlock_middleware import PairLocks
 from binancebot.persistence.trade_model import LocalTrade, Order, Trade
+from binancebot.persistence.trade_statistics import TradeStatistics
 from binancebot.persistence.usedb_context import (
     FtNoDBContext,
     disable_database_use,
@@ -0,0 +1,131 @@
+import logging
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+from typing import Any, ClassVar
+
+from sqlalchemy import (
+    Connection,
+    Date,
+    Float,
+    Integer,
+    delete,
+    event,
+    func,
+    insert,
+    inspect,
+    select,
+)
+from sqlalchemy.orm import Mapped, Session, mapped_column, sessionmaker
+
+from binancebot.persistence.base import ModelBase, SessionType
+from binancebot.persistence.trade_model import Trade
+
+
+logger = logging.getLogger(__name__)
+
+_PENDING_DAYS_KEY = "daily_profit_days"
+
+
+class _DailyProfitModel(ModelBase):
+    """
+    Closed trade profit per day (by close date, UTC).
+    Rollup of the trades table - maintained on every flush touching closed trades.
+    """
+
+    __tablename__ = "trade_daily_profit"
+    session: ClassVar[SessionType]
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    profit_abs: Mapped[float] = mapped_column(Float(), nullable=False, default=0.0)
+    trade_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+def _day_bucket():
+    return func.date(Trade.close_date, type_=Date)
+
+
+def _grouped_profit_query(start: date | None = None, end: date | None = None):
+    """
+    Closed trade profit grouped by close day, optionally limited to [start, end).
+    """
+    query = select(
+        _day_bucket().label("day"),
+        func.coalesce(func.sum(Trade.close_profit_abs), 0.0).label("profit_abs"),
+        func.count(Trade.id).label("trade_count"),
+    ).filter(Trade.is_open.is_(False), Trade.close_date.is_not(None))
+    if start is not None:
+        query = query.filter(Trade.close_date >= datetime.combine(start, time.min))
+    if end is not None:
+        query = query.filter(Trade.close_date < datetime.combine(end, time.min))
+    return query.group_by(_day_bucket())
+
+
+class DailyProfit:
+    """
+    Access to the per-day profit rollup of closed trades.
+    """
+
+    @staticmethod
+    def register(session_maker: sessionmaker) -> None:
+        """
+        Keep the rollup in sync with the trades table for sessions of this sessionmaker.
+        Days of closed trades which are added, changed or deleted are recalculated
+        within the same transaction.
+        """
+        event.listen(session_maker, "before_flush", DailyProfit._collect_days)
+        event.listen(session_maker, "after_flush", DailyProfit._refresh_pending_days)
+
+    @staticmethod
+    def _collect_days(session: Session, flush_context, instances) -> None:
+        days: set[date] = session.info.setdefault(_PENDING_DAYS_KEY, set())
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            if not isinstance(obj, Trade):
+                continue
+            # Previous close date covers re-opened trades and changed close dates
+            close_dates = [obj.close_date, *inspect(obj).attrs.close_date.history.deleted]
+            days.update(d.date() for d in close_dates if d is not None)
+
+    @staticmethod
+    def _refresh_pending_days(session: Session, flush_context) -> None:
+        days = session.info.pop(_PENDING_DAYS_KEY, None)
+        if days:
+            DailyProfit.refresh_days(session.connection(), days)
+
+    @staticmethod
+    def refresh_days(connection: Connection, days: Iterable[date]) -> None:
+        """
+        Recalculate the rollup rows for the given days from the trades table.
+        """
+        table = _DailyProfitModel.__table__
+        for day in days:
+            rows = connection.execute(_grouped_profit_query(day, day + timedelta(days=1))).all()
+            connection.execute(delete(table).where(table.c.day == day))
+            if rows:
+                connection.execute(insert(table), [row._asdict() for row in rows])
+
+    @staticmethod
+    def rebuild(connection: Connection) -> None:
+        """
+        Rebuild the whole rollup with one grouped query over the trades table.
+        """
+        table = _DailyProfitModel.__table__
+        connection.execute(delete(table))
+        connection.execute(
+            insert(table).from_select(["day", "profit_abs", "trade_count"], _grouped_profit_query())
+        )
+
+    @staticmethod
+    def get_profit_per_day(start: date, end: date) -> dict[date, dict[str, Any]]:
+        """
+        Closed trade profit per day for days in [start, end), in a single query.
+        Days without closed trades are not included.
+        :return: dict of day -> {"profit_abs": float, "trade_count": int}
+        """
+        rows = _DailyProfitModel.session.execute(
+            select(
+                _DailyProfitModel.day, _DailyProfitModel.profit_abs, _DailyProfitModel.trade_count
+            ).filter(_DailyProfitModel.day >= start, _DailyProfitModel.day < end)
+        ).all()
+        return {
+            row.day: {"profit_abs": row.profit_abs, "trade_count": row.trade_count} for row in rows
+        }
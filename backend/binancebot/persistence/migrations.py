@@ -3,6 +3,7 @@ import logging
 from sqlalchemy import Engine, inspect, select, text, update
 
 from binancebot.exceptions import OperationalException
+from binancebot.persistence.daily_profit import DailyProfit, _DailyProfitModel
 from binancebot.persistence.trade_model import Order, Trade
 
 
@@ -350,6 +351,14 @@ def fix_wrong_max_stake_amount(engine):
         connection.execute(stmt)
 
 
+def create_missing_trade_indexes(engine: Engine) -> None:
+    """
+    Create indexes added to the trades table after the table was created.
+    """
+    for index in Trade.__table__.indexes:
+        index.create(engine, checkfirst=True)
+
+
 def check_migrate(engine: Engine, decl_base, previous_tables: list[str]) -> None:
     """
     Checks if migration is necessary and migrates if necessary
@@ -405,6 +414,12 @@ def check_migrate(engine: Engine, decl_base, previous_tables: list[str]) -> None
     set_sqlite_to_wal(engine)
     fix_old_dry_orders(engine)
     fix_wrong_max_stake_amount(engine)
+    create_missing_trade_indexes(engine)
+
+    if migrating or _DailyProfitModel.__tablename__ not in previous_tables:
+        logger.info("Building daily profit rollup.")
+        with engine.begin() as connection:
+            DailyProfit.rebuild(connection)
 
     if migrating:
         logger.info("Database migration finished.")
@@ -5,6 +5,8 @@ This module contains the class to persist trades into SQLite
 import functools
 import logging
 import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from contextvars import ContextVar
 from typing import Any, Final
 
@@ -16,10 +18,12 @@ from sqlalchemy.pool import StaticPool
 from binancebot.exceptions import OperationalException
 from binancebot.persistence.base import ModelBase
 from binancebot.persistence.custom_data import _CustomData
+from binancebot.persistence.daily_profit import DailyProfit, _DailyProfitModel
 from binancebot.persistence.key_value_store import _KeyValueStoreModel
 from binancebot.persistence.migrations import check_migrate
 from binancebot.persistence.pairlock import PairLock
 from binancebot.persistence.trade_model import Order, Trade
+from binancebot.persistence.trade_statistics import TradeStatistics
 
 
 logger = logging.getLogger(__name__)
@@ -28,6 +32,13 @@ logger = logging.getLogger(__name__)
 REQUEST_ID_CTX_KEY: Final[str] = "request_id"
 _request_id_ctx_var: ContextVar[str | None] = ContextVar(REQUEST_ID_CTX_KEY, default=None)
 
+DB_ACCOUNT_CTX_KEY: Final[str] = "db_account"
+_db_account_ctx_var: ContextVar[str] = ContextVar(DB_ACCOUNT_CTX_KEY, default="")
+
+# Session factories per trading account. "" is the main account initialized by the bot.
+_session_makers: dict[str, sessionmaker] = {}
+_custom_data_session_makers: dict[str, sessionmaker] = {}
+
 
 def get_request_or_thread_id() -> str | None:
     """
@@ -38,18 +49,52 @@ def get_request_or_thread_id() -> str | None:
         # when not in request context - use thread id
         request_id = str(threading.current_thread().ident)
 
+    account = _db_account_ctx_var.get()
+    if account:
+        # Keep sessions of additional accounts apart from the main account's session
+        return f"{account}:{request_id}"
     return request_id
 
 
+@contextmanager
+def use_db_account(account_id: str) -> Iterator[None]:
+    """
+    Route all database access within this context to the database of the given account.
+    The account's database must have been initialized with `init_db(db_url, account_id)`.
+    :param account_id: Account identifier ("" for the main account)
+    """
+    token = _db_account_ctx_var.set(account_id)
+    try:
+        yield
+    finally:
+        _db_account_ctx_var.reset(token)
+
+
+def _account_session_factory(makers: dict[str, sessionmaker]):
+    """
+    Session factory for scoped_session, creating sessions bound to the active account's engine.
+    """
+
+    def create_session():
+        account = _db_account_ctx_var.get()
+        if account not in makers:
+            raise OperationalException(f"Database for account '{account}' is not initialized.")
+        return makers[account]()
+
+    return create_session
+
+
 _SQL_DOCS_URL = "http://docs.sqlalchemy.org/en/latest/core/engines.html#database-urls"
 
 
-def init_db(db_url: str) -> None:
+def init_db(db_url: str, account_id: str = "") -> None:
     """
     Initializes this module with the given config,
     registers all known command handlers
     and starts polling for message updates
     :param db_url: Database to use
+    :param account_id: Additional trading account this database belongs to.
+        Initializing the main account ("") resets all previously registered accounts.
     :return: None
     """
     kwargs: dict[str, Any] = {}
@@ -80,18 +125,34 @@ def init_db(db_url: str) -> None:
             f"Given value for db_url: '{db_url}' is no valid database URL! (See {_SQL_DOCS_URL})"
         )
 
-    # https://docs.sqlalchemy.org/en/13/orm/contextual.html#thread-local-scope
-    # Scoped sessions proxy requests to the appropriate thread-local session.
-    # Since we also use fastAPI, we need to make it aware of the request id, too
-    Trade.session = scoped_session(
-        sessionmaker(bind=engine, autoflush=False), scopefunc=get_request_or_thread_id
-    )
-    Order.session = Trade.session
-    PairLock.session = Trade.session
-    _KeyValueStoreModel.session = Trade.session
-    _CustomData.session = scoped_session(
-        sessionmaker(bind=engine, autoflush=True), scopefunc=get_request_or_thread_id
-    )
+    global _session_makers, _custom_data_session_makers
+    if not account_id:
+        # Fresh registries - sessions handed out before re-initialization keep their engine
+        _session_makers = {}
+        _custom_data_session_makers = {}
+    elif "" not in _session_makers:
+        raise OperationalException("The main database must be initialized before accounts.")
+    _session_makers[account_id] = sessionmaker(bind=engine, autoflush=False)
+    DailyProfit.register(_session_makers[account_id])
+    TradeStatistics.register(_session_makers[account_id])
+    _custom_data_session_makers[account_id] = sessionmaker(bind=engine, autoflush=True)
+
+    if not account_id:
+        # https://docs.sqlalchemy.org/en/13/orm/contextual.html#thread-local-scope
+        # Scoped sessions proxy requests to the appropriate thread-local session.
+        # Since we also use fastAPI, we need to make it aware of the request id, too
+        # The session factory picks the engine of the account selected via use_db_account().
+        Trade.session = scoped_session(
+            _account_session_factory(_session_makers), scopefunc=get_request_or_thread_id
+        )
+        Order.session = Trade.session
+        PairLock.session = Trade.session
+        _KeyValueStoreModel.session = Trade.session
+        _DailyProfitModel.session = Trade.session
+        _CustomData.session = scoped_session(
+            _account_session_factory(_custom_data_session_makers),
+            scopefunc=get_request_or_thread_id,
+        )
 
     previous_tables = inspect(engine).get_table_names()
     ModelBase.metadata.create_all(engine)
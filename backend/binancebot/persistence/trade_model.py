@@ -1696,7 +1696,8 @@ class Trade(ModelBase, LocalTrade):
     amount: Mapped[float] = mapped_column(Float())
     amount_requested: Mapped[float | None] = mapped_column(Float())
     open_date: Mapped[datetime] = mapped_column(nullable=False, default=datetime.now)
-    close_date: Mapped[datetime | None] = mapped_column()
+    # active_history: the previous close date is needed to maintain the daily profit rollup
+    close_date: Mapped[datetime | None] = mapped_column(index=True, active_history=True)
     # absolute value of the stop loss
     stop_loss: Mapped[float] = mapped_column(Float(), nullable=True, default=0.0)
     # percentage value of the stop loss
@@ -0,0 +1,415 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from datetime import UTC, datetime
+from math import inf, nan
+from typing import Any, NamedTuple
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import Engine, event, func, inspect, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from binancebot.data.metrics import DrawDownResult
+from binancebot.persistence.trade_model import Trade
+
+
+logger = logging.getLogger(__name__)
+
+_PENDING_STATS_KEY = "trade_statistics_pending"
+# Seconds between cheap consistency checks of the statistics against the trades table
+RECONCILE_INTERVAL = 60
+
+# Trade columns the closed trade statistics depend on
+_STATS_COLUMNS = (
+    "id",
+    "pair",
+    "is_short",
+    "open_date",
+    "close_date",
+    "close_profit",
+    "close_profit_abs",
+    "exit_reason",
+)
+
+
+class _ClosedTrade(NamedTuple):
+    id: int
+    pair: str
+    is_short: bool
+    open_date: datetime
+    close_date: datetime
+    close_profit: float | None
+    close_profit_abs: float | None
+    exit_reason: str | None
+
+
+def _outcome(profit_ratio: float) -> str:
+    if profit_ratio > 0:
+        return "wins"
+    elif profit_ratio < 0:
+        return "losses"
+    return "draws"
+
+
+def _relative_drawdown(high_value: float, cumulative: float, starting_balance: float) -> float:
+    # Same formula as data.metrics._calc_drawdown_series
+    max_balance = starting_balance + high_value if starting_balance else high_value
+    if max_balance == 0:
+        return nan if high_value == cumulative else inf
+    return (high_value - cumulative) / max_balance
+
+
+@dataclass
+class _ClosedTradeStats:
+    """
+    Running statistics of closed trades, fed in close date order.
+    Mirrors the calculations of RPC._rpc_trade_statistics, _rpc_stats and
+    data.metrics.calculate_max_drawdown without keeping the trades around.
+    """
+
+    trade_count: int = 0
+    first_trade: tuple[int, datetime] | None = None
+    latest_trade: tuple[int, datetime] | None = None
+    profit_abs: float = 0.0
+    profit_ratio: float = 0.0
+    duration: float = 0.0
+    # Win / loss by profit ratio (RPC._collect_trade_statistics_data)
+    winning_trades: int = 0
+    losing_trades: int = 0
+    winning_profit: float = 0.0
+    losing_profit: float = 0.0
+    # Win / loss by absolute profit (data.metrics.calculate_expectancy)
+    expectancy_wins: int = 0
+    expectancy_losses: int = 0
+    expectancy_win_sum: float = 0.0
+    expectancy_loss_sum: float = 0.0
+    pair_profit: dict[str, float] = field(default_factory=dict)
+    # Outcome per exit reason and outcome durations (RPC._rpc_stats)
+    exit_reasons: dict[str | None, dict[str, int]] = field(default_factory=dict)
+    outcome_durations: dict[str, list[float]] = field(
+        default_factory=lambda: {k: [0.0, 0] for k in ("wins", "draws", "losses")}
+    )
+    # Drawdown state
+    first_close_date: datetime | None = None
+    cumulative: float = 0.0
+    high_value: float = 0.0
+    peak_date: datetime | None = None
+    current_high_date: datetime | None = None
+    max_drawdown: float = 0.0
+    max_drawdown_high_date: datetime | None = None
+    max_drawdown_low_date: datetime | None = None
+    max_drawdown_high_value: float = 0.0
+    max_drawdown_low_value: float = 0.0
+
+    def add(self, trade: _ClosedTrade) -> None:
+        close_date = trade.close_date.replace(tzinfo=UTC)
+        profit_ratio = trade.close_profit or 0.0
+        profit_abs = trade.close_profit_abs or 0.0
+
+        self.trade_count += 1
+        if self.first_trade is None or trade.id < self.first_trade[0]:
+            self.first_trade = (trade.id, trade.open_date)
+        if self.latest_trade is None or trade.id > self.latest_trade[0]:
+            self.latest_trade = (trade.id, trade.open_date)
+        self.profit_abs += profit_abs
+        self.profit_ratio += profit_ratio
+        duration = (trade.close_date - trade.open_date).total_seconds()
+        self.duration += duration
+
+        if profit_ratio >= 0:
+            self.winning_trades += 1
+            self.winning_profit += profit_abs
+        else:
+            self.losing_trades += 1
+            self.losing_profit += profit_abs
+        if trade.close_profit_abs is not None and trade.close_profit_abs > 0:
+            self.expectancy_wins += 1
+            self.expectancy_win_sum += trade.close_profit_abs
+        elif trade.close_profit_abs is not None and trade.close_profit_abs < 0:
+            self.expectancy_losses += 1
+            self.expectancy_loss_sum += abs(trade.close_profit_abs)
+        self.pair_profit[trade.pair] = self.pair_profit.get(trade.pair, 0.0) + profit_abs
+
+        outcome = _outcome(profit_ratio)
+        reason = self.exit_reasons.setdefault(
+            trade.exit_reason, {"wins": 0, "losses": 0, "draws": 0}
+        )
+        reason[outcome] += 1
+        self.outcome_durations[outcome][0] += duration
+        self.outcome_durations[outcome][1] += 1
+
+        # Drawdown - the first trade's date stands in for the zero row's date
+        if self.first_close_date is None:
+            self.first_close_date = self.peak_date = close_date
+        self.current_high_date = self.peak_date
+        self.cumulative += profit_abs
+        if self.cumulative > self.high_value:
+            self.high_value = self.cumulative
+            self.peak_date = close_date
+        if self.cumulative - self.high_value < self.max_drawdown:
+            self.max_drawdown = self.cumulative - self.high_value
+            self.max_drawdown_high_date = self.peak_date
+            self.max_drawdown_low_date = close_date
+            self.max_drawdown_high_value = self.high_value
+            self.max_drawdown_low_value = self.cumulative
+
+    def best_pair(self) -> str | None:
+        if not self.pair_profit:
+            return None
+        return max(self.pair_profit.items(), key=lambda item: item[1])[0]
+
+    def expectancy(self) -> tuple[float, float]:
+        """
+        Same result as data.metrics.calculate_expectancy on the closed trades.
+        """
+        if self.trade_count == 0:
+            return 0.0, 100.0
+        average_win = self.expectancy_win_sum / self.expectancy_wins if self.expectancy_wins else 0
+        average_loss = (
+            self.expectancy_loss_sum / self.expectancy_losses if self.expectancy_losses else 0
+        )
+        winrate = self.expectancy_wins / self.trade_count
+        loserate = self.expectancy_losses / self.trade_count
+        expectancy = (winrate * average_win) - (loserate * average_loss)
+        expectancy_ratio = 100.0
+        if average_loss > 0:
+            expectancy_ratio = ((1 + average_win / average_loss) * winrate) - 1
+        return expectancy, expectancy_ratio
+
+    def drawdown(self, starting_balance: float) -> DrawDownResult:
+        """
+        Same result as data.metrics.calculate_max_drawdown on the closed trades.
+        """
+        if self.trade_count == 0:
+            return DrawDownResult()
+        if self.max_drawdown < 0:
+            high_date = self.max_drawdown_high_date
+            low_date = self.max_drawdown_low_date
+            relative = _relative_drawdown(
+                self.max_drawdown_high_value, self.max_drawdown_low_value, starting_balance
+            )
+        else:
+            # No drawdown at all - the zero row is the "drawdown"
+            high_date = low_date = self.first_close_date
+            relative = 0.0
+        return DrawDownResult(
+            drawdown_abs=abs(self.max_drawdown),
+            high_date=high_date,
+            low_date=low_date,
+            high_value=self.max_drawdown_high_value,
+            low_value=self.max_drawdown_low_value,
+            relative_account_drawdown=relative,
+            current_high_date=self.current_high_date,
+            current_high_value=self.high_value,
+            current_drawdown_abs=self.high_value - self.cumulative,
+            current_relative_account_drawdown=_relative_drawdown(
+                self.high_value, self.cumulative, starting_balance
+            ),
+        )
+
+
+class _StatisticsState:
+    """
+    Statistics of one database, split into all trades and per direction.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.valid = False
+        self.last_check = 0.0
+        self.last_key: tuple[datetime, int] | None = None
+        self.trade_ids: set[int] = set()
+        self.stats: dict[str | None, _ClosedTradeStats] = {}
+
+    def add(self, trade: _ClosedTrade) -> None:
+        self.trade_ids.add(trade.id)
+        self.last_key = (trade.close_date, trade.id)
+        for direction in (None, "short" if trade.is_short else "long"):
+            self.stats.setdefault(direction, _ClosedTradeStats()).add(trade)
+
+
+# One state per database engine - each trading account has its own
+_states: "WeakKeyDictionary[Engine, _StatisticsState]" = WeakKeyDictionary()
+
+
+def _closed_trades_query():
+    return (
+        select(*(getattr(Trade, c) for c in _STATS_COLUMNS))
+        .filter(Trade.is_open.is_(False), Trade.close_date.is_not(None))
+        .order_by(Trade.close_date, Trade.id)
+    )
+
+
+def _snapshot(trade: Trade) -> _ClosedTrade:
+    return _ClosedTrade(*(getattr(trade, c) for c in _STATS_COLUMNS))
+
+
+class TradeStatistics:
+    """
+    Materialized statistics of closed trades, used by the /profit and /stats endpoints.
+    Built once from the trades table, then updated with each committed trade close.
+    Changes which can't be applied incrementally (deleted or modified closed trades)
+    cause a rebuild on the next read.
+    """
+
+    @staticmethod
+    def register(session_maker: sessionmaker) -> None:
+        """
+        Track trade closes of sessions of this sessionmaker.
+        """
+        event.listen(session_maker, "after_flush", TradeStatistics._collect_changes)
+        event.listen(session_maker, "after_commit", TradeStatistics._apply_changes)
+        event.listen(session_maker, "after_rollback", TradeStatistics._discard_changes)
+
+    @staticmethod
+    def _collect_changes(session: Session, flush_context) -> None:
+        # trade id -> closed trade, or None if the trade is open (again) or deleted.
+        # The last snapshot within the transaction wins.
+        pending: dict[int, _ClosedTrade | None] = session.info.setdefault(_PENDING_STATS_KEY, {})
+        for obj in (*session.new, *session.dirty):
+            if not isinstance(obj, Trade):
+                continue
+            attrs = inspect(obj).attrs
+            if not obj.is_open and obj.close_date is not None:
+                if any(attrs[c].history.has_changes() for c in (*_STATS_COLUMNS, "is_open")):
+                    pending[obj.id] = _snapshot(obj)
+            elif attrs.is_open.history.has_changes():
+                pending[obj.id] = None
+        for obj in session.deleted:
+            if isinstance(obj, Trade):
+                pending[obj.id] = None
+
+    @staticmethod
+    def _apply_changes(session: Session) -> None:
+        pending = session.info.pop(_PENDING_STATS_KEY, None)
+        if not pending:
+            return
+        state = _states.get(session.get_bind())
+        if state is None:
+            return
+        with state.lock:
+            if not state.valid:
+                return
+            if any(trade_id in state.trade_ids for trade_id in pending):
+                # A counted trade changed, was re-opened or deleted
+                state.valid = False
+                return
+            closed = [t for t in pending.values() if t is not None]
+            for trade in sorted(closed, key=lambda t: (t.close_date, t.id)):
+                if state.last_key and (trade.close_date, trade.id) < state.last_key:
+                    # Out of order close - drawdown needs the full sequence
+                    state.valid = False
+                    return
+                state.add(trade)
+
+    @staticmethod
+    def _discard_changes(session: Session) -> None:
+        session.info.pop(_PENDING_STATS_KEY, None)
+
+    @staticmethod
+    def _rebuild(state: _StatisticsState) -> None:
+        start = time.perf_counter()
+        state.trade_ids = set()
+        state.last_key = None
+        state.stats = {}
+        for row in Trade.session.execute(_closed_trades_query()):
+            state.add(_ClosedTrade(*row))
+        state.valid = True
+        state.last_check = time.monotonic()
+        logger.debug(
+            f"Built statistics of {len(state.trade_ids)} closed trades "
+            f"in {time.perf_counter() - start:.3f}s."
+        )
+
+    @staticmethod
+    def _reconcile(state: _StatisticsState) -> None:
+        """
+        Compare closed trade count, highest id and profit sum with the trades table.
+        Catches changes made outside the ORM session (e.g. bulk updates or other processes).
+        """
+        state.last_check = time.monotonic()
+        count, max_id, profit_sum = Trade.session.execute(
+            select(
+                func.count(Trade.id),
+                func.max(Trade.id),
+                func.coalesce(func.sum(Trade.close_profit_abs), 0.0),
+            ).filter(Trade.is_open.is_(False), Trade.close_date.is_not(None))
+        ).one()
+        stats = state.stats.get(None, _ClosedTradeStats())
+        if (
+            count != len(state.trade_ids)
+            or (max_id or 0) != max(state.trade_ids, default=0)
+            or abs(profit_sum - stats.profit_abs) > 1e-6
+        ):
+            logger.info("Trade statistics out of sync with the database, rebuilding.")
+            state.valid = False
+
+    @staticmethod
+    def _get_state() -> _StatisticsState:
+        engine = Trade.session.get_bind()
+        state = _states.get(engine)
+        if state is None:
+            state = _states.setdefault(engine, _StatisticsState())
+        return state
+
+    @staticmethod
+    def _get_stats(direction: str | None) -> _ClosedTradeStats:
+        state = TradeStatistics._get_state()
+        with state.lock:
+            if state.valid and time.monotonic() - state.last_check > RECONCILE_INTERVAL:
+                TradeStatistics._reconcile(state)
+            if not state.valid:
+                TradeStatistics._rebuild(state)
+            stats = state.stats.get(direction, _ClosedTradeStats())
+            # Copy, so the result is not changed by trades closing meanwhile
+            return replace(
+                stats,
+                pair_profit=dict(stats.pair_profit),
+                exit_reasons={k: dict(v) for k, v in stats.exit_reasons.items()},
+                outcome_durations={k: list(v) for k, v in stats.outcome_durations.items()},
+            )
+
+    @staticmethod
+    def get_closed_trade_stats(
+        direction: str | None = None, starting_balance: float = 0.0
+    ) -> dict[str, Any]:
+        """
+        Profit statistics of all closed trades.
+        :param direction: "long" or "short" to limit to one direction. None for all trades.
+        :param starting_balance: Starting balance for relative drawdown calculation
+        :return: dict with closed trade aggregates, see RPC._rpc_trade_statistics
+        """
+        stats = TradeStatistics._get_stats(direction)
+        expectancy, expectancy_ratio = stats.expectancy()
+        return {
+            "trade_count": stats.trade_count,
+            "first_trade": stats.first_trade,
+            "latest_trade": stats.latest_trade,
+            "profit_abs": stats.profit_abs,
+            "profit_ratio_sum": stats.profit_ratio,
+            "duration_sum": stats.duration,
+            "winning_trades": stats.winning_trades,
+            "losing_trades": stats.losing_trades,
+            "winning_profit": stats.winning_profit,
+            "losing_profit": stats.losing_profit,
+            "best_pair": stats.best_pair(),
+            "expectancy": expectancy,
+            "expectancy_ratio": expectancy_ratio,
+            "drawdown": stats.drawdown(starting_balance),
+        }
+
+    @staticmethod
+    def get_outcome_stats() -> dict[str, Any]:
+        """
+        Wins / losses / draws per exit reason and average duration per outcome
+        of all closed trades.
+        """
+        stats = TradeStatistics._get_stats(None)
+        return {
+            "exit_reasons": stats.exit_reasons,
+            "durations": {
+                outcome: (total / count if count > 0 else None)
+                for outcome, (total, count) in stats.outcome_durations.items()
+            },
+        }
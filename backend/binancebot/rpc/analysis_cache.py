@@ -0,0 +1,170 @@
+"""
+Caches for RPC._rpc_analysed_history_full (the /pair_history endpoint).
+
+Resolved strategy instances are kept per strategy name, strategy and parameter file content
+and configuration - analysis results per strategy, pair, timeframe, timerange and version
+of the candle data. Concurrent identical requests share one calculation.
+"""
+
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from datetime import datetime
+from hashlib import blake2b
+from pathlib import Path
+from typing import TypeVar
+
+import rapidjson
+from cachetools import LRUCache
+from pandas import DataFrame
+
+from binancebot.constants import Config
+from binancebot.data.history import get_datahandler
+from binancebot.enums import CandleType
+from binancebot.exchange import timeframe_to_prev_date
+from binancebot.strategy.interface import IStrategy
+
+
+logger = logging.getLogger(__name__)
+
+STRATEGY_CACHE_SIZE = 8
+ANALYSIS_CACHE_SIZE = 32
+
+T = TypeVar("T")
+
+
+@dataclass
+class CachedStrategy:
+    strategy: IStrategy
+    key: Hashable
+    # Analysis mutates the strategy (dataprovider, hyperopt parameters) - one at a time
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    started: bool = False
+
+
+@dataclass(frozen=True)
+class CachedAnalysis:
+    strategy_name: str
+    dataframe: DataFrame
+    annotations: list
+    analyzed: datetime
+
+
+def _file_digest(file: Path | None) -> str | None:
+    if file is None or not file.is_file():
+        return None
+    return blake2b(file.read_bytes(), digest_size=16).hexdigest()
+
+
+def config_digest(config: Config) -> str:
+    # The timerange doesn't change the strategy - panning the chart reuses the instance
+    relevant = {k: v for k, v in config.items() if k != "timerange"}
+    try:
+        dumped = rapidjson.dumps(relevant, default=str, sort_keys=True)
+    except TypeError:
+        dumped = repr(relevant)
+    return blake2b(dumped.encode(), digest_size=16).hexdigest()
+
+
+def data_version(config: Config, pair: str, timeframe: str, live: bool) -> Hashable:
+    """
+    Changes whenever the candles of this pair may have changed - the last closed candle
+    for data from the exchange, the data file otherwise.
+    """
+    if live:
+        return timeframe_to_prev_date(timeframe)
+    candle_type = config.get("candle_type_def", CandleType.SPOT)
+    datahandler = get_datahandler(config["datadir"], config["dataformat_ohlcv"])
+    file = datahandler._pair_data_filename(config["datadir"], pair, timeframe, candle_type)
+    try:
+        stat = file.stat()
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class AnalysisCache:
+    _lock = threading.Lock()
+    _strategies: LRUCache = LRUCache(maxsize=STRATEGY_CACHE_SIZE)
+    _analyses: LRUCache = LRUCache(maxsize=ANALYSIS_CACHE_SIZE)
+    # Strategy file per strategy name and strategy_path, known after the first load
+    _strategy_files: dict[tuple[str, str | None], Path] = {}
+    _inflight: dict[Hashable, Future] = {}
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._strategies.clear()
+            cls._analyses.clear()
+            cls._strategy_files.clear()
+
+    @classmethod
+    def _single_flight(cls, cache: LRUCache, key: Hashable, compute: Callable[[], T]) -> T:
+        """
+        Value from the cache, or compute it - once, other callers asking for the same key
+        meanwhile wait for the result. Exceptions are raised to all of them, but not cached.
+        """
+        with cls._lock:
+            if key in cache:
+                return cache[key]
+            running = cls._inflight.get(key)
+            if running is None:
+                future: Future = Future()
+                cls._inflight[key] = future
+        if running is not None:
+            return running.result()
+
+        try:
+            value = compute()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(value)
+            with cls._lock:
+                cache[key] = value
+            return value
+        finally:
+            with cls._lock:
+                del cls._inflight[key]
+
+    @classmethod
+    def _strategy_key(cls, lookup: tuple[str, str | None], digest: str) -> Hashable:
+        file = cls._strategy_files.get(lookup)
+        params_file = file.with_suffix(".json") if file else None
+        return ("strategy", lookup, _file_digest(file), _file_digest(params_file), digest)
+
+    @classmethod
+    def strategy(cls, config: Config) -> CachedStrategy:
+        """
+        Resolved instance of the configured strategy. A changed strategy or parameter file
+        results in a new instance.
+        """
+        from binancebot.resolvers.strategy_resolver import StrategyResolver
+
+        lookup = (config["strategy"], config.get("strategy_path"))
+        # Before loading - the strategy resolver updates the configuration
+        digest = config_digest(config)
+        key = cls._strategy_key(lookup, digest)
+
+        def load() -> CachedStrategy:
+            strategy = StrategyResolver.load_strategy(config)
+            file = getattr(strategy, "__file__", None)
+            if file and lookup not in cls._strategy_files:
+                # First load of this strategy - cache it with the digest of its file
+                cls._strategy_files[lookup] = Path(file)
+                return CachedStrategy(strategy, cls._strategy_key(lookup, digest))
+            return CachedStrategy(strategy, key)
+
+        cached = cls._single_flight(cls._strategies, key, load)
+        if cached.key != key:
+            with cls._lock:
+                cls._strategies.pop(key, None)
+                cls._strategies[cached.key] = cached
+        return cached
+
+    @classmethod
+    def analysis(cls, key: Hashable, compute: Callable[[], CachedAnalysis]) -> CachedAnalysis:
+        return cls._single_flight(cls._analyses, ("analysis", key), compute)
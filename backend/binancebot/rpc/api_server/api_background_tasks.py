@@ -1,10 +1,12 @@
 import logging
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
 from binancebot.rpc.api_server.api_schemas import BackgroundTaskStatus
-from binancebot.rpc.api_server.webserver_bgwork import ApiBG
+from binancebot.rpc.api_server.deps import get_job_scheduler
+from binancebot.rpc.api_server.job_scheduler import JobScheduler
+from binancebot.rpc.api_server.webserver_bgwork import ApiBG, JobsContainer
 
 
 logger = logging.getLogger(__name__)
@@ -13,27 +15,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("/background", response_model=list[BackgroundTaskStatus], tags=["webserver"])
-def background_job_list():
-    return [
-        {
-            "job_id": jobid,
-            "job_category": job["category"],
-            "status": job["status"],
-            "running": job["is_running"],
-            "progress": job.get("progress"),
-            "progress_tasks": job.get("progress_tasks"),
-            "error": job.get("error", None),
-        }
-        for jobid, job in ApiBG.jobs.items()
-    ]
-
-
-@router.get("/background/{jobid}", response_model=BackgroundTaskStatus, tags=["webserver"])
-def background_job(jobid: str):
-    if not (job := ApiBG.jobs.get(jobid)):
-        raise HTTPException(status_code=404, detail="Job not found.")
-
+def _job_status(jobid: str, job: JobsContainer) -> dict:
     return {
         "job_id": jobid,
         "job_category": job["category"],
@@ -43,3 +25,26 @@ def background_job(jobid: str):
         "progress_tasks": job.get("progress_tasks"),
         "error": job.get("error", None),
     }
+
+
+@router.get("/background", response_model=list[BackgroundTaskStatus], tags=["webserver"])
+def background_job_list():
+    return [_job_status(jobid, job) for jobid, job in ApiBG.jobs.items()]
+
+
+@router.get("/background/{jobid}", response_model=BackgroundTaskStatus, tags=["webserver"])
+def background_job(jobid: str):
+    if not (job := ApiBG.jobs.get(jobid)):
+        raise HTTPException(status_code=404, detail="Job not found.")
+
+    return _job_status(jobid, job)
+
+
+@router.delete("/background/{jobid}", response_model=BackgroundTaskStatus, tags=["webserver"])
+def background_job_cancel(jobid: str, scheduler: JobScheduler = Depends(get_job_scheduler)):
+    if not (job := ApiBG.jobs.get(jobid)):
+        raise HTTPException(status_code=404, detail="Job not found.")
+    if not scheduler.cancel(jobid):
+        raise HTTPException(status_code=400, detail="Job is not queued or running.")
+
+    return _job_status(jobid, job)
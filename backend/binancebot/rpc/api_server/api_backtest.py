@@ -1,16 +1,17 @@
 import asyncio
 import logging
+import threading
 from copy import deepcopy
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
-from binancebot.configuration import remove_exchange_credentials
+from binancebot.configuration import TimeRange, remove_exchange_credentials
 from binancebot.configuration.config_validation import validate_config_consistency
-from binancebot.constants import Config
+from binancebot.constants import BACKTEST_CACHE_DEFAULT, Config
 from binancebot.data.btanalysis import (
     delete_backtest_result,
     get_backtest_market_change,
@@ -20,9 +21,10 @@ from binancebot.data.btanalysis import (
     update_backtest_metadata,
 )
 from binancebot.enums import BacktestState
-from binancebot.exceptions import ConfigurationError, DependencyException, OperationalException
+from binancebot.exceptions import DependencyException, OperationalException
 from binancebot.ft_types import get_BacktestResultType_default
 from binancebot.misc import deep_merge_dicts, is_file_in_dir
+from binancebot.optimize.backtest_caching import get_min_cached_backtest_date, get_strategy_run_id
 from binancebot.rpc.api_server.api_schemas import (
     BacktestHistoryEntry,
     BacktestMarketChange,
@@ -30,9 +32,9 @@ from binancebot.rpc.api_server.api_schemas import (
     BacktestRequest,
     BacktestResponse,
 )
-from binancebot.rpc.api_server.deps import get_config
+from binancebot.rpc.api_server.deps import get_config, get_job_scheduler
+from binancebot.rpc.api_server.job_scheduler import PROGRESS_INTERVAL, JobContext, JobScheduler
 from binancebot.rpc.api_server.webserver_bgwork import ApiBG
-from binancebot.rpc.rpc import RPCException
 
 
 logger = logging.getLogger(__name__)
@@ -41,103 +43,149 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-def __run_backtest_bg(btconfig: Config):
+# Backtesting of this worker process - reused by the next backtest with the same timeframe
+# and timerange, so the data isn't loaded again
+_bt: dict[str, Any] = {
+    "bt": None,
+    "data": None,
+    "timerange": None,
+    "last_config": {},
+}
+
+
+def __report_backtest_progress(context: JobContext, stop: threading.Event):
+    from binancebot.persistence import LocalTrade
+
+    while not stop.wait(PROGRESS_INTERVAL):
+        if not (bt := _bt["bt"]):
+            continue
+        if context.cancelled:
+            bt.abort = True
+        context.update(
+            step=bt.progress.action,
+            progress=bt.progress.progress,
+            trade_count=len(LocalTrade.bt_trades),
+        )
+
+
+def __run_backtest(context: JobContext, btconfig: Config) -> dict[str, Any]:
     from binancebot.data.metrics import combined_dataframes_with_rel_mean
     from binancebot.optimize.optimize_reports import generate_backtest_stats, store_backtest_results
     from binancebot.resolvers import StrategyResolver
 
     asyncio.set_event_loop(asyncio.new_event_loop())
+    stop = threading.Event()
+    threading.Thread(
+        target=__report_backtest_progress, args=(context, stop), daemon=True
+    ).start()
     try:
         # Reload strategy
-        lastconfig = ApiBG.bt["last_config"]
+        lastconfig = _bt["last_config"]
         strat = StrategyResolver.load_strategy(btconfig)
         validate_config_consistency(btconfig)
 
         if (
-            not ApiBG.bt["bt"]
+            not _bt["bt"]
             or lastconfig.get("timeframe") != strat.timeframe
             or lastconfig.get("timeframe_detail") != btconfig.get("timeframe_detail")
             or lastconfig.get("timerange") != btconfig["timerange"]
         ):
             from binancebot.optimize.backtesting import Backtesting
 
-            ApiBG.bt["bt"] = Backtesting(btconfig)
+            _bt["bt"] = Backtesting(btconfig)
         else:
-            ApiBG.bt["bt"].config = deep_merge_dicts(btconfig, ApiBG.bt["bt"].config)
-            ApiBG.bt["bt"].init_backtest()
+            _bt["bt"].config = deep_merge_dicts(btconfig, _bt["bt"].config)
+            _bt["bt"].init_backtest()
         # Only reload data if timeframe changed.
         if (
-            not ApiBG.bt["data"]
-            or not ApiBG.bt["timerange"]
+            not _bt["data"]
+            or not _bt["timerange"]
             or lastconfig.get("timeframe") != strat.timeframe
             or lastconfig.get("timerange") != btconfig["timerange"]
         ):
-            ApiBG.bt["data"], ApiBG.bt["timerange"] = ApiBG.bt["bt"].load_bt_data()
+            _bt["data"], _bt["timerange"] = _bt["bt"].load_bt_data()
 
         lastconfig["timerange"] = btconfig["timerange"]
         lastconfig["timeframe"] = strat.timeframe
         lastconfig["enable_protections"] = btconfig.get("enable_protections")
         lastconfig["dry_run_wallet"] = btconfig.get("dry_run_wallet")
 
-        ApiBG.bt["bt"].enable_protections = btconfig.get("enable_protections", False)
-        ApiBG.bt["bt"].strategylist = [strat]
-        ApiBG.bt["bt"].results = get_BacktestResultType_default()
-        ApiBG.bt["bt"].load_prior_backtest()
+        _bt["bt"].enable_protections = btconfig.get("enable_protections", False)
+        _bt["bt"].strategylist = [strat]
+        _bt["bt"].results = get_BacktestResultType_default()
+        _bt["bt"].load_prior_backtest()
 
-        ApiBG.bt["bt"].abort = False
+        _bt["bt"].abort = False
         strategy_name = strat.get_strategy_name()
-        if ApiBG.bt["bt"].results and strategy_name in ApiBG.bt["bt"].results["strategy"]:
+        if _bt["bt"].results and strategy_name in _bt["bt"].results["strategy"]:
             # When previous result hash matches - reuse that result and skip backtesting.
             logger.info(f"Reusing result of previous backtest for {strategy_name}")
         else:
-            min_date, max_date = ApiBG.bt["bt"].backtest_one_strategy(
-                strat, ApiBG.bt["data"], ApiBG.bt["timerange"]
+            min_date, max_date = _bt["bt"].backtest_one_strategy(
+                strat, _bt["data"], _bt["timerange"]
             )
 
-            ApiBG.bt["bt"].results = generate_backtest_stats(
-                ApiBG.bt["data"],
-                ApiBG.bt["bt"].all_bt_content,
+            _bt["bt"].results = generate_backtest_stats(
+                _bt["data"],
+                _bt["bt"].all_bt_content,
                 min_date=min_date,
                 max_date=max_date,
             )
 
             if btconfig.get("export", "none") == "trades":
-                combined_res = combined_dataframes_with_rel_mean(
-                    ApiBG.bt["data"], min_date, max_date
-                )
+                combined_res = combined_dataframes_with_rel_mean(_bt["data"], min_date, max_date)
                 fn = store_backtest_results(
                     btconfig,
-                    ApiBG.bt["bt"].results,
+                    _bt["bt"].results,
                     datetime.now().strftime("%Y-%m-%d_%H-%M-%S"),
                     market_change_data=combined_res,
                     strategy_files={
-                        s.get_strategy_name(): s.__file__ for s in ApiBG.bt["bt"].strategylist
+                        s.get_strategy_name(): s.__file__ for s in _bt["bt"].strategylist
                     },
                 )
-                ApiBG.bt["bt"].results["metadata"][strategy_name]["filename"] = str(fn.stem)
-                ApiBG.bt["bt"].results["metadata"][strategy_name]["strategy"] = strategy_name
-        ApiBG.bt["bt"].reset_backtest()
+                _bt["bt"].results["metadata"][strategy_name]["filename"] = str(fn.stem)
+                _bt["bt"].results["metadata"][strategy_name]["strategy"] = strategy_name
+        _bt["bt"].reset_backtest()
         logger.info("Backtest finished.")
+        return _bt["bt"].results
 
-    except ConfigurationError as e:
-        logger.error(f"Backtesting encountered a configuration Error: {e}")
-
-    except (Exception, OperationalException, DependencyException) as e:
-        logger.exception(f"Backtesting caused an error: {e}")
-        ApiBG.bt["bt_error"] = str(e)
+    except DependencyException:
+        # Raised by backtesting when aborted
+        context.check_cancelled()
+        raise
     finally:
-        ApiBG.bgtask_running = False
+        stop.set()
+
+
+def __result_cache_key(btconfig: Config) -> tuple[str | None, datetime | None]:
+    """
+    Run id of the backtest, and the oldest date of results which may be reused for it -
+    following backtest_cache like backtest results stored to disk.
+    """
+    from binancebot.resolvers import StrategyResolver
+
+    min_date = get_min_cached_backtest_date(
+        btconfig.get("backtest_cache", BACKTEST_CACHE_DEFAULT),
+        TimeRange.parse_timerange(btconfig.get("timerange")),
+    )
+    if min_date is None:
+        return None, None
+    try:
+        strategy = StrategyResolver.load_strategy(deepcopy(btconfig))
+    except (OperationalException, ImportError) as e:
+        # Errors are reported by the backtest job
+        logger.debug(f"Not reusing backtest results - strategy failed to load: {e}")
+        return None, None
+    return get_strategy_run_id(strategy), min_date
 
 
 @router.post("/backtest", response_model=BacktestResponse, tags=["webserver", "backtest"])
-async def api_start_backtest(
-    bt_settings: BacktestRequest, background_tasks: BackgroundTasks, config=Depends(get_config)
+def api_start_backtest(
+    bt_settings: BacktestRequest,
+    config=Depends(get_config),
+    scheduler: JobScheduler = Depends(get_job_scheduler),
 ):
-    ApiBG.bt["bt_error"] = None
-    """Start backtesting if not done so already"""
-    if ApiBG.bgtask_running:
-        raise RPCException("Bot Background task already running")
-
+    """Start backtesting - in a worker process, next to other running backtests"""
     if ":" in bt_settings.strategy:
         raise HTTPException(status_code=500, detail="base64 encoded strategies are not allowed.")
 
@@ -158,10 +206,11 @@ async def api_start_backtest(
     btconfig["dry_run"] = True
 
     # Start backtesting
-    # Initialize backtesting object
-
-    background_tasks.add_task(__run_backtest_bg, btconfig=btconfig)
-    ApiBG.bgtask_running = True
+    cache_key, cached_since = __result_cache_key(btconfig)
+    job_id = scheduler.submit(
+        "backtest", __run_backtest, btconfig, cache_key=cache_key, cached_since=cached_since
+    )
+    ApiBG.bt["job_id"] = job_id
 
     return {
         "status": "running",
@@ -169,30 +218,19 @@ async def api_start_backtest(
         "progress": 0,
         "step": str(BacktestState.STARTUP),
         "status_msg": "Backtest started",
+        "job_id": job_id,
     }
 
 
 @router.get("/backtest", response_model=BacktestResponse, tags=["webserver", "backtest"])
-def api_get_backtest():
+def api_get_backtest(job_id: str | None = None):
     """
     Get backtesting result.
     Returns Result after backtesting has been ran.
+    :param job_id: Backtest job, defaults to the last one started
     """
-    from binancebot.persistence import LocalTrade
-
-    if ApiBG.bgtask_running:
-        return {
-            "status": "running",
-            "running": True,
-            "step": (
-                ApiBG.bt["bt"].progress.action if ApiBG.bt["bt"] else str(BacktestState.STARTUP)
-            ),
-            "progress": ApiBG.bt["bt"].progress.progress if ApiBG.bt["bt"] else 0,
-            "trade_count": len(LocalTrade.bt_trades),
-            "status_msg": "Backtest running",
-        }
-
-    if not ApiBG.bt["bt"]:
+    job_id = job_id or ApiBG.bt["job_id"]
+    if not job_id or not (job := ApiBG.jobs.get(job_id)):
         return {
             "status": "not_started",
             "running": False,
@@ -200,13 +238,26 @@ def api_get_backtest():
             "progress": 0,
             "status_msg": "Backtest not yet executed",
         }
-    if ApiBG.bt["bt_error"]:
+
+    if job["status"] in ("pending", "running"):
+        return {
+            "status": "running",
+            "running": True,
+            "step": job.get("step", str(BacktestState.STARTUP)),
+            "progress": job["progress"] or 0,
+            "trade_count": job.get("trade_count", 0),
+            "status_msg": "Backtest running" if job["is_running"] else "Backtest queued",
+            "job_id": job_id,
+        }
+
+    if job["error"]:
         return {
             "status": "error",
             "running": False,
             "step": "",
             "progress": 0,
-            "status_msg": f"Backtest failed with {ApiBG.bt['bt_error']}",
+            "status_msg": f"Backtest failed with {job['error']}",
+            "job_id": job_id,
         }
 
     return {
@@ -215,27 +266,27 @@ def api_get_backtest():
         "status_msg": "Backtest ended",
         "step": "finished",
         "progress": 1,
-        "backtest_result": ApiBG.bt["bt"].results,
+        "backtest_result": job["result"],
+        "job_id": job_id,
     }
 
 
 @router.delete("/backtest", response_model=BacktestResponse, tags=["webserver", "backtest"])
 def api_delete_backtest():
     """Reset backtesting"""
-    if ApiBG.bgtask_running:
+    job_id = ApiBG.bt["job_id"]
+    if job_id and (job := ApiBG.jobs.get(job_id)) and job["status"] in ("pending", "running"):
         return {
             "status": "running",
             "running": True,
             "step": "",
             "progress": 0,
             "status_msg": "Backtest running",
+            "job_id": job_id,
         }
-    if ApiBG.bt["bt"]:
-        ApiBG.bt["bt"].cleanup()
-        del ApiBG.bt["bt"]
-        ApiBG.bt["bt"] = None
-        del ApiBG.bt["data"]
-        ApiBG.bt["data"] = None
+    if job_id:
+        ApiBG.jobs.pop(job_id, None)
+        ApiBG.bt["job_id"] = None
         logger.info("Backtesting reset")
     return {
         "status": "reset",
@@ -247,8 +298,9 @@ def api_delete_backtest():
 
 
 @router.get("/backtest/abort", response_model=BacktestResponse, tags=["webserver", "backtest"])
-def api_backtest_abort():
-    if not ApiBG.bgtask_running:
+def api_backtest_abort(scheduler: JobScheduler = Depends(get_job_scheduler)):
+    job_id = ApiBG.bt["job_id"]
+    if not job_id or not scheduler.cancel(job_id):
         return {
             "status": "not_running",
             "running": False,
@@ -256,13 +308,13 @@ def api_backtest_abort():
             "progress": 0,
             "status_msg": "Backtest ended",
         }
-    ApiBG.bt["bt"].abort = True
     return {
         "status": "stopping",
         "running": False,
         "step": "",
         "progress": 0,
         "status_msg": "Backtest ended",
+        "job_id": job_id,
     }
 
 
@@ -1,9 +1,18 @@
+import asyncio
 import logging
+import time
+from typing import Any
 
-import requests
+import httpx
+import orjson
+from cachetools import TTLCache
 from fastapi import APIRouter, HTTPException, Request
 from starlette.responses import Response
 
+from binancebot.enums import CandleType, TradingMode
+from binancebot.exchange import timeframe_to_msecs
+from binancebot.rpc.api_server.deps import get_rpc_optional
+
 
 logger = logging.getLogger(__name__)
 
@@ -17,20 +26,155 @@ ALLOWED_PATHS = {
     "api/v3/exchangeInfo",
     "api/v3/ping",
 }
+# (max entries, ttl in seconds) of the response cache per path
+CACHE_SETTINGS: dict[str, tuple[int, float]] = {
+    "api/v3/exchangeInfo": (4, 600),
+    "api/v3/ticker/24hr": (256, 5),
+    "api/v3/ticker/price": (256, 2),
+    "api/v3/klines": (512, 2),
+    "api/v3/ping": (1, 1),
+}
+# Klines ending in the past can no longer change
+HISTORIC_KLINES_CACHE: tuple[int, float] = (1024, 3600)
+
+# status code, body, content type
+ProxyResponse = tuple[int, bytes, str]
+
+
+class BinanceProxy:
+    """
+    Pooled, cached access to the public Binance REST API.
+    Identical requests in flight are coalesced into one upstream call, and successful
+    responses are cached for a path-specific time.
+    """
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        self._caches: dict[str, TTLCache] = {
+            path: TTLCache(maxsize=size, ttl=ttl) for path, (size, ttl) in CACHE_SETTINGS.items()
+        }
+        self._caches["klines_history"] = TTLCache(
+            maxsize=HISTORIC_KLINES_CACHE[0], ttl=HISTORIC_KLINES_CACHE[1]
+        )
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # Created lazily, so the client is bound to the webserver's event loop
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=BINANCE_BASE_URL,
+                timeout=httpx.Timeout(10, connect=5),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @staticmethod
+    def _cache_name(path: str, params: dict[str, str]) -> str:
+        if path == "api/v3/klines" and "endTime" in params:
+            try:
+                if int(params["endTime"]) < (time.time() - 60) * 1000:
+                    return "klines_history"
+            except ValueError:
+                pass
+        return path
+
+    async def get(self, path: str, params: dict[str, str]) -> ProxyResponse:
+        key = (path, tuple(sorted(params.items())))
+        cache = self._caches[self._cache_name(path, params)]
+        if (cached := cache.get(key)) is not None:
+            return cached
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch(path, params))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded - a disconnecting client must not cancel the request for everyone else
+        result = await asyncio.shield(task)
+        if result[0] == 200:
+            cache[key] = result
+        return result
+
+    async def _fetch(self, path: str, params: dict[str, str]) -> ProxyResponse:
+        timeout = 20 if path == "api/v3/exchangeInfo" else 10
+        resp = await self._get_client().get(f"/{path}", params=params, timeout=timeout)
+        content_type = resp.headers.get("content-type", "application/json")
+        return resp.status_code, resp.content, content_type
+
+
+_proxy = BinanceProxy()
+
+
+async def close_binance_proxy() -> None:
+    """Close pooled upstream connections - called on webserver shutdown."""
+    await _proxy.aclose()
+
+
+def _klines_from_bot_cache(params: dict[str, str]) -> bytes | None:
+    """
+    Serve a historic klines request from the running bot's candle cache.
+    Only requests ending at or before the last closed, cached candle can be served,
+    as the cache does not contain the running candle.
+    Rows contain open time, OHLCV and close time - the fields the web UI uses.
+    :return: JSON encoded klines, or None if the request can't be served from the cache.
+    """
+    rpc = get_rpc_optional()
+    if rpc is None or "startTime" in params or "endTime" not in params:
+        return None
+    exchange = rpc._binancebot.exchange
+    if exchange.trading_mode != TradingMode.SPOT:
+        return None
+    try:
+        end_time = int(params["endTime"])
+        limit = min(int(params.get("limit", 500)), 1000)
+        timeframe_ms = timeframe_to_msecs(params["interval"])
+    except (KeyError, ValueError):
+        return None
+    symbol = params.get("symbol")
+    pair = next(
+        (p for p, m in exchange.markets.items() if m.get("id") == symbol and m.get("spot")),
+        None,
+    )
+    if pair is None:
+        return None
+    candles = exchange.klines((pair, params["interval"], CandleType.SPOT), copy=False)
+    if candles.empty:
+        return None
+
+    open_ms = candles["date"].to_numpy(dtype="datetime64[ms]").astype("int64")
+    if open_ms[-1] + timeframe_ms - 1 < end_time:
+        # Candle containing endTime is not closed / not cached yet
+        return None
+    end_idx = int((open_ms <= end_time).sum())
+    if end_idx < limit:
+        return None
+    rows = candles.iloc[end_idx - limit : end_idx]
+    ohlcv = rows[["open", "high", "low", "close", "volume"]].to_numpy()
+    result: list[list[Any]] = [
+        [int(t), *(str(v) for v in values), int(t) + timeframe_ms - 1]
+        for t, values in zip(open_ms[end_idx - limit : end_idx], ohlcv, strict=True)
+    ]
+    return orjson.dumps(result)
 
 
 @router.get("/binance-proxy/{path:path}", include_in_schema=False)
-def binance_proxy(path: str, request: Request):
+async def binance_proxy(path: str, request: Request):
     if path not in ALLOWED_PATHS:
         raise HTTPException(status_code=404, detail="Not Found")
 
-    url = f"{BINANCE_BASE_URL}/{path}"
-    timeout = 20 if path == "api/v3/exchangeInfo" else 10
+    params = dict(request.query_params)
+    if path == "api/v3/klines" and (content := _klines_from_bot_cache(params)) is not None:
+        return Response(content=content, media_type="application/json")
+
     try:
-        resp = requests.get(url, params=dict(request.query_params), timeout=timeout)
-    except requests.RequestException as exc:
+        status_code, content, content_type = await _proxy.get(path, params)
+    except httpx.HTTPError as exc:
         logger.warning("Binance proxy failed: %s", exc)
         raise HTTPException(status_code=502, detail="Binance proxy error") from exc
 
-    content_type = resp.headers.get("content-type", "application/json")
-    return Response(content=resp.content, status_code=resp.status_code, media_type=content_type)
+    return Response(content=content, status_code=status_code, media_type=content_type)
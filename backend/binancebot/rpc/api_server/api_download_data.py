@@ -1,16 +1,15 @@
 import logging
 from copy import deepcopy
 
-from fastapi import APIRouter, BackgroundTasks, Depends
-from fastapi.exceptions import HTTPException
+from fastapi import APIRouter, Depends
 
 from binancebot.constants import Config
-from binancebot.exceptions import OperationalException
 from binancebot.persistence import FtNoDBContext
 from binancebot.rpc.api_server.api_pairlists import handleExchangePayload
 from binancebot.rpc.api_server.api_schemas import BgJobStarted, DownloadDataPayload
-from binancebot.rpc.api_server.deps import get_config, get_exchange
-from binancebot.rpc.api_server.webserver_bgwork import ApiBG
+from binancebot.rpc.api_server.deps import get_config, get_exchange, get_job_scheduler
+from binancebot.rpc.api_server.job_scheduler import JobContext, JobScheduler
+from binancebot.rpc.api_server.webserver_bgwork import ProgressTask
 from binancebot.util.progress_tracker import get_progress_tracker
 
 
@@ -20,40 +19,33 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["download-data", "webserver"])
 
 
-def __run_download(job_id: str, config_loc: Config):
-    try:
-        ApiBG.jobs[job_id]["is_running"] = True
-        from binancebot.data.history.history_utils import download_data
+def __run_download(context: JobContext, config_loc: Config):
+    from binancebot.data.history.history_utils import download_data
 
-        with FtNoDBContext():
-            exchange = get_exchange(config_loc)
+    with FtNoDBContext():
+        exchange = get_exchange(config_loc)
+        progress_tasks: dict[str, ProgressTask] = {}
 
-            def ft_callback(task) -> None:
-                ApiBG.jobs[job_id]["progress_tasks"][str(task.id)] = {
-                    "progress": task.completed,
-                    "total": task.total,
-                    "description": task.description,
-                }
+        def ft_callback(task) -> None:
+            context.check_cancelled()
+            progress_tasks[str(task.id)] = {
+                "progress": task.completed,
+                "total": task.total,
+                "description": task.description,
+            }
+            context.update(progress_tasks=progress_tasks)
 
-            pt = get_progress_tracker(ft_callback=ft_callback)
+        pt = get_progress_tracker(ft_callback=ft_callback)
 
-            download_data(config_loc, exchange, progress_tracker=pt)
-            ApiBG.jobs[job_id]["status"] = "success"
-    except (OperationalException, Exception) as e:
-        logger.exception(e)
-        ApiBG.jobs[job_id]["error"] = str(e)
-        ApiBG.jobs[job_id]["status"] = "failed"
-    finally:
-        ApiBG.jobs[job_id]["is_running"] = False
-        ApiBG.download_data_running = False
+        download_data(config_loc, exchange, progress_tracker=pt)
 
 
 @router.post("/download_data", response_model=BgJobStarted)
 def pairlists_evaluate(
-    payload: DownloadDataPayload, background_tasks: BackgroundTasks, config=Depends(get_config)
+    payload: DownloadDataPayload,
+    config=Depends(get_config),
+    scheduler: JobScheduler = Depends(get_job_scheduler),
 ):
-    if ApiBG.download_data_running:
-        raise HTTPException(status_code=400, detail="Data Download is already running.")
     config_loc = deepcopy(config)
     config_loc["stake_currency"] = ""
     config_loc["pairs"] = payload.pairs
@@ -66,19 +58,8 @@ def pairlists_evaluate(
 
     handleExchangePayload(payload, config_loc)
 
-    job_id = ApiBG.get_job_id()
-
-    ApiBG.jobs[job_id] = {
-        "category": "download_data",
-        "status": "pending",
-        "progress": None,
-        "progress_tasks": {},
-        "is_running": False,
-        "result": {},
-        "error": None,
-    }
-    background_tasks.add_task(__run_download, job_id, config_loc)
-    ApiBG.download_data_running = True
+    # Queued while another download is running
+    job_id = scheduler.submit("download_data", __run_download, config_loc)
 
     return {
         "status": "Data Download started in background.",
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from binancebot.configuration import validate_config_consistency
 from binancebot.rpc.api_server.api_pairlists import handleExchangePayload
 from binancebot.rpc.api_server.api_schemas import PairHistory, PairHistoryRequest
+from binancebot.rpc.api_server.columnar import ColumnarResponse, accepts_columnar
 from binancebot.rpc.api_server.deps import get_config, get_exchange
 from binancebot.rpc.rpc import RPC
 
@@ -24,6 +25,7 @@ def pair_history(
     AIMLmodel: str | None = None,
     config=Depends(get_config),
     exchange=Depends(get_exchange),
+    columnar: bool = Depends(accepts_columnar),
 ):
     # The initial call to this endpoint can be slow, as it may need to initialize
     # the exchange class.
@@ -38,13 +40,20 @@ def pair_history(
     )
     validate_config_consistency(config_loc)
     try:
-        return RPC._rpc_analysed_history_full(config_loc, pair, timeframe, exchange, None, False)
+        res = RPC._rpc_analysed_history_full(
+            config_loc, pair, timeframe, exchange, None, False, columnar
+        )
     except Exception as e:
         raise HTTPException(status_code=502, detail=str(e))
+    return ColumnarResponse(res) if columnar else res
 
 
 @router.post("/pair_history", response_model=PairHistory, tags=["candle data"])
-def pair_history_filtered(payload: PairHistoryRequest, config=Depends(get_config)):
+def pair_history_filtered(
+    payload: PairHistoryRequest,
+    config=Depends(get_config),
+    columnar: bool = Depends(accepts_columnar),
+):
     # The initial call to this endpoint can be slow, as it may need to initialize
     # the exchange class.
     config_loc = deepcopy(config)
@@ -64,14 +73,16 @@ def pair_history_filtered(payload: PairHistoryRequest, config=Depends(get_config
     validate_config_consistency(config_loc)
 
     try:
-        return RPC._rpc_analysed_history_full(
+        res = RPC._rpc_analysed_history_full(
             config_loc,
             payload.pair,
             payload.timeframe,
             exchange,
             payload.columns,
             payload.live_mode,
+            columnar,
         )
     except Exception as e:
         logger.exception("Error in pair_history_filtered")
         raise HTTPException(status_code=502, detail=str(e))
+    return ColumnarResponse(res) if columnar else res
@@ -1,12 +1,11 @@
 import logging
 from copy import deepcopy
 
-from fastapi import APIRouter, BackgroundTasks, Depends
+from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 
 from binancebot.constants import Config
 from binancebot.enums import CandleType
-from binancebot.exceptions import OperationalException
 from binancebot.persistence import FtNoDBContext
 from binancebot.rpc.api_server.api_schemas import (
     BgJobStarted,
@@ -15,7 +14,8 @@ from binancebot.rpc.api_server.api_schemas import (
     PairListsResponse,
     WhitelistEvaluateResponse,
 )
-from binancebot.rpc.api_server.deps import get_config, get_exchange
+from binancebot.rpc.api_server.deps import get_config, get_exchange, get_job_scheduler
+from binancebot.rpc.api_server.job_scheduler import JobContext, JobScheduler
 from binancebot.rpc.api_server.webserver_bgwork import ApiBG
 
 
@@ -47,38 +47,27 @@ def list_pairlists(config=Depends(get_config)):
     }
 
 
-def __run_pairlist(job_id: str, config_loc: Config):
-    try:
-        ApiBG.jobs[job_id]["is_running"] = True
-        from binancebot.plugins.pairlistmanager import PairListManager
-
-        with FtNoDBContext():
-            exchange = get_exchange(config_loc)
-            config_loc["candle_type_def"] = exchange._config["candle_type_def"]
-            pairlists = PairListManager(exchange, config_loc)
-            pairlists.refresh_pairlist()
-            ApiBG.jobs[job_id]["result"] = {
-                "method": pairlists.name_list,
-                "length": len(pairlists.whitelist),
-                "whitelist": pairlists.whitelist,
-            }
-            ApiBG.jobs[job_id]["status"] = "success"
-    except (OperationalException, Exception) as e:
-        logger.exception(e)
-        ApiBG.jobs[job_id]["error"] = str(e)
-        ApiBG.jobs[job_id]["status"] = "failed"
-    finally:
-        ApiBG.jobs[job_id]["is_running"] = False
-        ApiBG.pairlist_running = False
+def __run_pairlist(context: JobContext, config_loc: Config):
+    from binancebot.plugins.pairlistmanager import PairListManager
+
+    with FtNoDBContext():
+        exchange = get_exchange(config_loc)
+        config_loc["candle_type_def"] = exchange._config["candle_type_def"]
+        pairlists = PairListManager(exchange, config_loc)
+        pairlists.refresh_pairlist()
+        return {
+            "method": pairlists.name_list,
+            "length": len(pairlists.whitelist),
+            "whitelist": pairlists.whitelist,
+        }
 
 
 @router.post("/pairlists/evaluate", response_model=BgJobStarted, tags=["pairlists", "webserver"])
 def pairlists_evaluate(
-    payload: PairListsPayload, background_tasks: BackgroundTasks, config=Depends(get_config)
+    payload: PairListsPayload,
+    config=Depends(get_config),
+    scheduler: JobScheduler = Depends(get_job_scheduler),
 ):
-    if ApiBG.pairlist_running:
-        raise HTTPException(status_code=400, detail="Pairlist evaluation is already running.")
-
     config_loc = deepcopy(config)
     config_loc["stake_currency"] = payload.stake_currency
     config_loc["pairlists"] = payload.pairlists
@@ -86,19 +75,8 @@ def pairlists_evaluate(
     # TODO: overwrite blacklist? make it optional and fall back to the one in config?
     # Outcome depends on the UI approach.
     config_loc["exchange"]["pair_blacklist"] = payload.blacklist
-    # Random job id
-    job_id = ApiBG.get_job_id()
-
-    ApiBG.jobs[job_id] = {
-        "category": "pairlist",
-        "status": "pending",
-        "progress": None,
-        "is_running": False,
-        "result": {},
-        "error": None,
-    }
-    background_tasks.add_task(__run_pairlist, job_id, config_loc)
-    ApiBG.pairlist_running = True
+    # Queued while another evaluation is running
+    job_id = scheduler.submit("pairlist", __run_pairlist, config_loc)
 
     return {
         "status": "Pairlist evaluation started in background.",
@@ -370,6 +370,7 @@ class TradeResponse(BaseModel):
     trades_count: int
     offset: int
     total_trades: int
+    next_cursor: str | None = None
 
 
 ForceEnterResponse = RootModel[TradeSchema | StatusMsg]
@@ -593,6 +594,7 @@ class BacktestResponse(BaseModel):
     trade_count: float | None = None
     # TODO: Properly type backtestresult...
     backtest_result: dict[str, Any] | None = None
+    job_id: str | None = None
 
 
 # TODO: This is a copy of BacktestHistoryEntryType
@@ -649,6 +651,10 @@ class Health(BaseModel):
     bot_start_ts: int | None = None
     bot_startup: datetime | None = None
     bot_startup_ts: int | None = None
+    request_coalescing: dict[str, dict[str, int]] | None = None
+    rpc_queues: dict[str, dict[str, int]] | None = None
+    websocket: dict[str, Any] | None = None
+    response_cache: dict[str, int] | None = None
 
 
 class CustomDataEntry(BaseModel):
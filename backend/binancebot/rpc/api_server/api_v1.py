@@ -4,6 +4,7 @@ from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, Query
 from fastapi.exceptions import HTTPException
+from fastapi.responses import StreamingResponse
 
 from binancebot import __version__
 from binancebot.data.history import get_datahandler
@@ -55,7 +56,23 @@ from binancebot.rpc.api_server.api_schemas import (
     WhitelistResponse,
     ExchangeConfigPayload,
 )
-from binancebot.rpc.api_server.deps import get_config, get_exchange, get_rpc, get_rpc_optional
+from binancebot.rpc.api_server.columnar import ColumnarResponse, accepts_columnar
+from binancebot.rpc.api_server.deps import (
+    get_config,
+    get_exchange,
+    get_message_stream,
+    get_rpc,
+    get_rpc_optional,
+)
+from binancebot.rpc.api_server.response_cache import (
+    TOPIC_LOCKS,
+    TOPIC_LOOP,
+    TOPIC_TRADES,
+    TOPIC_WHITELIST,
+    ResponseCache,
+    cached_response,
+    candle_topic,
+)
 from binancebot.rpc.api_server.api_auth import http_basic_or_jwt_token
 from binancebot.rpc.rpc import RPCException
 
@@ -179,6 +196,7 @@ def version():
 
 
 @router.get("/balance", response_model=Balances, tags=["info"])
+@cached_response(TOPIC_TRADES, TOPIC_LOOP)
 def balance(
     rpc: RPC = Depends(get_rpc), 
     config=Depends(get_config),
@@ -214,6 +232,7 @@ def mix_tags(pair: str | None = None, rpc: RPC = Depends(get_rpc)):
 
 
 @router.get("/performance", response_model=list[PerformanceEntry], tags=["info"])
+@cached_response(TOPIC_TRADES)
 def performance(rpc: RPC = Depends(get_rpc), is_owner: bool = Depends(check_api_ownership)):
     if not is_owner:
         return []
@@ -221,6 +240,7 @@ def performance(rpc: RPC = Depends(get_rpc), is_owner: bool = Depends(check_api_
 
 
 @router.get("/profit", response_model=Profit, tags=["info"])
+@cached_response(TOPIC_TRADES, TOPIC_LOOP)
 def profit(
     rpc: RPC = Depends(get_rpc), 
     config=Depends(get_config),
@@ -305,6 +325,7 @@ def monthly(
 
 
 @router.get("/status", response_model=list[OpenTradeSchema], tags=["info"])
+@cached_response(TOPIC_TRADES, TOPIC_LOOP)
 def status(rpc: RPC = Depends(get_rpc), is_owner: bool = Depends(check_api_ownership)):
     if not is_owner:
         return []
@@ -316,6 +337,7 @@ def status(rpc: RPC = Depends(get_rpc), is_owner: bool = Depends(check_api_owner
 
 # Using the responsemodel here will cause a ~100% increase in response time (from 1s to 2s)
 # on big databases. Correct response model: response_model=TradeResponse,
+# The response is streamed - trades are read and encoded in batches.
 @router.get("/trades", tags=["info", "trading"])
 def trades(
     limit: int = Query(500, ge=1, description="Maximum number of different trades to return data"),
@@ -323,12 +345,31 @@ def trades(
     order_by_id: bool = Query(
         True, description="Sort trades by id (default: True). If False, sorts by latest timestamp"
     ),
+    cursor: str | None = Query(
+        None, description="Continue after a previous page - use next_cursor of that response"
+    ),
+    fields: str | None = Query(
+        None, description="Comma separated trade fields to return (default: all fields)"
+    ),
     rpc: RPC = Depends(get_rpc),
     is_owner: bool = Depends(check_api_ownership)
 ):
     if not is_owner:
-        return {"trades": [], "trades_count": 0, "offset": offset, "total_trades": 0}
-    return rpc._rpc_trade_history(limit, offset=offset, order_by_id=order_by_id)
+        return {
+            "trades": [],
+            "trades_count": 0,
+            "offset": offset,
+            "total_trades": 0,
+            "next_cursor": None,
+        }
+    field_list = [f.strip() for f in fields.split(",") if f.strip()] if fields else None
+    try:
+        content = rpc._rpc_trade_history_stream(
+            limit, offset=offset, order_by_id=order_by_id, cursor=cursor, fields=field_list
+        )
+    except RPCException as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return StreamingResponse(content, media_type="application/json")
 
 
 @router.get("/trade/{tradeid}", response_model=OpenTradeSchema, tags=["info", "trading"])
@@ -461,11 +502,13 @@ def blacklist_delete(pairs_to_delete: list[str] = Query([]), rpc: RPC = Depends(
 
 
 @router.get("/whitelist", response_model=WhitelistResponse, tags=["info", "pairlist"])
+@cached_response(TOPIC_WHITELIST)
 def whitelist(rpc: RPC = Depends(get_rpc)):
     return rpc._rpc_whitelist()
 
 
 @router.get("/locks", response_model=Locks, tags=["info", "locks"])
+@cached_response(TOPIC_LOCKS, TOPIC_LOOP)
 def locks(rpc: RPC = Depends(get_rpc)):
     return rpc._rpc_locks()
 
@@ -518,16 +561,32 @@ def reload_config(rpc: RPC = Depends(get_rpc), is_admin: bool = Depends(require_
 
 
 @router.get("/pair_candles", response_model=PairHistory, tags=["candle data"])
-def pair_candles(pair: str, timeframe: str, limit: int | None = None, rpc: RPC = Depends(get_rpc)):
-    return rpc._rpc_analysed_dataframe(pair, timeframe, limit, None)
+@cached_response(lambda kwargs: candle_topic(kwargs["pair"], kwargs["timeframe"]))
+def pair_candles(
+    pair: str,
+    timeframe: str,
+    limit: int | None = None,
+    rpc: RPC = Depends(get_rpc),
+    columnar: bool = Depends(accepts_columnar),
+):
+    res = rpc._rpc_analysed_dataframe(pair, timeframe, limit, None, columnar)
+    return ColumnarResponse(res) if columnar else res
 
 
 @router.post("/pair_candles", response_model=PairHistory, tags=["candle data"])
-def pair_candles_filtered(payload: PairCandlesRequest, rpc: RPC = Depends(get_rpc)):
+@cached_response(
+    lambda kwargs: candle_topic(kwargs["payload"].pair, kwargs["payload"].timeframe)
+)
+def pair_candles_filtered(
+    payload: PairCandlesRequest,
+    rpc: RPC = Depends(get_rpc),
+    columnar: bool = Depends(accepts_columnar),
+):
     # Advanced pair_candles endpoint with column filtering
-    return rpc._rpc_analysed_dataframe(
-        payload.pair, payload.timeframe, payload.limit, payload.columns
+    res = rpc._rpc_analysed_dataframe(
+        payload.pair, payload.timeframe, payload.limit, payload.columns, columnar
     )
+    return ColumnarResponse(res) if columnar else res
 
 
 @router.get("/plot_config", response_model=PlotConfig, tags=["candle data"])
@@ -690,8 +749,12 @@ def sysinfo():
 
 
 @router.get("/health", response_model=Health, tags=["info"])
-def health(rpc: RPC = Depends(get_rpc)):
-    return rpc.health()
+def health(rpc: RPC = Depends(get_rpc), message_stream=Depends(get_message_stream)):
+    res = rpc.health()
+    if message_stream:
+        res["websocket"] = message_stream.stats()
+    res["response_cache"] = ResponseCache.stats()
+    return res
 
 
 @router.post("/set_exchange_config", response_model=StatusMsg, tags=["botcontrol"])
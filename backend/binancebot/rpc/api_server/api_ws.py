@@ -12,6 +12,7 @@ from binancebot.rpc.api_server.api_auth import validate_ws_token
 from binancebot.rpc.api_server.deps import get_message_stream, get_rpc
 from binancebot.rpc.api_server.ws.channel import WebSocketChannel, create_channel
 from binancebot.rpc.api_server.ws.message_stream import MessageStream
+from binancebot.rpc.api_server.ws.serializer import serialize_message
 from binancebot.rpc.api_server.ws_schemas import (
     WSAnalyzedDFMessage,
     WSErrorMessage,
@@ -44,21 +45,25 @@ async def channel_reader(channel: WebSocketChannel, rpc: RPC):
 
 async def channel_broadcaster(channel: WebSocketChannel, message_stream: MessageStream):
     """
-    Iterate over messages in the message stream and send them
+    Send the messages of the message stream this channel is subscribed to.
+    Messages are serialized once for all channels, and queued per channel - messages
+    a slow channel can't keep up with are coalesced or dropped (api_server.ws_queue_policy).
     """
-    async for message, ts in message_stream:
-        if channel.subscribed_to(message.get("type")):
+    with message_stream.subscribe(channel.channel_id, channel.subscribed_to) as queue:
+        while True:
+            entry = await queue.get()
             # Log a warning if this channel is behind
             # on the message stream by a lot
-            if (time.time() - ts) > 60:
+            if (time.time() - entry.ts) > 60:
                 logger.warning(
-                    f"Channel {channel} is behind MessageStream by 1 minute,"
-                    " this can cause a memory leak if you see this message"
-                    " often, consider reducing pair list size or amount of"
-                    " consumers."
+                    f"Channel {channel} is behind MessageStream by 1 minute, "
+                    f"{queue.stats()['dropped']} messages dropped so far. "
+                    "Consider reducing pair list size or amount of consumers."
                 )
 
-            await channel.send(message, use_timeout=True)
+            await channel.send_serialized(
+                message_stream.serialize(entry, channel.columnar), use_timeout=True
+            )
 
 
 async def _process_consumer_request(request: dict[str, Any], channel: WebSocketChannel, rpc: RPC):
@@ -102,12 +107,20 @@ async def _process_consumer_request(request: dict[str, Any], channel: WebSocketC
         # Limit the amount of candles per dataframe to 'limit' or 1500
         limit = int(min(data.get("limit", 1500), 1500)) if data else None
         pair = data.get("pair", None) if data else None
+        if data and "format" in data:
+            # Also applies to the analyzed dataframes broadcast to this channel
+            channel.columnar = data["format"] == "columnar"
 
         # For every pair in the generator, send a separate message
         for message in rpc._ws_request_analyzed_df(limit, pair):
             # Format response
             response = WSAnalyzedDFMessage(data=message)
-            await channel.send(response.model_dump(exclude_none=True))
+            if channel.columnar:
+                await channel.send_serialized(
+                    serialize_message(response.model_dump(exclude_none=True), columnar=True)
+                )
+            else:
+                await channel.send(response.model_dump(exclude_none=True))
 
 
 @router.websocket("/message/ws")
@@ -0,0 +1,28 @@
+"""
+Column-oriented candle data responses (misc.dataframe_to_columns), negotiated with the
+Accept header. Plain JSON (a list of rows) stays the default.
+"""
+
+from typing import Any
+
+import orjson
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import Response
+
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.binancebot.columnar+json"
+
+
+def accepts_columnar(request: Request) -> bool:
+    """
+    Dependency - True if the client accepts the columnar encoding.
+    """
+    return COLUMNAR_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+class ColumnarResponse(Response):
+    media_type = COLUMNAR_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=jsonable_encoder, option=orjson.OPT_SERIALIZE_NUMPY)
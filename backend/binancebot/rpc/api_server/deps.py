@@ -8,6 +8,7 @@ from binancebot.constants import Config
 from binancebot.enums import RunMode
 from binancebot.persistence import Trade
 from binancebot.persistence.models import _request_id_ctx_var
+from binancebot.rpc.api_server.job_scheduler import BACKGROUND_WORKERS, JobScheduler
 from binancebot.rpc.api_server.webserver_bgwork import ApiBG
 from binancebot.rpc.rpc import RPC, RPCException
 
@@ -44,6 +45,15 @@ def get_api_config() -> dict[str, Any]:
     return ApiServer._config["api_server"]
 
 
+async def get_job_scheduler() -> JobScheduler:
+    # Created on first use - worker processes are only started for jobs
+    if not ApiBG.scheduler:
+        ApiBG.scheduler = JobScheduler(
+            get_api_config().get("background_workers", BACKGROUND_WORKERS)
+        )
+    return ApiBG.scheduler
+
+
 def _generate_exchange_key(config: Config) -> str:
     """
     Exchange key - used for caching the exchange object.
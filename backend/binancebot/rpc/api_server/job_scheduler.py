@@ -0,0 +1,288 @@
+"""
+Process pool for the background jobs of the webserver (backtests, data downloads, pairlist
+evaluations), so they don't compete with the API for the GIL and can run side by side.
+
+Jobs wait in a priority queue until a worker is free and the concurrency limit of their
+category allows them to start. Workers report progress and log records through a pipe
+(multiprocessing queue) into ApiBG.jobs, and check a cancellation flag in shared memory.
+"""
+
+import heapq
+import itertools
+import logging
+import multiprocessing
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime
+from logging.handlers import QueueHandler
+from typing import Any
+
+from cachetools import LRUCache
+
+from binancebot.exceptions import FreqtradeException
+from binancebot.rpc.api_server.webserver_bgwork import ApiBG
+from binancebot.util import dt_now
+
+
+logger = logging.getLogger(__name__)
+
+BACKGROUND_WORKERS = 2
+# Jobs of a category running at the same time, categories without limit use all workers
+CATEGORY_LIMITS: dict[str, int] = {"download_data": 1, "pairlist": 1}
+# Lower starts first - quick, interactive jobs before long running ones
+CATEGORY_PRIORITIES: dict[str, int] = {"pairlist": 0, "backtest": 1, "download_data": 2}
+RESULT_CACHE_SIZE = 16
+# Minimum interval of progress reports from workers
+PROGRESS_INTERVAL = 0.25
+
+
+class JobCancelled(FreqtradeException):
+    """
+    Raised in a worker when the job was cancelled.
+    """
+
+
+# State of worker processes, set up by _init_worker
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(updates: Any, cancel_flags: Any, log_level: int) -> None:
+    _worker["updates"] = updates
+    _worker["cancel_flags"] = cancel_flags
+    # Forward log records to the API process
+    root = logging.getLogger()
+    root.handlers = [QueueHandler(updates)]
+    root.setLevel(log_level)
+
+
+class JobContext:
+    """
+    Handed to jobs running in a worker process - reports progress, tells about cancellation.
+    """
+
+    def __init__(self, job_id: str, slot: int) -> None:
+        self.job_id = job_id
+        self._slot = slot
+        self._last_update = 0.0
+        # Dropped updates, applied with the result
+        self.unsent: dict[str, Any] = {}
+
+    @property
+    def cancelled(self) -> bool:
+        return bool(_worker["cancel_flags"][self._slot])
+
+    def check_cancelled(self) -> None:
+        if self.cancelled:
+            raise JobCancelled(f"Job {self.job_id} cancelled.")
+
+    def update(self, force: bool = False, **fields: Any) -> None:
+        """
+        Update fields of the job container (progress, progress_tasks, ...).
+        Frequent updates are dropped, unless forced.
+        """
+        now = time.monotonic()
+        self.unsent.update(fields)
+        if force or now - self._last_update >= PROGRESS_INTERVAL:
+            self._last_update = now
+            _worker["updates"].put((self.job_id, self.unsent))
+            self.unsent = {}
+
+
+def _run_job(func: Callable, job_id: str, slot: int, args: tuple) -> tuple[Any, dict[str, Any]]:
+    context = JobContext(job_id, slot)
+    context.update(force=True, is_running=True, status="running")
+    result = func(context, *args)
+    return result, context.unsent
+
+
+@dataclass(order=True)
+class _QueuedJob:
+    priority: int
+    seq: int
+    job_id: str = field(compare=False)
+    category: str = field(compare=False)
+    func: Callable = field(compare=False)
+    args: tuple = field(compare=False)
+    cache_key: str | None = field(compare=False)
+
+
+class JobScheduler:
+    def __init__(self, max_workers: int = BACKGROUND_WORKERS) -> None:
+        # Spawn - forking the multi-threaded API process isn't safe
+        self._mp_context = multiprocessing.get_context("spawn")
+        self._max_workers = max_workers
+        self._updates = self._mp_context.Queue()
+        self._cancel_flags = self._mp_context.Array("b", max_workers, lock=False)
+        self._executor = self._create_executor()
+
+        self._lock = threading.RLock()
+        self._seq = itertools.count()
+        self._pending: list[_QueuedJob] = []
+        # Slot (index of the cancellation flag) and executor of running jobs
+        self._running: dict[str, tuple[int, _QueuedJob, ProcessPoolExecutor]] = {}
+        self._free_slots = list(range(max_workers))
+        self._results: LRUCache = LRUCache(maxsize=RESULT_CACHE_SIZE)
+
+        self._reader = threading.Thread(
+            target=self._read_updates, name="bgjob_updates", daemon=True
+        )
+        self._reader.start()
+
+    def _create_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=self._mp_context,
+            initializer=_init_worker,
+            initargs=(
+                self._updates,
+                self._cancel_flags,
+                logging.getLogger().getEffectiveLevel(),
+            ),
+        )
+
+    def submit(
+        self,
+        category: str,
+        func: Callable,
+        *args: Any,
+        cache_key: str | None = None,
+        cached_since: datetime | None = None,
+        priority: int | None = None,
+    ) -> str:
+        """
+        Queue a job - func is called in a worker process with a JobContext and args,
+        and must be importable (a module level function).
+        :param cache_key: Reuse the result of an earlier job with this key
+        :param cached_since: Only reuse results finished after this date
+        :param priority: Lower starts first, defaults to the priority of the category
+        :return: job id
+        """
+        job_id = ApiBG.get_job_id()
+        ApiBG.jobs[job_id] = {
+            "category": category,  # type: ignore[typeddict-item]
+            "status": "pending",
+            "progress": None,
+            "progress_tasks": {},
+            "is_running": False,
+            "result": {},
+            "error": None,
+        }
+        with self._lock:
+            if cache_key and (cached := self._results.get(cache_key)):
+                finished, result = cached
+                if cached_since is None or finished >= cached_since:
+                    logger.info(f"Reusing result of job {cache_key} for {category} job {job_id}.")
+                    ApiBG.jobs[job_id].update(status="success", progress=1, result=result)
+                    return job_id
+            heapq.heappush(
+                self._pending,
+                _QueuedJob(
+                    CATEGORY_PRIORITIES.get(category, 0) if priority is None else priority,
+                    next(self._seq),
+                    job_id,
+                    category,
+                    func,
+                    args,
+                    cache_key,
+                ),
+            )
+            self._dispatch()
+        return job_id
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a queued or running job. Running jobs stop at their next check.
+        :return: False if the job is not queued or running
+        """
+        with self._lock:
+            for queued in self._pending:
+                if queued.job_id == job_id:
+                    self._pending.remove(queued)
+                    heapq.heapify(self._pending)
+                    if container := ApiBG.jobs.get(job_id):
+                        container.update(status="cancelled", error="Cancelled")
+                    return True
+            if job_id in self._running:
+                self._cancel_flags[self._running[job_id][0]] = 1
+                return True
+        return False
+
+    def running_jobs(self, category: str | None = None) -> int:
+        with self._lock:
+            return sum(
+                1 for _, job, _ in self._running.values() if category in (None, job.category)
+            )
+
+    def _dispatch(self) -> None:
+        """
+        Start queued jobs while workers are free, respecting the category limits.
+        """
+        with self._lock:
+            deferred = []
+            while self._free_slots and self._pending:
+                job = heapq.heappop(self._pending)
+                limit = CATEGORY_LIMITS.get(job.category)
+                if limit is not None and self.running_jobs(job.category) >= limit:
+                    deferred.append(job)
+                    continue
+                slot = self._free_slots.pop()
+                self._cancel_flags[slot] = 0
+                self._running[job.job_id] = (slot, job, self._executor)
+                future = self._executor.submit(_run_job, job.func, job.job_id, slot, job.args)
+                future.add_done_callback(lambda f, job=job: self._finished(job, f))
+            for job in deferred:
+                heapq.heappush(self._pending, job)
+
+    def _finished(self, job: _QueuedJob, future: Future) -> None:
+        with self._lock:
+            slot, _, executor = self._running.pop(job.job_id)
+            self._free_slots.append(slot)
+            container = ApiBG.jobs.get(job.job_id)
+            try:
+                result, unsent = future.result()
+            except JobCancelled:
+                updates: dict[str, Any] = {"status": "cancelled", "error": "Cancelled"}
+            except BrokenProcessPool as e:
+                logger.error(f"Worker of job {job.job_id} died: {e}")
+                updates = {"status": "failed", "error": f"Worker died: {e}"}
+                if executor is self._executor:
+                    # All jobs of a broken pool fail - replace it once
+                    executor.shutdown(wait=False)
+                    self._executor = self._create_executor()
+            except Exception as e:
+                logger.exception(f"Background job {job.job_id} ({job.category}) failed.")
+                updates = {"status": "failed", "error": str(e)}
+            else:
+                updates = {**unsent, "status": "success", "progress": 1, "result": result}
+                if job.cache_key:
+                    self._results[job.cache_key] = (dt_now(), result)
+            if container is not None:
+                container.update(updates)
+                container["is_running"] = False
+            self._dispatch()
+
+    def _read_updates(self) -> None:
+        while (item := self._updates.get()) is not None:
+            if isinstance(item, logging.LogRecord):
+                logging.getLogger(item.name).handle(item)
+                continue
+            job_id, fields = item
+            with self._lock:
+                # Reports arriving after the job finished are outdated
+                if job_id in self._running and (container := ApiBG.jobs.get(job_id)):
+                    container.update(fields)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for queued in self._pending:
+                if container := ApiBG.jobs.get(queued.job_id):
+                    container.update(status="cancelled", error="Cancelled")
+            self._pending.clear()
+            for slot in range(self._max_workers):
+                self._cancel_flags[slot] = 1
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._updates.put(None)
@@ -0,0 +1,249 @@
+"""
+Cache for the responses of read-heavy endpoints, validated with ETags.
+
+Responses depend on topics - trades, locks, the whitelist, the analyzed candles of a pair -
+with a generation counter each, increased by the events changing them (database commits,
+RPC messages). A response is reused, or answered with 304 Not Modified, until the
+generation of one of its topics changes.
+"""
+
+import inspect
+import logging
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Callable, Hashable
+from functools import wraps
+from hashlib import blake2b
+from typing import Any
+from uuid import uuid4
+
+import orjson
+from fastapi import Request
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from starlette.responses import Response
+
+from binancebot.enums import RPCMessageType
+from binancebot.persistence import Order, Trade
+from binancebot.persistence.pairlock import PairLock
+from binancebot.rpc.rpc_types import RPCSendMsg
+
+
+logger = logging.getLogger(__name__)
+
+# Cached responses, least recently used ones are dropped first
+RESPONSE_CACHE_SIZE = 256
+
+TOPIC_TRADES = "trades"
+TOPIC_LOCKS = "locks"
+TOPIC_WHITELIST = "whitelist"
+# Data changing with every bot iteration (current rates, expiring locks) - a time bucket
+# of internals.process_throttle_secs instead of an event
+TOPIC_LOOP = "loop"
+
+Topic = Hashable | Callable[[dict[str, Any]], Hashable]
+
+_PENDING_TOPICS_KEY = "response_cache_topics"
+
+
+def candle_topic(pair: str, timeframe: str) -> tuple[str, str, str]:
+    return ("candles", pair, timeframe)
+
+
+class ResponseCache:
+    enabled = True
+    loop_interval = 5
+
+    _lock = threading.Lock()
+    _generations: defaultdict[Hashable, int] = defaultdict(int)
+    _entries: OrderedDict[Hashable, tuple[str, bytes, str]] = OrderedDict()
+    # ETags don't match responses of a previous process
+    _instance_id = uuid4().hex
+    _stats = {"hits": 0, "misses": 0, "not_modified": 0}
+    _registered = False
+
+    @classmethod
+    def configure(cls, config: dict[str, Any]) -> None:
+        cls.enabled = config.get("api_server", {}).get("response_cache", True)
+        cls.loop_interval = max(config.get("internals", {}).get("process_throttle_secs", 5), 1)
+        if not cls._registered:
+            event.listen(Session, "after_flush", cls._collect_topics)
+            event.listen(Session, "after_commit", cls._commit_topics)
+            event.listen(Session, "after_rollback", cls._discard_topics)
+            cls._registered = True
+
+    @classmethod
+    def invalidate(cls, *topics: Hashable) -> None:
+        with cls._lock:
+            for topic in topics:
+                cls._generations[topic] += 1
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
+            cls._generations.clear()
+            cls._instance_id = uuid4().hex
+
+    @classmethod
+    def process_msg(cls, msg: RPCSendMsg) -> None:
+        """
+        Invalidate the topics changed by this RPC message
+        """
+        msg_type = msg.get("type")
+        if msg_type == RPCMessageType.ANALYZED_DF:
+            pair, timeframe, _ = msg["data"]["key"]  # type: ignore[typeddict-item]
+            cls.invalidate(candle_topic(pair, timeframe))
+        elif msg_type == RPCMessageType.NEW_CANDLE:
+            pair, timeframe, _ = msg["data"]  # type: ignore[typeddict-item]
+            cls.invalidate(candle_topic(pair, timeframe))
+        elif msg_type == RPCMessageType.WHITELIST:
+            cls.invalidate(TOPIC_WHITELIST)
+
+    @staticmethod
+    def _collect_topics(session: Session, flush_context) -> None:
+        topics: set[str] = session.info.setdefault(_PENDING_TOPICS_KEY, set())
+        for obj in (*session.new, *session.dirty, *session.deleted):
+            if isinstance(obj, Trade | Order):
+                topics.add(TOPIC_TRADES)
+            elif isinstance(obj, PairLock):
+                topics.add(TOPIC_LOCKS)
+
+    @classmethod
+    def _commit_topics(cls, session: Session) -> None:
+        if topics := session.info.pop(_PENDING_TOPICS_KEY, None):
+            cls.invalidate(*topics)
+
+    @staticmethod
+    def _discard_topics(session: Session) -> None:
+        session.info.pop(_PENDING_TOPICS_KEY, None)
+
+    @classmethod
+    def _versions(cls, topics: list[Hashable]) -> tuple:
+        with cls._lock:
+            return tuple(
+                int(time.time() // cls.loop_interval)
+                if topic == TOPIC_LOOP
+                else cls._generations[topic]
+                for topic in topics
+            )
+
+    @classmethod
+    def _etag(cls, key: Hashable, versions: tuple) -> str:
+        digest = blake2b(repr((cls._instance_id, key, versions)).encode(), digest_size=12)
+        return f'W/"{digest.hexdigest()}"'
+
+    @classmethod
+    def _get(cls, key: Hashable, etag: str) -> tuple[bytes, str] | None:
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None or entry[0] != etag:
+                return None
+            cls._entries.move_to_end(key)
+            return entry[1], entry[2]
+
+    @classmethod
+    def _put(cls, key: Hashable, etag: str, body: bytes, media_type: str) -> None:
+        with cls._lock:
+            cls._entries[key] = (etag, body, media_type)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > RESPONSE_CACHE_SIZE:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def _count(cls, stat: str) -> None:
+        with cls._lock:
+            cls._stats[stat] += 1
+
+    @classmethod
+    def stats(cls) -> dict[str, int]:
+        with cls._lock:
+            return {**cls._stats, "entries": len(cls._entries)}
+
+
+_adapters: dict[Any, TypeAdapter] = {}
+
+
+def _render(request: Request, result: Any) -> tuple[bytes, str] | None:
+    """
+    Serialize the endpoint result like FastAPI does with the route's response model.
+    None for responses which can't be cached (e.g. streamed).
+    """
+    if isinstance(result, Response):
+        body = getattr(result, "body", None)
+        if result.status_code != 200 or not isinstance(body, bytes):
+            return None
+        return body, result.media_type or "application/json"
+    model = request.scope["route"].response_model
+    if model is None:
+        return orjson.dumps(jsonable_encoder(result)), "application/json"
+    if model not in _adapters:
+        _adapters[model] = TypeAdapter(model)
+    adapter = _adapters[model]
+    value = adapter.validate_python(result, from_attributes=True)
+    return adapter.dump_json(value, by_alias=True), "application/json"
+
+
+def _key_value(value: Any) -> Hashable | None:
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    return None
+
+
+def cached_response(*topics: Topic):
+    """
+    Cache the responses of this (synchronous) endpoint until one of the topics changes.
+    Topics are topic names, or callables returning a topic from the endpoint arguments.
+    The cache key is the endpoint and its arguments of simple types (query parameters,
+    payloads, flags like the ownership check) - dependencies such as RPC are not part of it.
+    Use below the route decorator.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        def wrapper(*args, _cache_request: Request, **kwargs):
+            if not ResponseCache.enabled:
+                return func(*args, **kwargs)
+            key = (
+                func.__qualname__,
+                tuple((name, _key_value(value)) for name, value in sorted(kwargs.items())),
+            )
+            resolved = [topic(kwargs) if callable(topic) else topic for topic in topics]
+            etag = ResponseCache._etag(key, ResponseCache._versions(resolved))
+            headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+            if etag in _cache_request.headers.get("if-none-match", ""):
+                ResponseCache._count("not_modified")
+                return Response(status_code=304, headers=headers)
+            if cached := ResponseCache._get(key, etag):
+                ResponseCache._count("hits")
+                return Response(cached[0], media_type=cached[1], headers=headers)
+
+            ResponseCache._count("misses")
+            result = func(*args, **kwargs)
+            rendered = _render(_cache_request, result)
+            if rendered is None:
+                return result
+            # Stored with the versions from before the call - changes made meanwhile
+            # cause a new calculation on the next request
+            ResponseCache._put(key, etag, *rendered)
+            return Response(rendered[0], media_type=rendered[1], headers=headers)
+
+        wrapper.__signature__ = signature.replace(  # type: ignore[attr-defined]
+            parameters=[
+                *signature.parameters.values(),
+                inspect.Parameter(
+                    "_cache_request", inspect.Parameter.KEYWORD_ONLY, annotation=Request
+                ),
+            ]
+        )
+        return wrapper
+
+    return decorator
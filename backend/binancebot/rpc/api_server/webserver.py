@@ -10,10 +10,13 @@ from starlette.responses import JSONResponse
 
 from binancebot.configuration import running_in_docker
 from binancebot.constants import Config
+from binancebot.enums import RPCMessageType
 from binancebot.exceptions import OperationalException
+from binancebot.rpc.analysis_cache import AnalysisCache
+from binancebot.rpc.api_server.response_cache import ResponseCache
 from binancebot.rpc.api_server.uvicorn_threaded import UvicornServer
 from binancebot.rpc.api_server.webserver_bgwork import ApiBG
-from binancebot.rpc.api_server.ws.message_stream import MessageStream
+from binancebot.rpc.api_server.ws.message_stream import WS_QUEUE_SIZE, MessageStream
 from binancebot.rpc.rpc import RPC, RPCException, RPCHandler
 from binancebot.rpc.rpc_types import RPCSendMsg
 
@@ -62,6 +65,7 @@ class ApiServer(RPCHandler):
         ApiServer.__initialized = True
 
         api_config = self._config["api_server"]
+        ResponseCache.configure(self._config)
 
         self.app = FastAPI(
             title="Freqtrade API",
@@ -88,7 +92,12 @@ class ApiServer(RPCHandler):
         ApiServer._has_rpc = False
         del ApiServer._rpc
         ApiBG.exchanges = {}
+        if ApiBG.scheduler:
+            ApiBG.scheduler.shutdown()
+            ApiBG.scheduler = None
         ApiBG.jobs = {}
+        ResponseCache.clear()
+        AnalysisCache.clear()
         if self._server and not self._standalone:
             logger.info("Stopping API Server")
             # self._server.force_exit, self._server.should_exit = True, True
@@ -106,9 +115,17 @@ class ApiServer(RPCHandler):
         """
         Publish the message to the message stream
         """
+        ResponseCache.process_msg(msg)
         if ApiServer._message_stream:
             ApiServer._message_stream.publish(msg)
 
+    def has_subscribers(self, msg_type: RPCMessageType) -> bool:
+        """
+        Whether a websocket consumer subscribes to messages of this type
+        """
+        stream = ApiServer._message_stream
+        return stream is not None and stream.has_subscribers(msg_type)
+
     def handle_rpc_exception(self, request, exc):
         logger.error(f"API Error calling: {exc}")
         return JSONResponse(
@@ -195,14 +212,22 @@ class ApiServer(RPCHandler):
         as uvicorn
         """
         if not ApiServer._message_stream:
-            ApiServer._message_stream = MessageStream()
+            api_config = self._config.get("api_server", {})
+            ApiServer._message_stream = MessageStream(
+                queue_size=api_config.get("ws_queue_size", WS_QUEUE_SIZE),
+                policy=api_config.get("ws_queue_policy", "coalesce"),
+            )
 
     async def _api_shutdown_event(self):
         """
         Removes the MessageStream class on shutdown
+        and closes pooled upstream connections
         """
+        from binancebot.rpc.api_server.api_binance_proxy import close_binance_proxy
+
         if ApiServer._message_stream:
             ApiServer._message_stream = None
+        await close_binance_proxy()
 
     def start_api(self):
         """
@@ -1,4 +1,4 @@
-from typing import Any, Literal, NotRequired
+from typing import TYPE_CHECKING, Any, Literal, NotRequired
 from uuid import uuid4
 
 from typing_extensions import TypedDict
@@ -6,6 +6,10 @@ from typing_extensions import TypedDict
 from binancebot.exchange.exchange import Exchange
 
 
+if TYPE_CHECKING:
+    from binancebot.rpc.api_server.job_scheduler import JobScheduler
+
+
 class ProgressTask(TypedDict):
     progress: float
     total: float
@@ -13,35 +17,31 @@ class ProgressTask(TypedDict):
 
 
 class JobsContainer(TypedDict):
-    category: Literal["pairlist", "download_data"]
+    category: Literal["pairlist", "download_data", "backtest"]
     is_running: bool
     status: str
     progress: float | None
     progress_tasks: NotRequired[dict[str, ProgressTask]]
+    # Backtests only
+    step: NotRequired[str]
+    trade_count: NotRequired[int]
     result: Any
     error: str | None
 
 
 class ApiBG:
-    # Backtesting type: Backtesting
+    # Backtesting - job of the last backtest started
     bt: dict[str, Any] = {
-        "bt": None,
-        "data": None,
-        "timerange": None,
-        "last_config": {},
-        "bt_error": None,
+        "job_id": None,
     }
-    bgtask_running: bool = False
     # Exchange - only available in webserver mode.
     exchanges: dict[str, Exchange] = {}
 
-    # Generic background jobs
+    # Generic background jobs, run by the scheduler in worker processes
+    scheduler: "JobScheduler | None" = None
 
     # TODO: Change this to TTLCache
     jobs: dict[str, JobsContainer] = {}
-    # Pairlist evaluate things
-    pairlist_running: bool = False
-    download_data_running: bool = False
 
     @staticmethod
     def get_job_id() -> str:
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable
 from contextlib import asynccontextmanager
 from typing import Any
 from uuid import uuid4
@@ -50,6 +50,9 @@ class WebSocketChannel:
 
         # The subscribed message types
         self._subscriptions: list[str] = []
+        # Send analyzed dataframes column-oriented - set by an analyzed_df request
+        # with "format": "columnar"
+        self.columnar = False
 
         # Wrap the WebSocket in the Serializing class
         self._wrapped_ws = serializer_cls(self._websocket)
@@ -89,13 +92,25 @@ class WebSocketChannel:
         :param message: The message to send
         :param use_timeout: Enforce send high limit, defaults to False
         """
+        await self._send(self._wrapped_ws.send(message), use_timeout)
+
+    async def send_serialized(self, data: str, use_timeout: bool = False):
+        """
+        Send an already serialized message (as serialized by the channel's serializer).
+
+        :param data: The serialized message
+        :param use_timeout: Enforce send high limit, defaults to False
+        """
+        await self._send(self._websocket.send(data), use_timeout)
+
+    async def _send(self, coro: Awaitable, use_timeout: bool):
         try:
             _ = time.time()
             # If the send times out, it will raise
             # a TimeoutError and bubble up to the
             # message_endpoint to close the connection
             await asyncio.wait_for(
-                self._wrapped_ws.send(message),
+                coro,
                 timeout=self._send_high_limit if use_timeout else None,
             )
             total_time = time.time() - _
@@ -1,32 +1,189 @@
 import asyncio
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from typing import Any, Literal
+
+from binancebot.enums import NO_ECHO_MESSAGES, RPCMessageType
+from binancebot.rpc.api_server.ws.serializer import serialize_message
+from binancebot.rpc.rpc_dispatcher import coalesce_key, coalesce_messages
+
+
+# Messages queued per channel before messages are dropped
+WS_QUEUE_SIZE = 1000
+WSQueuePolicy = Literal["coalesce", "drop_oldest"]
+
+
+class StreamMessage:
+    """
+    A published message. Serialized once, when it's first sent, and shared by all channels.
+    """
+
+    __slots__ = ("_serialized", "message", "ts")
+
+    def __init__(self, message: dict[str, Any], ts: float) -> None:
+        self.message = message
+        self.ts = ts
+        # Serialized message, by columnar dataframe encoding
+        self._serialized: dict[bool, str] = {}
+
+    @property
+    def type(self) -> Any:
+        return self.message.get("type")
+
+
+class ChannelQueue:
+    """
+    Bounded send queue of one channel.
+    With the "coalesce" policy, market data messages (analyzed dataframes, new candles,
+    whitelist) replace queued messages with the same key - analyzed dataframe deltas are
+    merged - and are dropped first once the queue is full.
+    With "drop_oldest", the oldest messages are dropped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        accepts: Callable[[Any], bool],
+        max_size: int = WS_QUEUE_SIZE,
+        policy: WSQueuePolicy = "coalesce",
+    ) -> None:
+        self.name = name
+        self.accepts = accepts
+        self._max_size = max_size
+        self._coalesce = policy == "coalesce"
+        self._queue: OrderedDict[Hashable, StreamMessage] = OrderedDict()
+        self._droppable: OrderedDict[Hashable, None] = OrderedDict()
+        self._seq = 0
+        self._ready = asyncio.Event()
+        self._stats = {"sent": 0, "coalesced": 0, "dropped": 0}
+
+    def put(self, entry: StreamMessage) -> None:
+        key = None
+        if self._coalesce and entry.type in NO_ECHO_MESSAGES:
+            key = coalesce_key(entry.message)  # type: ignore[arg-type]
+        if key is not None and key in self._queue:
+            queued = self._queue[key]
+            message = coalesce_messages(queued.message, entry.message)  # type: ignore[arg-type]
+            if message is not entry.message:
+                # Merged analyzed dataframe delta - serialized for this channel only
+                entry = StreamMessage(message, queued.ts)  # type: ignore[arg-type]
+            self._queue[key] = entry
+            self._stats["coalesced"] += 1
+            return
+        if key is None:
+            self._seq += 1
+            key = self._seq
+        else:
+            self._droppable[key] = None
+        self._queue[key] = entry
+        if len(self._queue) > self._max_size:
+            if self._droppable:
+                dropped, _ = self._droppable.popitem(last=False)
+                del self._queue[dropped]
+            else:
+                self._queue.popitem(last=False)
+            self._stats["dropped"] += 1
+        self._ready.set()
+
+    async def get(self) -> StreamMessage:
+        while not self._queue:
+            self._ready.clear()
+            await self._ready.wait()
+        key, entry = self._queue.popitem(last=False)
+        self._droppable.pop(key, None)
+        self._stats["sent"] += 1
+        return entry
+
+    @property
+    def lag(self) -> float:
+        """
+        Seconds the oldest queued message has been waiting
+        """
+        if not self._queue:
+            return 0.0
+        return time.time() - next(iter(self._queue.values())).ts
+
+    def stats(self) -> dict[str, Any]:
+        return {**self._stats, "pending": len(self._queue), "lag": round(self.lag, 3)}
 
 
 class MessageStream:
     """
     A message stream for consumers to subscribe to,
     and for producers to publish to.
+    Each subscriber has its own bounded queue - a slow consumer only delays itself.
     """
 
-    def __init__(self):
+    def __init__(self, queue_size: int = WS_QUEUE_SIZE, policy: WSQueuePolicy = "coalesce"):
         self._loop = asyncio.get_running_loop()
-        self._waiter = self._loop.create_future()
+        self._loop_thread = threading.get_ident()
+        self._queue_size = queue_size
+        self._policy = policy
+        self._queues: list[ChannelQueue] = []
+        self._published = 0
+        self._serialized = 0
 
     def publish(self, message):
         """
-        Publish a message to this MessageStream
+        Publish a message to this MessageStream.
+        Can be called from any thread.
 
         :param message: The message to publish
         """
-        waiter, self._waiter = self._waiter, self._loop.create_future()
-        waiter.set_result((message, time.time(), self._waiter))
+        if threading.get_ident() == self._loop_thread:
+            self._publish(message, time.time())
+        else:
+            self._loop.call_soon_threadsafe(self._publish, message, time.time())
+
+    def _publish(self, message, ts: float) -> None:
+        self._published += 1
+        entry = StreamMessage(message, ts)
+        for queue in self._queues:
+            if queue.accepts(entry.type):
+                queue.put(entry)
+
+    def serialize(self, entry: StreamMessage, columnar: bool = False) -> str:
+        """
+        Serialized message - shared by all channels sending it.
+
+        :param columnar: Encode the dataframe of analyzed_df messages column-oriented
+        """
+        columnar = columnar and entry.type == RPCMessageType.ANALYZED_DF
+        if (data := entry._serialized.get(columnar)) is None:
+            data = entry._serialized[columnar] = serialize_message(entry.message, columnar)
+            self._serialized += 1
+        return data
+
+    @contextmanager
+    def subscribe(self, name: str, accepts: Callable[[Any], bool]) -> Iterator[ChannelQueue]:
+        """
+        Queue receiving the messages published while subscribed.
+
+        :param name: Name of the subscriber (for stats)
+        :param accepts: Filter by message type
+        """
+        queue = ChannelQueue(name, accepts, self._queue_size, self._policy)
+        self._queues.append(queue)
+        try:
+            yield queue
+        finally:
+            self._queues.remove(queue)
+
+    def has_subscribers(self, message_type: Any) -> bool:
+        """
+        Whether a subscriber accepts messages of this type. Can be called from any thread.
+        """
+        return any(queue.accepts(message_type) for queue in list(self._queues))
 
-    async def __aiter__(self):
+    def stats(self) -> dict[str, Any]:
         """
-        Iterate over the messages in the message stream
+        Messages published and serialized, and send queue stats per channel.
         """
-        waiter = self._waiter
-        while True:
-            # Shield the future from being cancelled by a task waiting on it
-            message, ts, waiter = await asyncio.shield(waiter)
-            yield message, ts
+        return {
+            "published": self._published,
+            "serialized": self._serialized,
+            "channels": {queue.name: queue.stats() for queue in list(self._queues)},
+        }
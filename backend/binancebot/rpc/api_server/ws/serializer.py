@@ -6,7 +6,12 @@ import orjson
 import rapidjson
 from pandas import DataFrame
 
-from binancebot.misc import dataframe_to_json, json_to_dataframe
+from binancebot.misc import (
+    columns_to_dataframe,
+    dataframe_to_columns,
+    dataframe_to_json,
+    json_to_dataframe,
+)
 from binancebot.rpc.api_server.ws.proxy import WebSocketProxy
 from binancebot.rpc.api_server.ws_schemas import WSMessageSchemaType
 
@@ -36,13 +41,23 @@ class WebSocketSerializer(ABC):
 
 class HybridJSONWebSocketSerializer(WebSocketSerializer):
     def _serialize(self, data) -> str:
-        return str(orjson.dumps(data, default=_json_default), "utf-8")
+        return serialize_message(data)
 
     def _deserialize(self, data: str):
         # RapidJSON expects strings
         return rapidjson.loads(data, object_hook=_json_object_hook)
 
 
+def serialize_message(data, columnar: bool = False) -> str:
+    """
+    Serialize a message as HybridJSONWebSocketSerializer does
+    :param columnar: Encode DataFrames column-oriented (misc.dataframe_to_columns)
+    """
+    return str(
+        orjson.dumps(data, default=_json_default_columnar if columnar else _json_default), "utf-8"
+    )
+
+
 # Support serializing pandas DataFrames
 def _json_default(z):
     if isinstance(z, DataFrame):
@@ -50,8 +65,16 @@ def _json_default(z):
     raise TypeError
 
 
+def _json_default_columnar(z):
+    if isinstance(z, DataFrame):
+        return {"__type__": "columnar", "__value__": dataframe_to_columns(z)}
+    raise TypeError
+
+
 # Support deserializing JSON to pandas DataFrames
 def _json_object_hook(z):
     if z.get("__type__") == "dataframe":
         return json_to_dataframe(z.get("__value__"))
+    if z.get("__type__") == "columnar":
+        return columns_to_dataframe(z.get("__value__"))
     return z
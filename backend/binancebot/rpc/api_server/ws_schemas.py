@@ -60,6 +60,9 @@ class WSAnalyzedDFMessage(WSMessageSchema):
         key: PairWithTimeframe
         df: DataFrame
         la: datetime
+        seq: int | None = None
+        base_seq: int | None = None
+        length: int | None = None
 
     type: RPCMessageType = RPCMessageType.ANALYZED_DF
     data: AnalyzedDFData
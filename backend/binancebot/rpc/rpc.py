@@ -4,16 +4,18 @@ This module contains class to define a RPC communications
 
 import logging
 from abc import abstractmethod
-from collections.abc import Generator, Sequence
+from collections.abc import Generator, Iterator, Sequence
 from datetime import UTC, date, datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
+import orjson
 import psutil
 from dateutil.relativedelta import relativedelta
 from dateutil.tz import tzlocal
-from numpy import inf, int64, isnan, mean, nan
+from numpy import inf, int64, isnan, nan
 from pandas import DataFrame, NaT
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session, noload
 
 from binancebot import __version__
 from binancebot.configuration.timerange import TimeRange
@@ -25,6 +27,7 @@ from binancebot.enums import (
     ExitCheckTuple,
     ExitType,
     MarketDirection,
+    RPCMessageType,
     SignalDirection,
     State,
     TradingMode,
@@ -33,7 +36,16 @@ from binancebot.exceptions import ExchangeError, PricingError
 from binancebot.exchange import Exchange, timeframe_to_minutes, timeframe_to_msecs
 from binancebot.exchange.exchange_utils import price_to_precision
 from binancebot.loggers import bufferHandler
-from binancebot.persistence import CustomDataWrapper, KeyValueStore, Order, PairLocks, Trade
+from binancebot.misc import dataframe_to_columns
+from binancebot.persistence import (
+    CustomDataWrapper,
+    DailyProfit,
+    KeyValueStore,
+    Order,
+    PairLocks,
+    Trade,
+    TradeStatistics,
+)
 from binancebot.persistence.models import PairLock, custom_data_rpc_wrapper
 from binancebot.plugins.pairlist.pairlist_helpers import expand_pairlist
 from binancebot.rpc.fiat_convert import CryptoToFiatConverter
@@ -53,6 +65,20 @@ from binancebot.wallets import PositionWallet, Wallet
 
 logger = logging.getLogger(__name__)
 
+# Trade fields calculated from the trade's orders
+TRADE_ORDER_FIELDS = frozenset(
+    {
+        "orders",
+        "open_fill_date",
+        "open_fill_timestamp",
+        "stoploss_last_update",
+        "stoploss_last_update_timestamp",
+        "has_open_orders",
+    }
+)
+TRADE_HISTORY_BATCH_SIZE = 500
+_CURSOR_EPOCH = datetime(1970, 1, 1)
+
 
 class RPCException(Exception):
     """
@@ -97,6 +123,10 @@ class RPCHandler:
     def send_msg(self, msg: RPCSendMsg) -> None:
         """Sends a message to all registered rpc modules"""
 
+    def has_subscribers(self, msg_type: RPCMessageType) -> bool:
+        """Whether the content of messages of this type is delivered to anyone"""
+        return False
+
 
 class RPC:
     """
@@ -393,29 +423,34 @@ class RPC:
         profit_units: dict[date, dict] = {}
         daily_stake = self._binancebot.wallets.get_total_stake_amount()
 
+        first_unit = start_date - time_offset(timescale - 1)
+        # One query for the whole period - profit per day, taken from the rollup table
+        profit_per_day = DailyProfit.get_profit_per_day(first_unit, start_date + time_offset(1))
+
+        def unit_start(day: date) -> date:
+            if timeunit == "weeks":
+                return day - timedelta(days=day.weekday())
+            if timeunit == "months":
+                return day.replace(day=1)
+            return day
+
+        unit_profit: dict[date, float] = {}
+        unit_trades: dict[date, int] = {}
+        for day, day_profit in profit_per_day.items():
+            unit = unit_start(day)
+            unit_profit[unit] = unit_profit.get(unit, 0.0) + day_profit["profit_abs"]
+            unit_trades[unit] = unit_trades.get(unit, 0) + day_profit["trade_count"]
+
         for day in range(timescale - 1, -1, -1):
             profitday = start_date - time_offset(day)
-            # Only query for necessary columns for performance reasons.
-            trades = Trade.session.execute(
-                select(Trade.close_profit_abs)
-                .filter(
-                    Trade.is_open.is_(False),
-                    Trade.close_date >= profitday,
-                    Trade.close_date < (profitday + time_offset(1)),
-                )
-                .order_by(Trade.close_date)
-            ).all()
-
-            curdayprofit = sum(
-                trade.close_profit_abs for trade in trades if trade.close_profit_abs is not None
-            )
+            curdayprofit = unit_profit.get(profitday, 0)
             # Calculate this periods starting balance
             daily_stake = daily_stake - curdayprofit
             profit_units[profitday] = {
                 "amount": curdayprofit,
                 "daily_stake": daily_stake,
                 "rel_profit": round(curdayprofit / daily_stake, 8) if daily_stake > 0 else 0,
-                "trades": len(trades),
+                "trades": unit_trades.get(profitday, 0),
             }
 
         data = [
@@ -441,22 +476,71 @@ class RPC:
             "data": data,
         }
 
-    def _rpc_trade_history(self, limit: int, offset: int = 0, order_by_id: bool = False) -> dict:
-        """Returns the X last trades"""
-        order_by: Any = Trade.id if order_by_id else Trade.close_date.desc()
+    @staticmethod
+    def _trade_history_query(
+        order_by_id: bool, cursor: str | None = None, fields: list[str] | None = None
+    ) -> Select:
+        """
+        Query closed trades for the trade history, starting after the given cursor.
+        :param order_by_id: Sort by trade id instead of latest close date
+        :param cursor: next_cursor of the previous page
+        :param fields: Trade fields to return - orders are only loaded when needed
+        """
+        query = Trade.get_trades_query([Trade.is_open.is_(False)])
+        if fields is not None and not TRADE_ORDER_FIELDS.intersection(fields):
+            query = query.options(noload(Trade.orders))
+        if order_by_id:
+            query = query.order_by(Trade.id)
+        else:
+            query = query.order_by(Trade.close_date.desc(), Trade.id.desc())
+        if not cursor:
+            return query
+        try:
+            if order_by_id:
+                return query.filter(Trade.id > int(cursor))
+            close_us, trade_id = (int(x) for x in cursor.split("_"))
+        except ValueError:
+            raise RPCException(f"Invalid cursor {cursor}.")
+        close_date = _CURSOR_EPOCH + timedelta(microseconds=close_us)
+        return query.filter(
+            (Trade.close_date < close_date)
+            | ((Trade.close_date == close_date) & (Trade.id < trade_id))
+        )
+
+    @staticmethod
+    def _trade_history_cursor(trade: Trade, order_by_id: bool) -> str:
+        if order_by_id or trade.close_date is None:
+            return str(trade.id)
+        return f"{(trade.close_date - _CURSOR_EPOCH) // timedelta(microseconds=1)}_{trade.id}"
+
+    @staticmethod
+    def _trade_history_json(trade: Trade, fields: list[str] | None) -> dict[str, Any]:
+        trade_json = trade.to_json()
+        if fields is None:
+            return trade_json
+        return {field: trade_json[field] for field in fields if field in trade_json}
+
+    def _rpc_trade_history(
+        self,
+        limit: int,
+        offset: int = 0,
+        order_by_id: bool = False,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> dict:
+        """
+        Returns the X last trades
+        :param cursor: Continue after the last trade of a previous call (keyset pagination).
+            Use `next_cursor` of the previous result.
+        :param fields: Only return these trade fields
+        """
         if limit:
-            trades = Trade.session.scalars(
-                Trade.get_trades_query([Trade.is_open.is_(False)])
-                .order_by(order_by)
-                .limit(limit)
-                .offset(offset)
-            )
+            query = self._trade_history_query(order_by_id, cursor, fields).limit(limit)
+            trades = Trade.session.scalars(query.offset(offset)).all()
         else:
-            trades = Trade.session.scalars(
-                Trade.get_trades_query([Trade.is_open.is_(False)]).order_by(Trade.close_date.desc())
-            )
+            trades = Trade.session.scalars(self._trade_history_query(False, fields=fields)).all()
 
-        output = [trade.to_json() for trade in trades]
+        output = [self._trade_history_json(trade, fields) for trade in trades]
         total_trades = Trade.session.scalar(
             select(func.count(Trade.id)).filter(Trade.is_open.is_(False))
         )
@@ -466,41 +550,77 @@ class RPC:
             "trades_count": len(output),
             "offset": offset,
             "total_trades": total_trades,
+            "next_cursor": (
+                self._trade_history_cursor(trades[-1], order_by_id)
+                if limit and len(trades) == limit
+                else None
+            ),
         }
 
-    def _rpc_stats(self) -> dict[str, Any]:
+    def _rpc_trade_history_stream(
+        self,
+        limit: int,
+        offset: int = 0,
+        order_by_id: bool = False,
+        cursor: str | None = None,
+        fields: list[str] | None = None,
+    ) -> Iterator[bytes]:
         """
-        Generate generic stats for trades in database
+        Same result as _rpc_trade_history, as JSON encoded chunks.
+        Trades are read in batches of TRADE_HISTORY_BATCH_SIZE with their own session,
+        so the iterator can be consumed after the request's session is closed.
         """
+        # Validate the cursor now and pick the active account's database
+        self._trade_history_query(order_by_id, cursor, fields)
+        engine = Trade.session.get_bind()
+
+        def encode(obj: Any) -> bytes:
+            return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY)
+
+        def stream() -> Iterator[bytes]:
+            batch_cursor = cursor
+            batch_offset = offset
+            count = 0
+            yield b'{"trades":['
+            while count < limit:
+                batch_size = min(TRADE_HISTORY_BATCH_SIZE, limit - count)
+                with Session(engine) as session:
+                    trades = session.scalars(
+                        self._trade_history_query(order_by_id, batch_cursor, fields)
+                        .limit(batch_size)
+                        .offset(batch_offset)
+                    ).all()
+                    chunk = b",".join(
+                        encode(self._trade_history_json(trade, fields)) for trade in trades
+                    )
+                if trades:
+                    yield (b"," if count else b"") + chunk
+                    count += len(trades)
+                    batch_cursor = self._trade_history_cursor(trades[-1], order_by_id)
+                    batch_offset = 0
+                if len(trades) < batch_size:
+                    batch_cursor = None
+                    break
+            with Session(engine) as session:
+                total_trades = session.scalar(
+                    select(func.count(Trade.id)).filter(Trade.is_open.is_(False))
+                )
+            yield b"]," + encode(
+                {
+                    "trades_count": count,
+                    "offset": offset,
+                    "total_trades": total_trades,
+                    "next_cursor": batch_cursor,
+                }
+            )[1:]
 
-        def trade_win_loss(trade):
-            if trade.close_profit > 0:
-                return "wins"
-            elif trade.close_profit < 0:
-                return "losses"
-            else:
-                return "draws"
-
-        trades = Trade.get_trades([Trade.is_open.is_(False)], include_orders=False)
-        # Duration
-        dur: dict[str, list[float]] = {"wins": [], "draws": [], "losses": []}
-        # Exit reason
-        exit_reasons = {}
-        for trade in trades:
-            if trade.exit_reason not in exit_reasons:
-                exit_reasons[trade.exit_reason] = {"wins": 0, "losses": 0, "draws": 0}
-            exit_reasons[trade.exit_reason][trade_win_loss(trade)] += 1
-
-            if trade.close_date is not None and trade.open_date is not None:
-                trade_dur = (trade.close_date - trade.open_date).total_seconds()
-                dur[trade_win_loss(trade)].append(trade_dur)
-
-        wins_dur = sum(dur["wins"]) / len(dur["wins"]) if len(dur["wins"]) > 0 else None
-        draws_dur = sum(dur["draws"]) / len(dur["draws"]) if len(dur["draws"]) > 0 else None
-        losses_dur = sum(dur["losses"]) / len(dur["losses"]) if len(dur["losses"]) > 0 else None
+        return stream()
 
-        durations = {"wins": wins_dur, "draws": draws_dur, "losses": losses_dur}
-        return {"exit_reasons": exit_reasons, "durations": durations}
+    def _rpc_stats(self) -> dict[str, Any]:
+        """
+        Generate generic stats for trades in database
+        """
+        return TradeStatistics.get_outcome_stats()
 
     def _collect_trade_statistics_data(
         self,
@@ -569,27 +689,83 @@ class RPC:
             "losing_profit": losing_profit,
         }
 
-    def _rpc_trade_statistics(
+    def _closed_trade_statistics(
         self,
         stake_currency: str,
         fiat_display_currency: str,
-        start_date: datetime | None = None,
-        direction: str | None = None,
+        direction: str | None,
+        dir_filter,
+        starting_balance: float,
     ) -> dict[str, Any]:
         """
-        Returns cumulative profit statistics, with optional direction filter (long/short)
+        Trade statistics summary from the materialized closed trade statistics.
+        Only open trades are loaded from the database.
         """
-        start_date = datetime.fromtimestamp(0) if start_date is None else start_date
+        closed = TradeStatistics.get_closed_trade_stats(direction, starting_balance)
+        open_filter = [Trade.is_open.is_(True)]
+        if dir_filter is not None:
+            open_filter.append(dir_filter)
+        open_trades: Sequence[Trade] = Trade.session.scalars(
+            Trade.get_trades_query(open_filter, include_orders=False).order_by(Trade.id)
+        ).all()
+        open_stats = self._collect_trade_statistics_data(
+            open_trades, stake_currency, fiat_display_currency
+        )
+
+        first_trades = [(t.id, t.open_date) for t in open_trades[:1]]
+        last_trades = [(t.id, t.open_date) for t in open_trades[-1:]]
+        if closed["first_trade"]:
+            first_trades.append(closed["first_trade"])
+            last_trades.append(closed["latest_trade"])
+
+        best_pair = None
+        if closed["best_pair"]:
+            best_pair_filters = [Trade.close_date > datetime.fromtimestamp(0)]
+            if dir_filter is not None:
+                best_pair_filters.append(dir_filter)
+            # Profit ratio needs the entry orders - only query them for the best pair
+            best_pair = Trade.get_best_pair(
+                [*best_pair_filters, Trade.pair == closed["best_pair"]]
+            ) or Trade.get_best_pair(best_pair_filters)
+
+        return {
+            "profit_closed_coin": closed["profit_abs"],
+            "profit_closed_ratio_sum": closed["profit_ratio_sum"],
+            "closed_trade_count": closed["trade_count"],
+            "profit_all_coin": closed["profit_abs"] + sum(open_stats["profit_all_coin"]),
+            "profit_all_ratio_sum": closed["profit_ratio_sum"]
+            + sum(open_stats["profit_all_ratio"]),
+            "profit_all_count": closed["trade_count"] + len(open_stats["profit_all_ratio"]),
+            "trade_count": closed["trade_count"] + len(open_trades),
+            "first_date": min(first_trades)[1].replace(tzinfo=UTC) if first_trades else None,
+            "last_date": max(last_trades)[1].replace(tzinfo=UTC) if last_trades else None,
+            "duration_sum": closed["duration_sum"] + sum(open_stats["durations"]),
+            "duration_count": closed["trade_count"] + len(open_stats["durations"]),
+            "best_pair": best_pair,
+            "winning_trades": closed["winning_trades"],
+            "losing_trades": closed["losing_trades"],
+            "winning_profit": closed["winning_profit"],
+            "losing_profit": closed["losing_profit"],
+            "expectancy": closed["expectancy"],
+            "expectancy_ratio": closed["expectancy_ratio"],
+            "drawdown": closed["drawdown"],
+        }
 
+    def _trade_statistics_from_trades(
+        self,
+        stake_currency: str,
+        fiat_display_currency: str,
+        start_date: datetime,
+        dir_filter,
+        starting_balance: float,
+    ) -> dict[str, Any]:
+        """
+        Trade statistics summary calculated from all trades matching the filter.
+        """
         trade_filter = (
             Trade.is_open.is_(False) & (Trade.close_date >= start_date)
         ) | Trade.is_open.is_(True)
-
-        if direction == "long":
-            dir_filter = Trade.is_short.is_(False)
-            trade_filter = trade_filter & dir_filter
-        elif direction == "short":
-            dir_filter = Trade.is_short.is_(True)
+        if dir_filter is not None:
             trade_filter = trade_filter & dir_filter
 
         trades: Sequence[Trade] = Trade.session.scalars(
@@ -598,55 +774,9 @@ class RPC:
 
         stats = self._collect_trade_statistics_data(trades, stake_currency, fiat_display_currency)
 
-        profit_all_coin = stats["profit_all_coin"]
-        profit_all_ratio = stats["profit_all_ratio"]
-        profit_closed_coin = stats["profit_closed_coin"]
-        profit_closed_ratio = stats["profit_closed_ratio"]
-        durations = stats["durations"]
-        winning_trades = stats["winning_trades"]
-        losing_trades = stats["losing_trades"]
-        winning_profit = stats["winning_profit"]
-        losing_profit = stats["losing_profit"]
-
-        closed_trade_count = len([t for t in trades if not t.is_open])
-
         best_pair_filters = [Trade.close_date > start_date]
-        trading_volume_filters = [Order.order_filled_date >= start_date]
-
-        if direction:
+        if dir_filter is not None:
             best_pair_filters.append(dir_filter)
-            trading_volume_filters.append(dir_filter)
-
-        best_pair = Trade.get_best_pair(best_pair_filters)
-        trading_volume = Trade.get_trading_volume(trading_volume_filters)
-
-        # Prepare data to display
-        profit_closed_coin_sum = round(sum(profit_closed_coin), 8)
-        profit_closed_ratio_mean = float(mean(profit_closed_ratio) if profit_closed_ratio else 0.0)
-        profit_closed_ratio_sum = sum(profit_closed_ratio) if profit_closed_ratio else 0.0
-
-        profit_closed_fiat = (
-            self._fiat_converter.convert_amount(
-                profit_closed_coin_sum, stake_currency, fiat_display_currency
-            )
-            if self._fiat_converter
-            else 0
-        )
-
-        profit_all_coin_sum = round(sum(profit_all_coin), 8)
-        profit_all_ratio_mean = float(mean(profit_all_ratio) if profit_all_ratio else 0.0)
-        # Doing the sum is not right - overall profit needs to be based on initial capital
-        profit_all_ratio_sum = sum(profit_all_ratio) if profit_all_ratio else 0.0
-        starting_balance = self._binancebot.wallets.get_starting_balance()
-        profit_closed_ratio_fromstart = 0.0
-        profit_all_ratio_fromstart = 0.0
-        if starting_balance:
-            profit_closed_ratio_fromstart = profit_closed_coin_sum / starting_balance
-            profit_all_ratio_fromstart = profit_all_coin_sum / starting_balance
-
-        profit_factor = winning_profit / abs(losing_profit) if losing_profit else float("inf")
-
-        winrate = (winning_trades / closed_trade_count) if closed_trade_count > 0 else 0
 
         trades_df = DataFrame(
             [
@@ -675,6 +805,105 @@ class RPC:
                 # ValueError if no losing trade.
                 pass
 
+        return {
+            "profit_closed_coin": sum(stats["profit_closed_coin"]),
+            "profit_closed_ratio_sum": sum(stats["profit_closed_ratio"]),
+            "closed_trade_count": len([t for t in trades if not t.is_open]),
+            "profit_all_coin": sum(stats["profit_all_coin"]),
+            "profit_all_ratio_sum": sum(stats["profit_all_ratio"]),
+            "profit_all_count": len(stats["profit_all_ratio"]),
+            "trade_count": len(trades),
+            "first_date": trades[0].open_date_utc if trades else None,
+            "last_date": trades[-1].open_date_utc if trades else None,
+            "duration_sum": sum(stats["durations"]),
+            "duration_count": len(stats["durations"]),
+            "best_pair": Trade.get_best_pair(best_pair_filters),
+            "winning_trades": stats["winning_trades"],
+            "losing_trades": stats["losing_trades"],
+            "winning_profit": stats["winning_profit"],
+            "losing_profit": stats["losing_profit"],
+            "expectancy": expectancy,
+            "expectancy_ratio": expectancy_ratio,
+            "drawdown": drawdown,
+        }
+
+    def _rpc_trade_statistics(
+        self,
+        stake_currency: str,
+        fiat_display_currency: str,
+        start_date: datetime | None = None,
+        direction: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Returns cumulative profit statistics, with optional direction filter (long/short)
+        Without start_date, closed trades are taken from the materialized trade statistics.
+        """
+        dir_filter = None
+        if direction == "long":
+            dir_filter = Trade.is_short.is_(False)
+        elif direction == "short":
+            dir_filter = Trade.is_short.is_(True)
+
+        starting_balance = self._binancebot.wallets.get_starting_balance()
+        if start_date is None:
+            start_date = datetime.fromtimestamp(0)
+            stats = self._closed_trade_statistics(
+                stake_currency, fiat_display_currency, direction, dir_filter, starting_balance
+            )
+        else:
+            stats = self._trade_statistics_from_trades(
+                stake_currency, fiat_display_currency, start_date, dir_filter, starting_balance
+            )
+
+        trading_volume_filters = [Order.order_filled_date >= start_date]
+        if dir_filter is not None:
+            trading_volume_filters.append(dir_filter)
+        trading_volume = Trade.get_trading_volume(trading_volume_filters)
+
+        closed_trade_count = stats["closed_trade_count"]
+        winning_trades = stats["winning_trades"]
+        losing_trades = stats["losing_trades"]
+        winning_profit = stats["winning_profit"]
+        losing_profit = stats["losing_profit"]
+        best_pair = stats["best_pair"]
+        drawdown: DrawDownResult = stats["drawdown"]
+
+        # Prepare data to display
+        profit_closed_coin_sum = round(stats["profit_closed_coin"], 8)
+        profit_closed_ratio_sum = stats["profit_closed_ratio_sum"]
+        profit_closed_ratio_mean = (
+            float(profit_closed_ratio_sum / closed_trade_count) if closed_trade_count else 0.0
+        )
+
+        profit_closed_fiat = (
+            self._fiat_converter.convert_amount(
+                profit_closed_coin_sum, stake_currency, fiat_display_currency
+            )
+            if self._fiat_converter
+            else 0
+        )
+
+        profit_all_coin_sum = round(stats["profit_all_coin"], 8)
+        # Doing the sum is not right - overall profit needs to be based on initial capital
+        profit_all_ratio_sum = stats["profit_all_ratio_sum"]
+        profit_all_ratio_mean = (
+            float(profit_all_ratio_sum / stats["profit_all_count"])
+            if stats["profit_all_count"]
+            else 0.0
+        )
+        profit_closed_ratio_fromstart = 0.0
+        profit_all_ratio_fromstart = 0.0
+        if starting_balance:
+            profit_closed_ratio_fromstart = profit_closed_coin_sum / starting_balance
+            profit_all_ratio_fromstart = profit_all_coin_sum / starting_balance
+
+        profit_factor = winning_profit / abs(losing_profit) if losing_profit else float("inf")
+
+        winrate = (winning_trades / closed_trade_count) if closed_trade_count > 0 else 0
+
+        expectancy = stats["expectancy"]
+        expectancy_ratio = stats["expectancy_ratio"]
+
         profit_all_fiat = (
             self._fiat_converter.convert_amount(
                 profit_all_coin_sum, stake_currency, fiat_display_currency
@@ -683,9 +912,9 @@ class RPC:
             else 0
         )
 
-        first_date = trades[0].open_date_utc if trades else None
-        last_date = trades[-1].open_date_utc if trades else None
-        num = float(len(durations) or 1)
+        first_date = stats["first_date"]
+        last_date = stats["last_date"]
+        num = float(stats["duration_count"] or 1)
         bot_start = KeyValueStore.get_datetime_value("bot_start_time")
         return {
             "profit_closed_coin": profit_closed_coin_sum,
@@ -704,7 +933,7 @@ class RPC:
             "profit_all_ratio": profit_all_ratio_fromstart,
             "profit_all_percent": round(profit_all_ratio_fromstart * 100, 2),
             "profit_all_fiat": profit_all_fiat,
-            "trade_count": len(trades),
+            "trade_count": stats["trade_count"],
             "closed_trade_count": closed_trade_count,
             "first_trade_date": format_date(first_date),
             "first_trade_humanized": dt_humanize_delta(first_date) if first_date else "",
@@ -712,7 +941,7 @@ class RPC:
             "latest_trade_date": format_date(last_date),
             "latest_trade_humanized": dt_humanize_delta(last_date) if last_date else "",
             "latest_trade_timestamp": dt_ts_def(last_date, 0),
-            "avg_duration": str(timedelta(seconds=sum(durations) / num)).split(".")[0],
+            "avg_duration": str(timedelta(seconds=stats["duration_sum"] / num)).split(".")[0],
             "best_pair": best_pair[0] if best_pair else "",
             "best_rate": round(best_pair[1] * 100, 2) if best_pair else 0,  # Deprecated
             "best_pair_profit_ratio": best_pair[1] if best_pair else 0,
@@ -1469,7 +1698,13 @@ class RPC:
         last_analyzed: datetime,
         selected_cols: list[str] | None,
         annotations: list,
+        columnar: bool = False,
     ) -> dict[str, Any]:
+        """
+        Dataframe in Dict form, as returned by the candle data endpoints
+        :param columnar: Return `data` column-oriented (misc.dataframe_to_columns)
+                         instead of a list of rows
+        """
         has_content = len(dataframe) != 0
         dataframe_columns = list(dataframe.columns)
         signals = {
@@ -1493,15 +1728,18 @@ class RPC:
                     signals[sig_type] = int(mask.sum())
                     dataframe.loc[mask, f"_{sig_type}_signal_close"] = dataframe.loc[mask, "close"]
 
-            # band-aid until this is fixed:
-            # https://github.com/pandas-dev/pandas/issues/45836
-            datetime_types = ["datetime", "datetime64", "datetime64[ns, UTC]"]
-            date_columns = dataframe.select_dtypes(include=datetime_types)
-            for date_column in date_columns:
-                # replace NaT with `None`
-                dataframe[date_column] = dataframe[date_column].astype(object).replace({NaT: None})
+            if not columnar:
+                # band-aid until this is fixed:
+                # https://github.com/pandas-dev/pandas/issues/45836
+                datetime_types = ["datetime", "datetime64", "datetime64[ns, UTC]"]
+                date_columns = dataframe.select_dtypes(include=datetime_types)
+                for date_column in date_columns:
+                    # replace NaT with `None`
+                    dataframe[date_column] = (
+                        dataframe[date_column].astype(object).replace({NaT: None})
+                    )
 
-            dataframe = dataframe.replace({inf: None, -inf: None, nan: None})
+                dataframe = dataframe.replace({inf: None, -inf: None, nan: None})
 
         res = {
             "pair": pair,
@@ -1510,7 +1748,7 @@ class RPC:
             "strategy": strategy,
             "all_columns": dataframe_columns,
             "columns": list(dataframe.columns),
-            "data": dataframe.values.tolist(),
+            "data": dataframe_to_columns(dataframe) if columnar else dataframe.values.tolist(),
             "length": len(dataframe),
             "buy_signals": signals["enter_long"],  # Deprecated
             "sell_signals": signals["exit_long"],  # Deprecated
@@ -1538,7 +1776,12 @@ class RPC:
         return res
 
     def _rpc_analysed_dataframe(
-        self, pair: str, timeframe: str, limit: int | None, selected_cols: list[str] | None
+        self,
+        pair: str,
+        timeframe: str,
+        limit: int | None,
+        selected_cols: list[str] | None,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         """Analyzed dataframe in Dict form"""
 
@@ -1553,6 +1796,7 @@ class RPC:
             last_analyzed,
             selected_cols,
             annotations,
+            columnar,
         )
 
     def __rpc_analysed_dataframe_raw(
@@ -1584,15 +1828,19 @@ class RPC:
         :param pairlist: A list of pairs to get
         :param limit: If an integer, limits the size of dataframe
                       If a list of string date times, only returns those candles
-        :returns: A generator of dictionaries with the key, dataframe, and last analyzed timestamp
+        :returns: A generator of dictionaries with the key, dataframe, last analyzed timestamp
+                  and the sequence number of the last ANALYZED_DF message of the pair
         """
         timeframe = self._binancebot.config["timeframe"]
         candle_type = self._binancebot.config.get("candle_type_def", CandleType.SPOT)
 
         for pair in pairlist:
+            key = (pair, timeframe, candle_type)
+            # Sequence number first - the dataframe is at least as new as this message
+            seq = self._binancebot.dataprovider._get_emitted_seq(key)
             dataframe, last_analyzed = self.__rpc_analysed_dataframe_raw(pair, timeframe, limit)
 
-            yield {"key": (pair, timeframe, candle_type), "df": dataframe, "la": last_analyzed}
+            yield {"key": key, "df": dataframe, "la": last_analyzed, "seq": seq}
 
     def _ws_request_analyzed_df(self, limit: int | None = None, pair: str | None = None):
         """Historical Analyzed Dataframes for WebSocket"""
@@ -1612,6 +1860,7 @@ class RPC:
         exchange: Exchange,
         selected_cols: list[str] | None,
         live: bool,
+        columnar: bool = False,
     ) -> dict[str, Any]:
         """
         Analyzed dataframe in Dict form, with full history loading and strategy analysis.
@@ -1623,65 +1872,96 @@ class RPC:
         from binancebot.data.converter import trim_dataframe
         from binancebot.data.dataprovider import DataProvider
         from binancebot.persistence.usedb_context import FtNoDBContext
-        from binancebot.resolvers.strategy_resolver import StrategyResolver
+        from binancebot.rpc.analysis_cache import (
+            AnalysisCache,
+            CachedAnalysis,
+            config_digest,
+            data_version,
+        )
 
         with FtNoDBContext():
-            strategy_name = ""
-            startup_candles = 0
-            if config.get("strategy"):
-                strategy = StrategyResolver.load_strategy(config)
-                startup_candles = strategy.startup_candle_count
-                strategy_name = strategy.get_strategy_name()
-
-            if live:
-                data = exchange.get_historic_ohlcv(
-                    pair=pair,
-                    timeframe=timeframe,
-                    since_ms=timerange_parsed.startts * 1000
-                    if timerange_parsed.startts
-                    else dt_ts(dt_now() - timedelta(days=30)),
-                    is_new_pair=True,  # history is never available - so always treat as new pair
-                    candle_type=config.get("candle_type_def", CandleType.SPOT),
-                    until_ms=timerange_parsed.stopts,
-                )
-            else:
-                _data = load_data(
-                    datadir=config["datadir"],
-                    pairs=[pair],
-                    timeframe=timeframe,
-                    timerange=timerange_parsed,
-                    data_format=config["dataformat_ohlcv"],
-                    candle_type=config.get("candle_type_def", CandleType.SPOT),
-                    startup_candles=startup_candles,
-                )
-                if pair not in _data:
-                    raise RPCException(
-                        f"No data for {pair}, {timeframe} in {config.get('timerange')} found."
+            # Before resolving the strategy, which updates the configuration
+            digest = config_digest(config)
+            cached_strategy = AnalysisCache.strategy(config) if config.get("strategy") else None
+
+            def analyze() -> CachedAnalysis:
+                strategy_name = ""
+                startup_candles = 0
+                if cached_strategy:
+                    strategy = cached_strategy.strategy
+                    startup_candles = strategy.startup_candle_count
+                    strategy_name = strategy.get_strategy_name()
+
+                if live:
+                    data = exchange.get_historic_ohlcv(
+                        pair=pair,
+                        timeframe=timeframe,
+                        since_ms=timerange_parsed.startts * 1000
+                        if timerange_parsed.startts
+                        else dt_ts(dt_now() - timedelta(days=30)),
+                        # history is never available - so always treat as new pair
+                        is_new_pair=True,
+                        candle_type=config.get("candle_type_def", CandleType.SPOT),
+                        until_ms=timerange_parsed.stopts,
                     )
-                data = _data[pair]
+                else:
+                    _data = load_data(
+                        datadir=config["datadir"],
+                        pairs=[pair],
+                        timeframe=timeframe,
+                        timerange=timerange_parsed,
+                        data_format=config["dataformat_ohlcv"],
+                        candle_type=config.get("candle_type_def", CandleType.SPOT),
+                        startup_candles=startup_candles,
+                    )
+                    if pair not in _data:
+                        raise RPCException(
+                            f"No data for {pair}, {timeframe} in {config.get('timerange')} found."
+                        )
+                    data = _data[pair]
+
+                annotations = []
+                if cached_strategy:
+                    with cached_strategy.lock:
+                        strategy.dp = DataProvider(config, exchange=exchange, pairlists=None)
+                        if not cached_strategy.started:
+                            strategy.ft_bot_start()
+                            cached_strategy.started = True
+                        df_analyzed = strategy.analyze_ticker(data, {"pair": pair})
+                        df_analyzed = trim_dataframe(
+                            df_analyzed, timerange_parsed, startup_candles=startup_candles
+                        )
+                        annotations = strategy.ft_plot_annotations(
+                            pair=pair, dataframe=df_analyzed
+                        )
 
-            annotations = []
-            if config.get("strategy"):
-                strategy.dp = DataProvider(config, exchange=exchange, pairlists=None)
-                strategy.ft_bot_start()
+                else:
+                    df_analyzed = data
 
-                df_analyzed = strategy.analyze_ticker(data, {"pair": pair})
-                df_analyzed = trim_dataframe(
-                    df_analyzed, timerange_parsed, startup_candles=startup_candles
-                )
-                annotations = strategy.ft_plot_annotations(pair=pair, dataframe=df_analyzed)
+                return CachedAnalysis(strategy_name, df_analyzed, annotations, dt_now())
 
-            else:
-                df_analyzed = data
+            analysis = AnalysisCache.analysis(
+                (
+                    cached_strategy.key if cached_strategy else None,
+                    digest,
+                    pair,
+                    timeframe,
+                    config.get("timerange"),
+                    live,
+                    data_version(config, pair, timeframe, live),
+                ),
+                analyze,
+            )
 
             return RPC._convert_dataframe_to_dict(
-                strategy_name,
+                analysis.strategy_name,
                 pair,
                 timeframe,
-                df_analyzed.copy(),
-                dt_now(),
+                analysis.dataframe.copy(),
+                analysis.analyzed,
                 selected_cols,
-                annotations,
+                analysis.annotations,
+                columnar,
             )
 
     def _rpc_plot_config(self) -> dict[str, Any]:
@@ -1711,9 +1991,9 @@ class RPC:
             "ram_pct": psutil.virtual_memory().percent,
         }
 
-    def health(self) -> dict[str, str | int | None]:
+    def health(self) -> dict[str, Any]:
         last_p = self._binancebot.last_process
-        res: dict[str, None | str | int] = {
+        res: dict[str, Any] = {
             "last_process": None,
             "last_process_loc": None,
             "last_process_ts": None,
@@ -1750,6 +2030,8 @@ class RPC:
                     "bot_startup_ts": int(bot_startup.timestamp()),
                 }
             )
+        res["request_coalescing"] = self._binancebot.exchange.coalescing_stats()
+        res["rpc_queues"] = self._binancebot.rpc.queue_stats()
 
         return res
 
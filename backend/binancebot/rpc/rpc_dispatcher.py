@@ -0,0 +1,151 @@
+"""
+Asynchronous delivery of RPC messages
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+
+from binancebot.enums import NO_ECHO_MESSAGES, RPCMessageType
+from binancebot.misc import apply_dataframe_delta
+from binancebot.rpc.rpc_types import RPCSendMsg
+
+
+logger = logging.getLogger(__name__)
+
+# Messages queued per dispatcher before market data messages are dropped
+RPC_QUEUE_SIZE = 1000
+
+
+def coalesce_key(msg: RPCSendMsg) -> Hashable | None:
+    """
+    Messages with the same key replace each other while queued - only the latest one
+    is delivered. None for messages which must be delivered one by one.
+    """
+    msg_type = msg.get("type")
+    if msg_type == RPCMessageType.WHITELIST:
+        return (msg_type,)
+    if msg_type == RPCMessageType.ANALYZED_DF:
+        return (msg_type, *msg["data"]["key"])  # type: ignore[typeddict-item]
+    if msg_type == RPCMessageType.NEW_CANDLE:
+        return (msg_type, *msg["data"])  # type: ignore[typeddict-item]
+    return None
+
+
+def coalesce_messages(queued: RPCSendMsg, msg: RPCSendMsg) -> RPCSendMsg:
+    """
+    Message replacing a queued message with the same coalesce_key.
+    Analyzed dataframe deltas are merged - the result applies on top of the
+    dataframe the queued delta was based on.
+    """
+    if msg.get("type") == RPCMessageType.ANALYZED_DF:
+        queued_data, data = queued["data"], msg["data"]  # type: ignore[typeddict-item]
+        if "base_seq" in queued_data and "base_seq" in data:
+            merged = apply_dataframe_delta(queued_data["df"], data["df"], data["length"])
+            return {  # type: ignore[return-value]
+                **msg,
+                "data": {**data, "df": merged, "base_seq": queued_data["base_seq"]},
+            }
+    return msg
+
+
+class RPCDispatcher:
+    """
+    Delivers messages to a handler on a worker thread - senders only enqueue.
+    The queue is bounded for market data messages (NO_ECHO_MESSAGES): queued ones are
+    replaced by newer messages with the same key, and the oldest are dropped once
+    max_size messages are queued. Other messages (trades, warnings, status) are never dropped.
+    """
+
+    def __init__(
+        self, name: str, handler: Callable[[RPCSendMsg], None], max_size: int = RPC_QUEUE_SIZE
+    ) -> None:
+        self.name = name
+        self._handler = handler
+        self._max_size = max_size
+        self._queue: OrderedDict[Hashable, RPCSendMsg] = OrderedDict()
+        # Queue keys of the messages which may be dropped, oldest first
+        self._droppable: OrderedDict[Hashable, None] = OrderedDict()
+        self._seq = itertools.count()
+        self._busy = False
+        self._running = True
+        self._cond = threading.Condition()
+        self._stats = {"sent": 0, "delivered": 0, "coalesced": 0, "dropped": 0}
+        self._thread = threading.Thread(name=f"rpc_{name}", target=self._run, daemon=True)
+        self._thread.start()
+
+    def put(self, msg: RPCSendMsg) -> None:
+        with self._cond:
+            self._stats["sent"] += 1
+            key = coalesce_key(msg) if msg.get("type") in NO_ECHO_MESSAGES else None
+            if key is None:
+                self._queue[next(self._seq)] = msg
+            elif key in self._queue:
+                self._queue[key] = coalesce_messages(self._queue[key], msg)
+                self._stats["coalesced"] += 1
+            else:
+                self._queue[key] = msg
+                self._droppable[key] = None
+                if len(self._queue) > self._max_size:
+                    dropped, _ = self._droppable.popitem(last=False)
+                    del self._queue[dropped]
+                    self._stats["dropped"] += 1
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._running and not self._queue:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                key, msg = self._queue.popitem(last=False)
+                self._droppable.pop(key, None)
+                self._busy = True
+            try:
+                self._handler(msg)
+            except Exception:
+                logger.exception(f"Exception while delivering RPC message to {self.name}")
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._stats["delivered"] += 1
+                    self._cond.notify_all()
+
+    def join(self, timeout: float) -> bool:
+        """
+        Wait until all queued messages are delivered.
+        :return: False if messages are still pending after timeout seconds
+        """
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while self._queue or self._busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._thread.is_alive():
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def stop(self, timeout: float) -> None:
+        """
+        Deliver the queued messages (for up to timeout seconds) and stop the worker.
+        """
+        if not self.join(timeout):
+            logger.warning(f"Dropping {self.pending} undelivered RPC messages for {self.name}.")
+        with self._cond:
+            self._running = False
+            self._queue.clear()
+            self._droppable.clear()
+            self._cond.notify_all()
+        self._thread.join(timeout)
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {**self._stats, "pending": len(self._queue)}
@@ -4,15 +4,20 @@ This module contains class to manage RPC communications (API, ...)
 
 import logging
 from collections import deque
+from functools import partial
 
 from binancebot.constants import Config
 from binancebot.enums import NO_ECHO_MESSAGES, RPCMessageType
 from binancebot.rpc import RPC, RPCHandler
+from binancebot.rpc.rpc_dispatcher import RPC_QUEUE_SIZE, RPCDispatcher
 from binancebot.rpc.rpc_types import RPCSendMsg
 
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for queued messages to be delivered on shutdown
+RPC_FLUSH_TIMEOUT = 5
+
 
 class RPCManager:
     """
@@ -24,6 +29,11 @@ class RPCManager:
         self.registered_modules: list[RPCHandler] = []
         self._rpc = RPC(binancebot)
         config = binancebot.config
+        self._queue_size = config.get("internals", {}).get("rpc_queue_size", RPC_QUEUE_SIZE)
+        # Messages are logged and handed to the modules on a worker thread.
+        # Each module gets its own queue - a slow module doesn't hold up the others.
+        self._dispatcher = RPCDispatcher("manager", self._dispatch, self._queue_size)
+        self._module_dispatchers: dict[str, RPCDispatcher] = {}
 
         # Enable local rest api server for cmd line control
         if config.get("api_server", {}).get("enabled", False):
@@ -37,6 +47,10 @@ class RPCManager:
     def cleanup(self) -> None:
         """Stops all enabled rpc modules"""
         logger.info("Cleaning up rpc modules ...")
+        # Deliver pending messages (e.g. the shutdown notification) first
+        self._dispatcher.stop(RPC_FLUSH_TIMEOUT)
+        for dispatcher in self._module_dispatchers.values():
+            dispatcher.stop(RPC_FLUSH_TIMEOUT)
         while self.registered_modules:
             mod = self.registered_modules.pop()
             logger.info("Cleaning up rpc.%s ...", mod.name)
@@ -51,33 +65,58 @@ class RPCManager:
         {
             'status': 'stopping bot'
         }
+        Messages are delivered asynchronously - this only queues the message.
+        """
+        self._dispatcher.put(msg)
+
+    def has_subscribers(self, msg_type: RPCMessageType) -> bool:
         """
-        if msg.get("type") not in NO_ECHO_MESSAGES:
+        Whether a module delivers the content of messages of this type to a receiver
+        """
+        return any(mod.has_subscribers(msg_type) for mod in self.registered_modules)
+
+    def _dispatch(self, msg: RPCSendMsg) -> None:
+        msg_type = msg.get("type")
+        if msg_type == RPCMessageType.STRATEGY_MSG:
+            logger.info("Sending rpc strategy_msg: %s", msg["msg"])  # type: ignore[typeddict-item]
+        elif msg_type not in NO_ECHO_MESSAGES:
             logger.info("Sending rpc message: %s", msg)
         for mod in self.registered_modules:
-            logger.debug("Forwarding message to rpc.%s", mod.name)
-            try:
-                mod.send_msg(msg)
-            except NotImplementedError:
-                logger.error(f"Message type '{msg['type']}' not implemented by handler {mod.name}.")
-            except Exception:
-                logger.exception("Exception occurred within RPC module %s", mod.name)
+            if msg_type == RPCMessageType.STRATEGY_MSG and not mod._config.get(mod.name, {}).get(
+                "allow_custom_messages", False
+            ):
+                continue
+            if mod.name not in self._module_dispatchers:
+                self._module_dispatchers[mod.name] = RPCDispatcher(
+                    mod.name, partial(self._send_to_module, mod), self._queue_size
+                )
+            self._module_dispatchers[mod.name].put(msg)
+
+    @staticmethod
+    def _send_to_module(mod: RPCHandler, msg: RPCSendMsg) -> None:
+        logger.debug("Forwarding message to rpc.%s", mod.name)
+        try:
+            mod.send_msg(msg)
+        except NotImplementedError:
+            logger.error(f"Message type '{msg['type']}' not implemented by handler {mod.name}.")
+        except Exception:
+            logger.exception("Exception occurred within RPC module %s", mod.name)
+
+    def queue_stats(self) -> dict[str, dict[str, int]]:
+        """
+        Message counts per queue (sent, delivered, coalesced, dropped, pending).
+        """
+        return {
+            "manager": self._dispatcher.stats(),
+            **{name: d.stats() for name, d in list(self._module_dispatchers.items())},
+        }
 
     def process_msg_queue(self, queue: deque) -> None:
         """
         Process all messages in the queue.
         """
         while queue:
-            msg = queue.popleft()
-            logger.info("Sending rpc strategy_msg: %s", msg)
-            for mod in self.registered_modules:
-                if mod._config.get(mod.name, {}).get("allow_custom_messages", False):
-                    mod.send_msg(
-                        {
-                            "type": RPCMessageType.STRATEGY_MSG,
-                            "msg": msg,
-                        }
-                    )
+            self.send_msg({"type": RPCMessageType.STRATEGY_MSG, "msg": queue.popleft()})
 
     def startup_messages(self, config: Config, pairlist, protections) -> None:
         if config["dry_run"]:
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import Any, Literal, TypedDict
+from typing import Any, Literal, NotRequired, TypedDict
 
 from binancebot.constants import PairWithTimeframe
 from binancebot.enums import RPCMessageType
@@ -106,6 +106,10 @@ class _AnalyzedDFData(TypedDict):
     key: PairWithTimeframe
     df: Any
     la: datetime
+    # Message sequence number per pair, a delta applies to the dataframe of base_seq
+    seq: NotRequired[int]
+    base_seq: NotRequired[int]
+    length: NotRequired[int]
 
 
 class RPCAnalyzedDFMsg(RPCSendMsgBase):
@@ -29,6 +29,7 @@ from binancebot.util.progress_tracker import (  # noqa F401
 )
 from binancebot.util.rich_progress import CustomProgress
 from binancebot.util.rich_tables import print_df_rich_table, print_rich_table
+from binancebot.util.single_flight import SingleFlight
 from binancebot.util.template_renderer import render_template, render_template_with_fallback  # noqa
 
 
@@ -47,6 +48,7 @@ __all__ = [
     "get_dry_run_wallet",
     "FtPrecise",
     "PeriodicCache",
+    "SingleFlight",
     "shorten_date",
     "decimals_per_coin",
     "round_value",
@@ -0,0 +1,111 @@
+import threading
+import time
+from collections.abc import Callable, Hashable
+from copy import copy
+from typing import Any, TypeVar
+
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "error", "finished_at", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Exception | None = None
+        self.finished_at = 0.0
+
+
+def _waiter_error(error: Exception) -> Exception:
+    """
+    Copy of the exception of a shared call - each waiting caller raises its own instance
+    (with its own traceback), of the same type.
+    """
+    try:
+        return copy(error)
+    except TypeError:
+        # Exceptions with custom constructor arguments
+        return RuntimeError(f"Shared call failed: {error!r}")
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent identical calls (by key) into one call.
+    Callers arriving while a call is in flight wait for it and share its result, or raise a
+    copy of its exception.
+    Results can additionally be reused for a short time (max_age) after the call finished.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._stats: dict[str, dict[str, int]] = {}
+
+    def do(self, key: Hashable, func: Callable[..., T], *args, max_age: float = 0, **kwargs) -> T:
+        """
+        Call func(*args, **kwargs), unless an identical call is in flight or finished
+        less than max_age seconds ago - its result is returned instead.
+        :param key: Identifies identical calls - the first element names the call in stats
+        :param max_age: Seconds a finished call's result may be reused
+        """
+        name = str(key[0] if isinstance(key, tuple) else key)
+        with self._lock:
+            stats = self._stats.setdefault(name, {"calls": 0, "shared": 0, "reused": 0})
+            call = self._calls.get(key)
+            owner = False
+            if call is not None and not call.done.is_set():
+                stats["shared"] += 1
+            elif (
+                call is not None
+                and call.error is None
+                and time.monotonic() - call.finished_at < max_age
+            ):
+                stats["reused"] += 1
+                return call.result
+            else:
+                call = _Call()
+                self._calls[key] = call
+                stats["calls"] += 1
+                owner = True
+
+        if not owner:
+            call.done.wait()
+        else:
+            try:
+                call.result = func(*args, **kwargs)
+            except Exception as e:
+                call.error = e
+                raise
+            except BaseException:
+                # Interrupts only propagate in the calling thread
+                call.error = RuntimeError(f"Shared call {name} was interrupted.")
+                raise
+            finally:
+                with self._lock:
+                    call.finished_at = time.monotonic()
+                    if call.error is not None and self._calls.get(key) is call:
+                        # Failures are shared with waiting callers, but never reused
+                        del self._calls[key]
+                call.done.set()
+        if call.error is not None:
+            raise _waiter_error(call.error) from call.error
+        return call.result
+
+    def invalidate(self, name: str) -> None:
+        """
+        Don't share in-flight or finished calls of name with later callers,
+        e.g. balances after an order was placed.
+        """
+        with self._lock:
+            for key in [k for k in self._calls if (k[0] if isinstance(k, tuple) else k) == name]:
+                del self._calls[key]
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """
+        Per call name: calls executed, calls which shared an in-flight call,
+        and calls answered from a recent result.
+        """
+        with self._lock:
+            return {name: dict(values) for name, values in self._stats.items()}
@@ -273,28 +273,23 @@ export function createBotSubStore(botId: string, botName: string) {
       },
       async getTrades() {
         try {
-          let totalTrades = 0;
           const pageLength = 500;
-          const fetchTrades = async (limit: number, offset: number) => {
+          const fetchTrades = async (limit: number, cursor: string | null) => {
             return api.get<TradeResponse>('/trades', {
-              params: { limit, offset },
+              params: cursor ? { limit, cursor } : { limit },
             });
           };
-          const res = await fetchTrades(pageLength, 0);
+          const res = await fetchTrades(pageLength, null);
           const result: TradeResponse = res.data;
           let { trades } = result;
           if (Array.isArray(trades)) {
-            if (trades.length !== result.total_trades) {
-              // Pagination necessary
-              // Don't use Promise.all - this would fire all requests at once, which can
-              // cause problems for big sqlite databases
-              do {
-                const res = await fetchTrades(pageLength, trades.length);
-
-                const result: TradeResponse = res.data;
-                trades = trades.concat(result.trades);
-                totalTrades = res.data.total_trades;
-              } while (trades.length !== totalTrades);
+            // Keyset pagination - each page continues after the last trade of the previous one.
+            // Requests are sequential, to avoid problems with big sqlite databases.
+            let cursor = result.next_cursor ?? null;
+            while (cursor) {
+              const res = await fetchTrades(pageLength, cursor);
+              trades = trades.concat(res.data.trades);
+              cursor = res.data.next_cursor ?? null;
             }
             const tradesCount = trades.length;
             // Add botId to all trades
@@ -159,4 +159,6 @@ export interface TradeResponse {
   trades_count: number;
   /** Total trade count */
   total_trades: number;
+  /** Cursor for the next page, null on the last page */
+  next_cursor?: string | null;
 }
@@ -0,0 +1,130 @@
+"""
+Benchmark /daily, /weekly and /monthly profit aggregation.
+
+Creates a temporary sqlite database with 100k closed trades and compares the former
+query-per-day implementation against the rollup-based RPC._rpc_timeunit_profit.
+
+Usage (from the repository root):
+    python scripts/bench_daily_profit.py [--trades 100000] [--timescale 365]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+from sqlalchemy import insert, select
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from binancebot.persistence import Trade, init_db
+from binancebot.rpc import RPC
+
+
+def create_trades(count: int, days: int) -> None:
+    now = datetime.now(UTC).replace(tzinfo=None)
+    rng = np.random.default_rng()
+    rows = []
+    for i in range(count):
+        close_date = now - timedelta(seconds=int(rng.integers(0, days * 86400)))
+        rows.append(
+            {
+                "exchange": "binance",
+                "pair": f"PAIR{i % 50}/USDT",
+                "is_open": False,
+                "fee_open": 0.001,
+                "fee_close": 0.001,
+                "open_rate": 1.0,
+                "close_rate": 1.0,
+                "stake_amount": 10.0,
+                "amount": 10.0,
+                "open_date": close_date - timedelta(hours=2),
+                "close_date": close_date,
+                "close_profit_abs": float(rng.uniform(-1, 1)),
+                "close_profit": float(rng.uniform(-0.1, 0.1)),
+                "is_short": False,
+                "is_stop_loss_trailing": False,
+                "interest_rate": 0.0,
+                "record_version": 2,
+            }
+        )
+    with Trade.session.get_bind().begin() as connection:
+        connection.execute(insert(Trade), rows)
+
+
+def legacy_daily(timescale: int) -> list[tuple[float, int]]:
+    """Query-per-day implementation this change replaced (days only)."""
+    start_date = datetime.now(UTC).date()
+    result = []
+    for day in range(timescale - 1, -1, -1):
+        profitday = start_date - timedelta(days=day)
+        trades = Trade.session.execute(
+            select(Trade.close_profit_abs)
+            .filter(
+                Trade.is_open.is_(False),
+                Trade.close_date >= profitday,
+                Trade.close_date < (profitday + timedelta(days=1)),
+            )
+            .order_by(Trade.close_date)
+        ).all()
+        result.append((sum(t.close_profit_abs for t in trades), len(trades)))
+    return result
+
+
+def timed(func, *args, repeat: int = 3):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--trades", type=int, default=100_000)
+    parser.add_argument("--timescale", type=int, default=365)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        init_db(f"sqlite:///{tmpdir}/bench.sqlite")
+        print(f"Creating {args.trades} closed trades ...")
+        create_trades(args.trades, args.timescale)
+        # Bulk inserts bypass the ORM flush - initialize the rollup like the startup migration
+        rebuild_start = time.perf_counter()
+        with Trade.session.get_bind().begin() as connection:
+            from binancebot.persistence.daily_profit import DailyProfit
+
+            DailyProfit.rebuild(connection)
+        print(f"Rollup rebuild:             {time.perf_counter() - rebuild_start:8.4f}s")
+
+        bot = SimpleNamespace(
+            config={},
+            wallets=SimpleNamespace(get_total_stake_amount=lambda: 10_000.0),
+        )
+        rpc = RPC(bot)
+
+        legacy_time, legacy = timed(legacy_daily, args.timescale)
+        print(f"Legacy /daily ({args.timescale} queries): {legacy_time:8.4f}s")
+        for unit in ("days", "weeks", "months"):
+            timescale = {"days": args.timescale, "weeks": 52, "months": 12}[unit]
+            new_time, new = timed(rpc._rpc_timeunit_profit, timescale, "USDT", "", unit)
+            print(f"Rollup /{unit:<6} ({timescale:>3} units):   {new_time:8.4f}s")
+            if unit == "days":
+                new_values = [(d["abs_profit"], d["trade_count"]) for d in new["data"]]
+                if not all(
+                    abs(a[0] - b[0]) < 1e-6 and a[1] == b[1]
+                    for a, b in zip(legacy, new_values, strict=True)
+                ):
+                    raise SystemExit("Results differ from the legacy implementation")
+        print("Results match the legacy implementation.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark the initial markets load with and without the markets snapshot on disk.
+
+Loads markets from the exchange (cold start, which also writes the snapshot), then
+starts new exchange instances from the snapshot. Requires network access.
+
+Usage (from the repository root):
+    python scripts/bench_markets_startup.py [--exchange binance] [--trading-mode spot]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from binancebot.resolvers import ExchangeResolver
+
+
+def create_exchange(datadir: Path, name: str, trading_mode: str):
+    config = {
+        "dry_run": True,
+        "datadir": datadir,
+        # Not a trading mode - no background refresh after starting from the snapshot
+        "runmode": "other",
+        "stake_currency": "USDT",
+        "trading_mode": trading_mode,
+        "margin_mode": "isolated" if trading_mode == "futures" else "",
+        "exchange": {"name": name, "key": "", "secret": "", "enable_ws": False},
+    }
+    return ExchangeResolver.load_exchange(config, validate=False)
+
+
+def timed_load(datadir: Path, name: str, trading_mode: str) -> tuple[float, int]:
+    exchange = create_exchange(datadir, name, trading_mode)
+    start = time.perf_counter()
+    exchange.reload_markets(True)
+    duration = time.perf_counter() - start
+    count = len(exchange.markets)
+    exchange.close()
+    return duration, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--exchange", default="binance")
+    parser.add_argument("--trading-mode", default="spot", choices=["spot", "futures"])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        datadir = Path(tmpdir)
+        cold, count = timed_load(datadir, args.exchange, args.trading_mode)
+        if not count:
+            sys.exit("Could not load markets from the exchange.")
+        print(f"Cold markets load ({count} markets): {cold:8.3f}s")
+        snapshot = next(datadir.glob("markets_*.json"))
+        print(f"Snapshot size:                 {snapshot.stat().st_size / 1e6:8.1f} MB")
+        warm = min(
+            timed_load(datadir, args.exchange, args.trading_mode)[0] for _ in range(args.repeat)
+        )
+        print(f"Load from snapshot:            {warm:8.3f}s ({cold / warm:.0f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Benchmark the live trading code paths against the local Binance simulator.
+
+Runs the bot (BinanceBot.process(), as called by the worker) against the simulator and
+reports the loop latency, then measures order throughput (create / fetch / cancel
+through the bot's exchange class) sequentially and from concurrent threads.
+No network access or exchange account is needed.
+
+Usage (from the repository root):
+    python scripts/bench_trading_loop.py [--pairs 50] [--loops 20] [--orders 200] [--ws]
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from binance_simulator import SimulatorServer, simulated_pairs
+
+from binancebot.binancebot import BinanceBot
+from binancebot.configuration import Configuration
+from binancebot.enums import RunMode
+
+
+# Enters whenever the last candle closed higher, exits when it closed lower -
+# trades on most candles of the 1m timeframe.
+STRATEGY = """
+from pandas import DataFrame
+
+from binancebot.strategy import IStrategy
+
+
+class SimulatorBenchStrategy(IStrategy):
+    INTERFACE_VERSION = 3
+    timeframe = "1m"
+    minimal_roi = {"0": 10}
+    stoploss = -0.5
+    startup_candle_count = 20
+
+    def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe["change"] = dataframe["close"].pct_change()
+        dataframe["sma"] = dataframe["close"].rolling(20).mean()
+        return dataframe
+
+    def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe.loc[dataframe["change"] > 0, "enter_long"] = 1
+        return dataframe
+
+    def populate_exit_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        dataframe.loc[dataframe["change"] < 0, "exit_long"] = 1
+        return dataframe
+"""
+
+
+def create_config(
+    tmpdir: Path, url_config: dict, pairs: list[str], rate_limit: bool, ws: bool
+) -> dict:
+    (tmpdir / "strategies").mkdir()
+    (tmpdir / "strategies" / "SimulatorBenchStrategy.py").write_text(STRATEGY)
+    ccxt_config = dict(url_config, enableRateLimit=rate_limit)
+    config = {
+        "max_open_trades": len(pairs),
+        "stake_currency": "USDT",
+        "stake_amount": 50,
+        "dry_run": False,
+        "timeframe": "1m",
+        "cancel_open_orders_on_exit": False,
+        "unfilledtimeout": {"entry": 1, "exit": 1, "unit": "minutes"},
+        "entry_pricing": {"price_side": "other", "use_order_book": True, "order_book_top": 1},
+        "exit_pricing": {"price_side": "other", "use_order_book": True, "order_book_top": 1},
+        "exchange": {
+            "name": "binance",
+            "key": "simulator",
+            "secret": "simulator",
+            "enable_ws": ws,
+            "ccxt_config": ccxt_config,
+            "ccxt_async_config": ccxt_config,
+            "pair_whitelist": pairs,
+            "pair_blacklist": [],
+        },
+        "pairlists": [{"method": "StaticPairList"}],
+        "strategy": "SimulatorBenchStrategy",
+        "strategy_path": str(tmpdir / "strategies"),
+        "user_data_dir": str(tmpdir),
+        "datadir": str(tmpdir / "data"),
+        "db_url": f"sqlite:///{tmpdir / 'trades.sqlite'}",
+        "bot_name": "simulator-bench",
+        "initial_state": "running",
+        "internals": {"process_throttle_secs": 1},
+    }
+    path = tmpdir / "config.json"
+    path.write_text(json.dumps(config))
+    config = Configuration({"config": [str(path)]}, RunMode.LIVE).get_config()
+    # Configuration sets up logging - keep the per-trade messages out of the results
+    logging.getLogger("binancebot").setLevel(logging.WARNING)
+    return config
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def bench_loop(bot: BinanceBot, loops: int, server: SimulatorServer) -> None:
+    durations = []
+    before = server.stats()
+    for _ in range(loops):
+        start = time.perf_counter()
+        bot.process()
+        durations.append(time.perf_counter() - start)
+    after = server.stats()
+    orders = after["orders"] - before["orders"]
+    requests = after["requests"] - before["requests"]
+    print(
+        f"process() x{loops}: p50 {statistics.median(durations) * 1000:8.1f}ms "
+        f"p95 {percentile(durations, 0.95) * 1000:8.1f}ms max {max(durations) * 1000:8.1f}ms"
+    )
+    print(f"  orders placed: {orders}, REST requests: {requests} ({requests / loops:.1f} per loop)")
+
+
+def order_cycle(bot: BinanceBot, pair: str) -> None:
+    exchange = bot.exchange
+    price = exchange.fetch_ticker(pair)["bid"] * 0.9
+    amount = exchange.amount_to_precision(pair, 20 / price)
+    order = exchange.create_order(
+        pair=pair,
+        ordertype="limit",
+        side="buy",
+        amount=amount,
+        rate=exchange.price_to_precision(pair, price),
+        leverage=1.0,
+    )
+    exchange.fetch_order(order["id"], pair)
+    exchange.cancel_order(order["id"], pair)
+
+
+def bench_orders(bot: BinanceBot, pairs: list[str], count: int, threads: int) -> None:
+    for workers in sorted({1, threads}):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(lambda i: order_cycle(bot, pairs[i % len(pairs)]), range(count)))
+        duration = time.perf_counter() - start
+        print(
+            f"order cycles ({workers:2} threads): {count / duration:8.1f} orders/s "
+            f"({duration / count * 1000:.1f}ms per create / fetch / cancel)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--pairs", type=int, default=50)
+    parser.add_argument("--loops", type=int, default=20)
+    parser.add_argument("--orders", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument(
+        "--rate-limit",
+        action="store_true",
+        help="Keep request weight limits - on the simulator and in the bot's rate limiter.",
+    )
+    parser.add_argument("--ws", action="store_true", help="Use websocket market data streams.")
+    args = parser.parse_args()
+    pairs = simulated_pairs(args.pairs)
+    server = SimulatorServer(args.pairs, weight_limit=6000 if args.rate_limit else None)
+    with server, tempfile.TemporaryDirectory() as tmpdir:
+        config = create_config(Path(tmpdir), server.ccxt_config(), pairs, args.rate_limit, args.ws)
+        start = time.perf_counter()
+        bot = BinanceBot(config)
+        bot.startup()
+        print(f"Startup ({len(pairs)} pairs): {time.perf_counter() - start:8.3f}s")
+        try:
+            # First iteration downloads the candle history
+            start = time.perf_counter()
+            bot.process()
+            print(
+                f"First process() (history): {time.perf_counter() - start:8.3f}s, "
+                f"{server.stats()['orders']} orders placed"
+            )
+            bench_loop(bot, args.loops, server)
+            bench_orders(bot, pairs, args.orders, args.threads)
+        finally:
+            bot.cleanup()
+
+
+if __name__ == "__main__":
+    main()
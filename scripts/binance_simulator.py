@@ -0,0 +1,1252 @@
+"""
+Local stand-in for the Binance spot API, for load and latency testing.
+
+Serves the REST endpoints ccxt uses for spot trading (markets, klines, tickers,
+order book, orders, trades, balances) with request weight headers and limits,
+and kline / ticker / book ticker websocket streams.
+Prices follow a deterministic function of time per pair. Orders are matched
+against the simulated best bid / ask - market and crossing limit orders fill
+immediately, resting limit and stop-limit orders fill once the price reaches them.
+Balances, order states and fees (0.1% of the received asset) are tracked in memory.
+The user data stream (websocket API) reports order updates.
+Not simulated: margin / futures APIs, balance updates via websocket and partial fills.
+
+Point the bot (and copy trading clients) at the simulator by merging
+simulator_ccxt_config(url) into exchange.ccxt_config - any API key / secret is accepted.
+
+Usage (from the repository root):
+    python scripts/binance_simulator.py [--port 8765] [--pairs 50]
+"""
+
+import argparse
+import asyncio
+import itertools
+import math
+import multiprocessing
+import socket
+import threading
+import time
+import zlib
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import parse_qsl
+from urllib.request import urlopen
+
+import orjson
+import uvicorn
+from fastapi import FastAPI, Request, WebSocket, WebSocketDisconnect
+from starlette.responses import Response
+
+
+QUOTE = "USDT"
+FEE_RATE = 0.001
+# Relative distance of best bid / ask (and between order book levels) from the mid price
+HALF_SPREAD = 0.0005
+WEIGHT_LIMIT = 6000
+# Seconds between matching resting orders in the background
+MATCH_INTERVAL = 0.25
+INTERVALS = {
+    "1s": 1,
+    "1m": 60,
+    "3m": 180,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "2h": 7200,
+    "4h": 14400,
+    "6h": 21600,
+    "8h": 28800,
+    "12h": 43200,
+    "1d": 86400,
+    "3d": 259200,
+    "1w": 604800,
+}
+# Request weights of the simulated endpoints: (with symbol, without symbol)
+WEIGHTS: dict[str, tuple[int, int]] = {
+    "ping": (1, 1),
+    "time": (1, 1),
+    "exchangeInfo": (20, 20),
+    "klines": (2, 2),
+    "depth": (5, 5),
+    "ticker/24hr": (2, 80),
+    "ticker/price": (2, 4),
+    "ticker/bookTicker": (2, 4),
+    "order": (4, 4),
+    "openOrders": (6, 80),
+    "allOrders": (20, 20),
+    "myTrades": (20, 20),
+    "account": (20, 20),
+}
+
+
+class SimulatorError(Exception):
+    def __init__(self, status: int, code: int, msg: str) -> None:
+        super().__init__(msg)
+        self.status = status
+        self.code = code
+        self.msg = msg
+
+
+@dataclass
+class SimMarket:
+    symbol: str
+    base: str
+    base_price: float
+    tick_size: float
+    step_size: float
+    min_notional: float = 5.0
+    phase: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.phase = (zlib.crc32(self.symbol.encode()) % 1000) / 159.0
+
+    def price(self, ts_ms: float) -> float:
+        """
+        Mid price at ts_ms - a smooth, deterministic function of time.
+        """
+        t = ts_ms / 60000
+        p = self.phase
+        return self.base_price * (
+            1
+            + 0.03 * math.sin(t / 97 + p)
+            + 0.015 * math.sin(t / 13.7 + 2 * p)
+            + 0.004 * math.sin(t / 1.9 + 3 * p)
+        )
+
+    def round_price(self, price: float) -> float:
+        return round(round(price / self.tick_size) * self.tick_size, 10)
+
+    def best_bid_ask(self, ts_ms: float) -> tuple[float, float]:
+        mid = self.price(ts_ms)
+        return (
+            self.round_price(mid * (1 - HALF_SPREAD)),
+            self.round_price(mid * (1 + HALF_SPREAD)),
+        )
+
+    def volume(self, start_ms: float, seconds: int) -> float:
+        return 1000 * (1.2 + math.sin(start_ms / 420000 + self.phase)) * seconds / 60
+
+    def candle(self, open_ms: int, seconds: int, now_ms: float) -> list:
+        close_ms = open_ms + seconds * 1000 - 1
+        end = min(close_ms, now_ms)
+        samples = [self.price(open_ms + (end - open_ms) * i / 4) for i in range(5)]
+        volume = self.volume(open_ms, seconds) * (end - open_ms + 1) / (seconds * 1000)
+        return [
+            open_ms,
+            fmt(samples[0]),
+            fmt(max(samples)),
+            fmt(min(samples)),
+            fmt(samples[-1]),
+            fmt(volume),
+            close_ms,
+            fmt(volume * samples[-1]),
+            int(volume),
+            fmt(volume / 2),
+            fmt(volume * samples[-1] / 2),
+            "0",
+        ]
+
+
+def fmt(value: float) -> str:
+    return f"{value:.8f}"
+
+
+def simulated_pairs(count: int) -> list[str]:
+    """
+    Pairs (ccxt symbols) of a simulator with count pairs.
+    """
+    names = ("BTC", "ETH", "BNB", "SOL", "XRP", "ADA")
+    return [f"{names[i] if i < len(names) else f'SIM{i}'}/{QUOTE}" for i in range(count)]
+
+
+@dataclass
+class SimOrder:
+    order_id: int
+    client_order_id: str
+    market: SimMarket
+    side: str
+    type: str
+    time_in_force: str
+    quantity: float
+    price: float
+    stop_price: float
+    time: int
+    status: str = "NEW"
+    executed: float = 0.0
+    quote_executed: float = 0.0
+    update_time: int = 0
+    triggered: bool = False
+    fills: list[dict] = field(default_factory=list)
+
+    def to_json(self, full: bool = False) -> dict[str, Any]:
+        res = {
+            "symbol": self.market.symbol,
+            "orderId": self.order_id,
+            "orderListId": -1,
+            "clientOrderId": self.client_order_id,
+            "price": fmt(self.price),
+            "origQty": fmt(self.quantity),
+            "executedQty": fmt(self.executed),
+            "cummulativeQuoteQty": fmt(self.quote_executed),
+            "status": self.status,
+            "timeInForce": self.time_in_force,
+            "type": self.type,
+            "side": self.side,
+            "stopPrice": fmt(self.stop_price),
+            "icebergQty": fmt(0),
+            "time": self.time,
+            "updateTime": self.update_time or self.time,
+            "isWorking": (
+                self.status == "NEW" and (self.type != "STOP_LOSS_LIMIT" or self.triggered)
+            ),
+            "workingTime": self.time,
+            "origQuoteOrderQty": fmt(0),
+            "selfTradePreventionMode": "EXPIRE_MAKER",
+        }
+        if full:
+            res["transactTime"] = self.update_time or self.time
+            res["fills"] = [
+                {k: v for k, v in fill.items() if k in ("price", "qty", "commission")}
+                | {"commissionAsset": fill["commissionAsset"], "tradeId": fill["id"]}
+                for fill in self.fills
+            ]
+        return res
+
+
+class BinanceSimulator:
+    """
+    Market data, matching engine, balances and request weight accounting.
+    Thread safe - all state is guarded by one lock.
+    """
+
+    def __init__(
+        self,
+        pairs: int = 50,
+        balances: dict[str, float] | None = None,
+        weight_limit: int | None = WEIGHT_LIMIT,
+    ) -> None:
+        self.markets: dict[str, SimMarket] = {}
+        for i, pair in enumerate(simulated_pairs(pairs)):
+            base = pair.split("/")[0]
+            base_price = 10 ** (4 - i % 6) * (1 + i % 7)
+            tick = 10 ** (math.floor(math.log10(base_price)) - 4)
+            self.markets[f"{base}{QUOTE}"] = SimMarket(
+                symbol=f"{base}{QUOTE}",
+                base=base,
+                base_price=base_price,
+                tick_size=tick,
+                step_size=10 ** -(math.floor(math.log10(base_price)) + 1),
+            )
+        self.weight_limit = weight_limit
+        self.free: dict[str, float] = {QUOTE: 100_000.0}
+        self.free.update(balances or {})
+        self.locked: dict[str, float] = {}
+        self.orders: dict[int, SimOrder] = {}
+        self.open_orders: dict[int, SimOrder] = {}
+        self.trades: list[dict] = []
+        self._ids = itertools.count(1)
+        self._trade_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._weight_minute = 0
+        self._weight_used = 0
+        self.request_count = 0
+        # Receive the executionReport events of the user data stream
+        self.listeners: list[Callable[[dict[str, Any]], None]] = []
+
+    # Request weight
+    def charge(self, weight: int) -> int:
+        """
+        Add the weight of a request to the current minute.
+        :return: Weight used in the current minute
+        :raises SimulatorError: 429 if the limit is exceeded
+        """
+        with self._lock:
+            self.request_count += 1
+            minute = int(time.time() // 60)
+            if minute != self._weight_minute:
+                self._weight_minute = minute
+                self._weight_used = 0
+            self._weight_used += weight
+            if self.weight_limit is not None and self._weight_used > self.weight_limit:
+                raise SimulatorError(
+                    429, -1003, "Too much request weight used; please use WebSocket Streams."
+                )
+            return self._weight_used
+
+    @property
+    def used_weight(self) -> int:
+        return self._weight_used
+
+    # Market data
+    def market(self, symbol: str | None) -> SimMarket:
+        if symbol not in self.markets:
+            raise SimulatorError(400, -1121, "Invalid symbol.")
+        return self.markets[symbol]
+
+    def exchange_info(self) -> dict[str, Any]:
+        return {
+            "timezone": "UTC",
+            "serverTime": int(time.time() * 1000),
+            "rateLimits": [
+                {
+                    "rateLimitType": "REQUEST_WEIGHT",
+                    "interval": "MINUTE",
+                    "intervalNum": 1,
+                    "limit": self.weight_limit or WEIGHT_LIMIT,
+                },
+            ],
+            "exchangeFilters": [],
+            "symbols": [self._symbol_info(m) for m in self.markets.values()],
+        }
+
+    @staticmethod
+    def _symbol_info(m: SimMarket) -> dict[str, Any]:
+        return {
+            "symbol": m.symbol,
+            "status": "TRADING",
+            "baseAsset": m.base,
+            "baseAssetPrecision": 8,
+            "quoteAsset": QUOTE,
+            "quotePrecision": 8,
+            "quoteAssetPrecision": 8,
+            "baseCommissionPrecision": 8,
+            "quoteCommissionPrecision": 8,
+            "orderTypes": ["LIMIT", "LIMIT_MAKER", "MARKET", "STOP_LOSS_LIMIT"],
+            "icebergAllowed": False,
+            "ocoAllowed": False,
+            "otoAllowed": False,
+            "quoteOrderQtyMarketAllowed": True,
+            "allowTrailingStop": False,
+            "cancelReplaceAllowed": False,
+            "isSpotTradingAllowed": True,
+            "isMarginTradingAllowed": False,
+            "filters": [
+                {
+                    "filterType": "PRICE_FILTER",
+                    "minPrice": fmt(m.tick_size),
+                    "maxPrice": fmt(m.base_price * 100),
+                    "tickSize": fmt(m.tick_size),
+                },
+                {
+                    "filterType": "LOT_SIZE",
+                    "minQty": fmt(m.step_size),
+                    "maxQty": "9000000.00000000",
+                    "stepSize": fmt(m.step_size),
+                },
+                {
+                    "filterType": "MARKET_LOT_SIZE",
+                    "minQty": "0.00000000",
+                    "maxQty": "9000000.00000000",
+                    "stepSize": "0.00000000",
+                },
+                {
+                    "filterType": "NOTIONAL",
+                    "minNotional": fmt(m.min_notional),
+                    "applyMinToMarket": True,
+                    "maxNotional": "9000000.00000000",
+                    "applyMaxToMarket": False,
+                    "avgPriceMins": 5,
+                },
+            ],
+            "permissions": [],
+            "permissionSets": [["SPOT"]],
+            "defaultSelfTradePreventionMode": "EXPIRE_MAKER",
+            "allowedSelfTradePreventionModes": ["EXPIRE_TAKER", "EXPIRE_MAKER", "EXPIRE_BOTH"],
+        }
+
+    def klines(
+        self,
+        symbol: str,
+        interval: str,
+        start: int | None,
+        end: int | None,
+        limit: int,
+    ) -> list[list]:
+        m = self.market(symbol)
+        if interval not in INTERVALS:
+            raise SimulatorError(400, -1120, "Invalid interval.")
+        seconds = INTERVALS[interval]
+        step = seconds * 1000
+        now = time.time() * 1000
+        limit = max(1, min(limit, 1000))
+        last_open = int(now // step * step)
+        if end is not None:
+            last_open = min(last_open, int(end // step * step))
+        if start is not None:
+            first_open = int(math.ceil(start / step) * step)
+            last_open = min(last_open, first_open + (limit - 1) * step)
+        else:
+            first_open = last_open - (limit - 1) * step
+        return [m.candle(t, seconds, now) for t in range(first_open, last_open + 1, step)]
+
+    def ticker_24hr(self, m: SimMarket) -> dict[str, Any]:
+        now = time.time() * 1000
+        day = 86400 * 1000
+        bid, ask = m.best_bid_ask(now)
+        last = m.price(now)
+        open_ = m.price(now - day)
+        samples = [m.price(now - day * i / 48) for i in range(49)]
+        volume = m.volume(now - day, 86400)
+        return {
+            "symbol": m.symbol,
+            "priceChange": fmt(last - open_),
+            "priceChangePercent": f"{(last / open_ - 1) * 100:.3f}",
+            "weightedAvgPrice": fmt(sum(samples) / len(samples)),
+            "prevClosePrice": fmt(open_),
+            "lastPrice": fmt(last),
+            "lastQty": fmt(m.step_size),
+            "bidPrice": fmt(bid),
+            "bidQty": fmt(m.step_size * 100),
+            "askPrice": fmt(ask),
+            "askQty": fmt(m.step_size * 100),
+            "openPrice": fmt(open_),
+            "highPrice": fmt(max(samples)),
+            "lowPrice": fmt(min(samples)),
+            "volume": fmt(volume),
+            "quoteVolume": fmt(volume * last),
+            "openTime": int(now - day),
+            "closeTime": int(now),
+            "firstId": 1,
+            "lastId": 1000,
+            "count": 1000,
+        }
+
+    def book_ticker(self, m: SimMarket) -> dict[str, Any]:
+        bid, ask = m.best_bid_ask(time.time() * 1000)
+        return {
+            "symbol": m.symbol,
+            "bidPrice": fmt(bid),
+            "bidQty": fmt(m.step_size * 100),
+            "askPrice": fmt(ask),
+            "askQty": fmt(m.step_size * 100),
+        }
+
+    def depth(self, symbol: str, limit: int) -> dict[str, Any]:
+        m = self.market(symbol)
+        now = time.time() * 1000
+        mid = m.price(now)
+        levels = max(1, min(limit, 5000))
+        return {
+            "lastUpdateId": int(now),
+            "bids": [
+                [
+                    fmt(m.round_price(mid * (1 - HALF_SPREAD * (i + 1)))),
+                    fmt(m.step_size * 100 * (i + 1)),
+                ]
+                for i in range(levels)
+            ],
+            "asks": [
+                [
+                    fmt(m.round_price(mid * (1 + HALF_SPREAD * (i + 1)))),
+                    fmt(m.step_size * 100 * (i + 1)),
+                ]
+                for i in range(levels)
+            ],
+        }
+
+    # Orders
+    def _check_filters(self, m: SimMarket, quantity: float, price: float) -> None:
+        if (
+            quantity < m.step_size
+            or abs(quantity / m.step_size - round(quantity / m.step_size)) > 1e-6
+        ):
+            raise SimulatorError(400, -1013, "Filter failure: LOT_SIZE")
+        if price and abs(price / m.tick_size - round(price / m.tick_size)) > 1e-6:
+            raise SimulatorError(400, -1013, "Filter failure: PRICE_FILTER")
+        if quantity * price < m.min_notional:
+            raise SimulatorError(400, -1013, "Filter failure: NOTIONAL")
+
+    def _reserve(self, order: SimOrder, price: float) -> None:
+        asset, amount = (
+            (QUOTE, order.quantity * price)
+            if order.side == "BUY"
+            else (order.market.base, order.quantity)
+        )
+        if self.free.get(asset, 0.0) < amount - 1e-12:
+            raise SimulatorError(
+                400, -2010, "Account has insufficient balance for requested action."
+            )
+        self.free[asset] = self.free.get(asset, 0.0) - amount
+        self.locked[asset] = self.locked.get(asset, 0.0) + amount
+
+    def _release(self, order: SimOrder, price: float) -> None:
+        asset, amount = (
+            (QUOTE, order.quantity * price)
+            if order.side == "BUY"
+            else (order.market.base, order.quantity)
+        )
+        self.locked[asset] = self.locked.get(asset, 0.0) - amount
+        self.free[asset] = self.free.get(asset, 0.0) + amount
+
+    def _fill(self, order: SimOrder, price: float, now: int, maker: bool) -> None:
+        base, qty = order.market.base, order.quantity
+        quote_qty = qty * price
+        if order.side == "BUY":
+            commission, commission_asset = qty * FEE_RATE, base
+            self.free[base] = self.free.get(base, 0.0) + qty - commission
+            self.free[QUOTE] = self.free.get(QUOTE, 0.0) - quote_qty
+        else:
+            commission, commission_asset = quote_qty * FEE_RATE, QUOTE
+            self.free[QUOTE] = self.free.get(QUOTE, 0.0) + quote_qty - commission
+            self.free[base] = self.free.get(base, 0.0) - qty
+        trade = {
+            "symbol": order.market.symbol,
+            "id": next(self._trade_ids),
+            "orderId": order.order_id,
+            "orderListId": -1,
+            "price": fmt(price),
+            "qty": fmt(qty),
+            "quoteQty": fmt(quote_qty),
+            "commission": fmt(commission),
+            "commissionAsset": commission_asset,
+            "time": now,
+            "isBuyer": order.side == "BUY",
+            "isMaker": maker,
+            "isBestMatch": True,
+        }
+        self.trades.append(trade)
+        order.fills.append(trade)
+        order.executed = qty
+        order.quote_executed = quote_qty
+        order.status = "FILLED"
+        order.update_time = now
+        self.open_orders.pop(order.order_id, None)
+        self._report(order, "TRADE", trade)
+
+    def _report(self, order: SimOrder, execution_type: str, trade: dict | None = None) -> None:
+        if not self.listeners:
+            return
+        now = order.update_time or order.time
+        event = {
+            "e": "executionReport",
+            "E": now,
+            "s": order.market.symbol,
+            "c": order.client_order_id,
+            "S": order.side,
+            "o": order.type,
+            "f": order.time_in_force,
+            "q": fmt(order.quantity),
+            "p": fmt(order.price),
+            "P": fmt(order.stop_price),
+            "F": fmt(0),
+            "g": -1,
+            "C": order.client_order_id if execution_type == "CANCELED" else "",
+            "x": execution_type,
+            "X": order.status,
+            "r": "NONE",
+            "i": order.order_id,
+            "l": trade["qty"] if trade else fmt(0),
+            "z": fmt(order.executed),
+            "L": trade["price"] if trade else fmt(0),
+            "n": trade["commission"] if trade else "0",
+            "N": trade["commissionAsset"] if trade else None,
+            "T": now,
+            "t": trade["id"] if trade else -1,
+            "w": order.status == "NEW",
+            "m": trade["isMaker"] if trade else False,
+            "O": order.time,
+            "Z": fmt(order.quote_executed),
+            "Y": trade["quoteQty"] if trade else fmt(0),
+            "Q": fmt(0),
+        }
+        for listener in self.listeners:
+            listener(event)
+
+    def _marketable_price(self, order: SimOrder, now: int) -> float | None:
+        """
+        Price the order fills at immediately (as taker), None if it doesn't cross the book.
+        """
+        bid, ask = order.market.best_bid_ask(now)
+        if order.type == "MARKET":
+            return ask if order.side == "BUY" else bid
+        if order.side == "BUY" and order.price >= ask:
+            return ask
+        if order.side == "SELL" and order.price <= bid:
+            return bid
+        return None
+
+    def create_order(self, params: dict[str, str]) -> dict[str, Any]:
+        m = self.market(params.get("symbol"))
+        now = int(time.time() * 1000)
+        order_type = params.get("type", "")
+        side = params.get("side", "")
+        if order_type not in ("LIMIT", "LIMIT_MAKER", "MARKET", "STOP_LOSS_LIMIT"):
+            raise SimulatorError(400, -1116, "Invalid orderType.")
+        if side not in ("BUY", "SELL"):
+            raise SimulatorError(400, -1117, "Invalid side.")
+        bid, ask = m.best_bid_ask(now)
+        if order_type == "MARKET" and "quoteOrderQty" in params:
+            quantity = float(params["quoteOrderQty"]) / (ask if side == "BUY" else bid)
+            quantity = math.floor(quantity / m.step_size) * m.step_size
+        else:
+            quantity = float(params.get("quantity", 0))
+        price = float(params.get("price", 0)) if order_type != "MARKET" else 0.0
+        if order_type != "MARKET" and not price:
+            raise SimulatorError(400, -1102, "Mandatory parameter 'price' was not sent.")
+        stop_price = float(params.get("stopPrice", 0))
+        if order_type == "STOP_LOSS_LIMIT" and not stop_price:
+            raise SimulatorError(400, -1102, "Mandatory parameter 'stopPrice' was not sent.")
+        self._check_filters(m, quantity, price or (ask if side == "BUY" else bid))
+
+        with self._lock:
+            self._match(now)
+            order = SimOrder(
+                order_id=next(self._ids),
+                client_order_id=params.get("newClientOrderId") or f"sim{now}{len(self.orders)}",
+                market=m,
+                side=side,
+                type=order_type,
+                time_in_force=params.get("timeInForce", "GTC" if order_type != "MARKET" else ""),
+                quantity=quantity,
+                price=price,
+                stop_price=stop_price,
+                time=now,
+            )
+            fill_price = (
+                None if order_type == "STOP_LOSS_LIMIT" else self._marketable_price(order, now)
+            )
+            if order_type == "LIMIT_MAKER" and fill_price is not None:
+                raise SimulatorError(400, -2010, "Order would immediately match and take.")
+            self._reserve(order, price or fill_price or 0.0)
+            self.orders[order.order_id] = order
+            self.open_orders[order.order_id] = order
+            self._report(order, "NEW")
+            if fill_price is not None:
+                self._release(order, price or fill_price)
+                self._fill(order, fill_price, now, maker=False)
+            elif order.time_in_force in ("IOC", "FOK"):
+                self._release(order, price)
+                order.status = "EXPIRED"
+                self.open_orders.pop(order.order_id)
+                self._report(order, "EXPIRED")
+            return order.to_json(full=True)
+
+    def match(self) -> None:
+        with self._lock:
+            self._match(int(time.time() * 1000))
+
+    def _match(self, now: int) -> None:
+        """
+        Fill resting orders the price moved through, and trigger stop orders.
+        """
+        for order in list(self.open_orders.values()):
+            bid, ask = order.market.best_bid_ask(now)
+            if order.type == "STOP_LOSS_LIMIT" and not order.triggered:
+                last = order.market.price(now)
+                hit = last <= order.stop_price if order.side == "SELL" else last >= order.stop_price
+                if not hit:
+                    continue
+                order.triggered = True
+                if (fill_price := self._marketable_price(order, now)) is not None:
+                    self._release(order, order.price)
+                    self._fill(order, fill_price, now, maker=False)
+                continue
+            if (order.side == "BUY" and ask <= order.price) or (
+                order.side == "SELL" and bid >= order.price
+            ):
+                self._release(order, order.price)
+                self._fill(order, order.price, now, maker=True)
+
+    def _get_order(self, params: dict[str, str]) -> SimOrder:
+        order = None
+        if "orderId" in params:
+            order = self.orders.get(int(params["orderId"]))
+        elif "origClientOrderId" in params:
+            order = next(
+                (
+                    o
+                    for o in self.orders.values()
+                    if o.client_order_id == params["origClientOrderId"]
+                ),
+                None,
+            )
+        if order is None or order.market.symbol != params.get("symbol"):
+            raise SimulatorError(400, -2013, "Order does not exist.")
+        return order
+
+    def fetch_order(self, params: dict[str, str]) -> dict[str, Any]:
+        with self._lock:
+            self._match(int(time.time() * 1000))
+            return self._get_order(params).to_json()
+
+    def cancel_order(self, params: dict[str, str]) -> dict[str, Any]:
+        with self._lock:
+            now = int(time.time() * 1000)
+            self._match(now)
+            order = self._get_order(params)
+            if order.order_id not in self.open_orders:
+                raise SimulatorError(400, -2011, "Unknown order sent.")
+            self._release(order, order.price)
+            order.status = "CANCELED"
+            order.update_time = now
+            self.open_orders.pop(order.order_id)
+            self._report(order, "CANCELED")
+            return order.to_json()
+
+    def list_open_orders(self, symbol: str | None) -> list[dict[str, Any]]:
+        with self._lock:
+            self._match(int(time.time() * 1000))
+            return [
+                o.to_json()
+                for o in self.open_orders.values()
+                if symbol is None or o.market.symbol == symbol
+            ]
+
+    def list_all_orders(self, symbol: str, start: int | None, limit: int) -> list[dict[str, Any]]:
+        self.market(symbol)
+        with self._lock:
+            self._match(int(time.time() * 1000))
+            orders = [
+                o.to_json()
+                for o in self.orders.values()
+                if o.market.symbol == symbol and (start is None or o.time >= start)
+            ]
+        return orders[:limit]
+
+    def my_trades(
+        self, symbol: str, order_id: int | None, start: int | None, limit: int
+    ) -> list[dict[str, Any]]:
+        self.market(symbol)
+        with self._lock:
+            self._match(int(time.time() * 1000))
+            trades = [
+                t
+                for t in self.trades
+                if t["symbol"] == symbol
+                and (order_id is None or t["orderId"] == order_id)
+                and (start is None or t["time"] >= start)
+            ]
+        return trades[:limit]
+
+    def account(self) -> dict[str, Any]:
+        with self._lock:
+            self._match(int(time.time() * 1000))
+            assets = sorted(set(self.free) | set(self.locked))
+            balances = [
+                {
+                    "asset": asset,
+                    "free": fmt(max(self.free.get(asset, 0.0), 0.0)),
+                    "locked": fmt(max(self.locked.get(asset, 0.0), 0.0)),
+                }
+                for asset in assets
+            ]
+        return {
+            "makerCommission": 10,
+            "takerCommission": 10,
+            "buyerCommission": 0,
+            "sellerCommission": 0,
+            "commissionRates": {
+                "maker": fmt(FEE_RATE),
+                "taker": fmt(FEE_RATE),
+                "buyer": fmt(0),
+                "seller": fmt(0),
+            },
+            "canTrade": True,
+            "canWithdraw": True,
+            "canDeposit": True,
+            "brokered": False,
+            "requireSelfTradePrevention": False,
+            "preventSor": False,
+            "updateTime": int(time.time() * 1000),
+            "accountType": "SPOT",
+            "balances": balances,
+            "permissions": ["SPOT"],
+            "uid": 1,
+        }
+
+
+async def _request_params(request: Request) -> dict[str, str]:
+    params = dict(request.query_params)
+    body = await request.body()
+    if body:
+        params.update(parse_qsl(body.decode()))
+    return params
+
+
+def _optional_int(params: dict[str, str], key: str) -> int | None:
+    return int(params[key]) if key in params else None
+
+
+def _kline_event(m: SimMarket, interval: str, now: float) -> dict[str, Any]:
+    seconds = INTERVALS[interval]
+    open_ms = int(now // (seconds * 1000) * seconds * 1000)
+    c = m.candle(open_ms, seconds, now)
+    return {
+        "e": "kline",
+        "E": int(now),
+        "s": m.symbol,
+        "k": {
+            "t": c[0],
+            "T": c[6],
+            "s": m.symbol,
+            "i": interval,
+            "f": 1,
+            "L": c[8],
+            "o": c[1],
+            "c": c[4],
+            "h": c[2],
+            "l": c[3],
+            "v": c[5],
+            "n": c[8],
+            "x": False,
+            "q": c[7],
+            "V": c[9],
+            "Q": c[10],
+            "B": "0",
+        },
+    }
+
+
+def _ticker_event(sim: BinanceSimulator, m: SimMarket, now: float) -> dict[str, Any]:
+    t = sim.ticker_24hr(m)
+    return {
+        "e": "24hrTicker",
+        "E": int(now),
+        "s": m.symbol,
+        "p": t["priceChange"],
+        "P": t["priceChangePercent"],
+        "w": t["weightedAvgPrice"],
+        "x": t["prevClosePrice"],
+        "c": t["lastPrice"],
+        "Q": t["lastQty"],
+        "b": t["bidPrice"],
+        "B": t["bidQty"],
+        "a": t["askPrice"],
+        "A": t["askQty"],
+        "o": t["openPrice"],
+        "h": t["highPrice"],
+        "l": t["lowPrice"],
+        "v": t["volume"],
+        "q": t["quoteVolume"],
+        "O": t["openTime"],
+        "C": t["closeTime"],
+        "F": 1,
+        "L": 1000,
+        "n": 1000,
+    }
+
+
+def _mini_ticker_event(sim: BinanceSimulator, m: SimMarket, now: float) -> dict[str, Any]:
+    t = sim.ticker_24hr(m)
+    return {
+        "e": "24hrMiniTicker",
+        "E": int(now),
+        "s": m.symbol,
+        "c": t["lastPrice"],
+        "o": t["openPrice"],
+        "h": t["highPrice"],
+        "l": t["lowPrice"],
+        "v": t["volume"],
+        "q": t["quoteVolume"],
+    }
+
+
+def _book_ticker_event(sim: BinanceSimulator, m: SimMarket, now: float) -> dict[str, Any]:
+    t = sim.book_ticker(m)
+    return {
+        "u": int(now),
+        "s": m.symbol,
+        "b": t["bidPrice"],
+        "B": t["bidQty"],
+        "a": t["askPrice"],
+        "A": t["askQty"],
+    }
+
+
+# Market stream events by stream type (the part after <symbol>@), except klines
+STREAM_EVENTS: dict[str, Callable[[BinanceSimulator, SimMarket, float], dict[str, Any]]] = {
+    "ticker": _ticker_event,
+    "miniTicker": _mini_ticker_event,
+    "bookTicker": _book_ticker_event,
+}
+
+
+def stream_event(sim: BinanceSimulator, stream: str, now: float) -> dict[str, Any] | None:
+    """
+    Current event of a market stream - None for unknown symbols and stream types.
+    """
+    symbol, _, kind = stream.partition("@")
+    m = sim.markets.get(symbol.upper())
+    if m is None:
+        return None
+    if kind.startswith("kline_") and (interval := kind[6:]) in INTERVALS:
+        return _kline_event(m, interval, now)
+    if (event := STREAM_EVENTS.get(kind)) is not None:
+        return event(sim, m, now)
+    return None
+
+
+class SimulatorRoutes:
+    """
+    Route handlers of the simulated API, serving one simulator.
+    """
+
+    def __init__(self, sim: BinanceSimulator) -> None:
+        self.sim = sim
+
+    def register(self, app: FastAPI) -> None:
+        routes = [
+            ("GET", "/api/v3/ping", self.ping),
+            ("GET", "/api/v3/time", self.server_time),
+            ("GET", "/api/v3/exchangeInfo", self.exchange_info),
+            ("GET", "/api/v3/klines", self.klines),
+            ("GET", "/api/v3/ticker/24hr", self.ticker_24hr),
+            ("GET", "/api/v3/ticker/bookTicker", self.book_ticker),
+            ("GET", "/api/v3/ticker/price", self.ticker_price),
+            ("GET", "/api/v3/depth", self.depth),
+            ("POST", "/api/v3/order", self.create_order),
+            ("GET", "/api/v3/order", self.fetch_order),
+            ("DELETE", "/api/v3/order", self.cancel_order),
+            ("GET", "/api/v3/openOrders", self.open_orders),
+            ("GET", "/api/v3/allOrders", self.all_orders),
+            ("GET", "/api/v3/myTrades", self.my_trades),
+            ("GET", "/api/v3/account", self.account),
+            ("GET", "/sapi/v1/spot/delist-schedule", self.delist_schedule),
+            ("GET", "/sim/stats", self.stats),
+        ]
+        for method, path, endpoint in routes:
+            app.add_api_route(path, endpoint, methods=[method])
+        app.add_api_websocket_route("/ws", self.market_streams)
+        app.add_api_websocket_route("/ws/{connection}", self.market_streams)
+        app.add_api_websocket_route("/ws-api/v3", self.websocket_api)
+
+    def respond(self, endpoint: str, params: dict[str, str], build) -> Response:
+        with_symbol = "symbol" in params or "symbols" in params
+        weight = WEIGHTS.get(endpoint, (1, 1))[0 if with_symbol else 1]
+        try:
+            used = self.sim.charge(weight)
+            content = build()
+            status = 200
+        except SimulatorError as e:
+            used = self.sim.used_weight
+            content = {"code": e.code, "msg": e.msg}
+            status = e.status
+        except (KeyError, ValueError) as e:
+            used = self.sim.used_weight
+            content = {"code": -1102, "msg": f"Invalid or missing parameter: {e}"}
+            status = 400
+        headers = {"x-mbx-used-weight": str(used), "x-mbx-used-weight-1m": str(used)}
+        if status == 429:
+            headers["retry-after"] = str(60 - int(time.time()) % 60)
+        return Response(
+            orjson.dumps(content),
+            status_code=status,
+            headers=headers,
+            media_type="application/json",
+        )
+
+    def per_symbol(self, p: dict[str, str], build_one):
+        if "symbol" in p:
+            return build_one(self.sim.market(p["symbol"]))
+        if "symbols" in p:
+            return [build_one(self.sim.market(s)) for s in orjson.loads(p["symbols"])]
+        return [build_one(m) for m in self.sim.markets.values()]
+
+    async def ping(self, request: Request):
+        return self.respond("ping", {}, lambda: {})
+
+    async def server_time(self, request: Request):
+        return self.respond("time", {}, lambda: {"serverTime": int(time.time() * 1000)})
+
+    async def exchange_info(self, request: Request):
+        return self.respond("exchangeInfo", {}, self.sim.exchange_info)
+
+    async def klines(self, request: Request):
+        p = dict(request.query_params)
+        return self.respond(
+            "klines",
+            p,
+            lambda: self.sim.klines(
+                p["symbol"],
+                p["interval"],
+                _optional_int(p, "startTime"),
+                _optional_int(p, "endTime"),
+                int(p.get("limit", 500)),
+            ),
+        )
+
+    async def ticker_24hr(self, request: Request):
+        p = dict(request.query_params)
+        return self.respond("ticker/24hr", p, lambda: self.per_symbol(p, self.sim.ticker_24hr))
+
+    async def book_ticker(self, request: Request):
+        p = dict(request.query_params)
+        return self.respond(
+            "ticker/bookTicker", p, lambda: self.per_symbol(p, self.sim.book_ticker)
+        )
+
+    async def ticker_price(self, request: Request):
+        p = dict(request.query_params)
+
+        def price(m: SimMarket) -> dict[str, str]:
+            return {"symbol": m.symbol, "price": fmt(m.price(time.time() * 1000))}
+
+        return self.respond("ticker/price", p, lambda: self.per_symbol(p, price))
+
+    async def depth(self, request: Request):
+        p = dict(request.query_params)
+        return self.respond(
+            "depth", p, lambda: self.sim.depth(p["symbol"], int(p.get("limit", 100)))
+        )
+
+    async def create_order(self, request: Request):
+        p = await _request_params(request)
+        return self.respond("order", p, lambda: self.sim.create_order(p))
+
+    async def fetch_order(self, request: Request):
+        p = await _request_params(request)
+        return self.respond("order", p, lambda: self.sim.fetch_order(p))
+
+    async def cancel_order(self, request: Request):
+        p = await _request_params(request)
+        return self.respond("order", p, lambda: self.sim.cancel_order(p))
+
+    async def open_orders(self, request: Request):
+        p = await _request_params(request)
+        return self.respond("openOrders", p, lambda: self.sim.list_open_orders(p.get("symbol")))
+
+    async def all_orders(self, request: Request):
+        p = await _request_params(request)
+        return self.respond(
+            "allOrders",
+            p,
+            lambda: self.sim.list_all_orders(
+                p["symbol"], _optional_int(p, "startTime"), int(p.get("limit", 500))
+            ),
+        )
+
+    async def my_trades(self, request: Request):
+        p = await _request_params(request)
+        return self.respond(
+            "myTrades",
+            p,
+            lambda: self.sim.my_trades(
+                p["symbol"],
+                _optional_int(p, "orderId"),
+                _optional_int(p, "startTime"),
+                int(p.get("limit", 500)),
+            ),
+        )
+
+    async def account(self, request: Request):
+        p = await _request_params(request)
+        return self.respond("account", p, self.sim.account)
+
+    async def delist_schedule(self, request: Request):
+        return self.respond("delist-schedule", {}, lambda: [])
+
+    async def stats(self, request: Request):
+        """
+        Simulator statistics - not part of the Binance API, and not counted as request.
+        """
+        return Response(
+            orjson.dumps(
+                {
+                    "requests": self.sim.request_count,
+                    "orders": len(self.sim.orders),
+                    "open_orders": len(self.sim.open_orders),
+                    "used_weight": self.sim.used_weight,
+                }
+            ),
+            media_type="application/json",
+        )
+
+    async def market_streams(self, websocket: WebSocket):
+        """
+        Market streams: <symbol>@kline_<interval>, <symbol>@ticker, <symbol>@miniTicker
+        and <symbol>@bookTicker.
+        """
+        await websocket.accept()
+        streams: set[str] = set()
+
+        async def push() -> None:
+            while True:
+                await asyncio.sleep(0.25)
+                now = time.time() * 1000
+                for stream in list(streams):
+                    if (message := stream_event(self.sim, stream, now)) is not None:
+                        await websocket.send_bytes(orjson.dumps(message))
+
+        pusher = asyncio.create_task(push())
+        try:
+            while True:
+                message = orjson.loads(await websocket.receive_text())
+                method = message.get("method")
+                if method == "SUBSCRIBE":
+                    streams.update(message.get("params", []))
+                elif method == "UNSUBSCRIBE":
+                    streams.difference_update(message.get("params", []))
+                reply = {"result": None, "id": message.get("id")}
+                await websocket.send_bytes(orjson.dumps(reply))
+        except WebSocketDisconnect:
+            pass
+        finally:
+            pusher.cancel()
+
+    async def websocket_api(self, websocket: WebSocket):
+        """
+        Websocket API - only the user data stream subscription, which then receives
+        executionReport events of all orders.
+        """
+        await websocket.accept()
+        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+
+        def on_event(event: dict[str, Any]) -> None:
+            queue.put_nowait({"subscriptionId": 0, "event": event})
+
+        async def push() -> None:
+            while True:
+                await websocket.send_bytes(orjson.dumps(await queue.get()))
+
+        pusher = asyncio.create_task(push())
+        try:
+            while True:
+                message = orjson.loads(await websocket.receive_text())
+                if message.get("method") == "userDataStream.subscribe.signature":
+                    if on_event not in self.sim.listeners:
+                        self.sim.listeners.append(on_event)
+                    reply = {
+                        "id": message.get("id"),
+                        "status": 200,
+                        "result": {"subscriptionId": 0},
+                    }
+                else:
+                    reply = {
+                        "id": message.get("id"),
+                        "status": 400,
+                        "error": {"code": -1100, "msg": "Not supported by the simulator."},
+                    }
+                await queue.put(reply)
+        except WebSocketDisconnect:
+            pass
+        finally:
+            if on_event in self.sim.listeners:
+                self.sim.listeners.remove(on_event)
+            pusher.cancel()
+
+
+def create_app(sim: BinanceSimulator) -> FastAPI:
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        async def match_orders() -> None:
+            # Resting orders fill without requests coming in - reported on the user data stream
+            while True:
+                await asyncio.sleep(MATCH_INTERVAL)
+                sim.match()
+
+        matcher = asyncio.create_task(match_orders())
+        yield
+        matcher.cancel()
+
+    app = FastAPI(title="Binance simulator", lifespan=lifespan)
+    SimulatorRoutes(sim).register(app)
+    return app
+
+
+def simulator_ccxt_config(url: str) -> dict[str, Any]:
+    """
+    ccxt configuration pointing a Binance (spot) instance at the simulator.
+    Merge into exchange.ccxt_config - applies to the bot's and copy trading's ccxt instances.
+    """
+    http = url.rstrip("/")
+    ws = "ws" + http[len("http") :]
+    return {
+        "urls": {
+            "api": {
+                "public": f"{http}/api/v3",
+                "private": f"{http}/api/v3",
+                "v1": f"{http}/api/v1",
+                "sapi": f"{http}/sapi/v1",
+                "ws": {"spot": f"{ws}/ws", "ws-api": {"spot": f"{ws}/ws-api/v3"}},
+            }
+        },
+        "options": {
+            "fetchMarkets": {"types": ["spot"]},
+            "fetchCurrencies": False,
+            "fetchMargins": False,
+        },
+    }
+
+
+def _serve(port: int, pairs: int, weight_limit: int | None) -> None:
+    sim = BinanceSimulator(pairs=pairs, weight_limit=weight_limit)
+    uvicorn.run(create_app(sim), host="127.0.0.1", port=port, log_level="warning")
+
+
+class SimulatorServer:
+    """
+    Runs the simulator on localhost in a separate process - so it doesn't compete with
+    the code under test for the GIL. Usable as context manager.
+    """
+
+    def __init__(
+        self, pairs: int = 50, weight_limit: int | None = WEIGHT_LIMIT, port: int = 0
+    ) -> None:
+        if not port:
+            with socket.socket() as sock:
+                sock.bind(("127.0.0.1", 0))
+                port = sock.getsockname()[1]
+        self.url = f"http://127.0.0.1:{port}"
+        self._process = multiprocessing.get_context("spawn").Process(
+            name="binance_simulator", target=_serve, args=(port, pairs, weight_limit), daemon=True
+        )
+
+    def start(self, timeout: float = 30) -> "SimulatorServer":
+        self._process.start()
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                self.stats()
+                return self
+            except OSError:
+                if not self._process.is_alive() or time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError("Simulator failed to start.")
+                time.sleep(0.05)
+
+    def stop(self) -> None:
+        self._process.terminate()
+        self._process.join()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Requests served, orders placed and weight used in the current minute.
+        """
+        # Always http on localhost
+        with urlopen(f"{self.url}/sim/stats", timeout=5) as response:  # noqa: S310
+            return orjson.loads(response.read())
+
+    def ccxt_config(self) -> dict[str, Any]:
+        return simulator_ccxt_config(self.url)
+
+    def __enter__(self) -> "SimulatorServer":
+        return self.start()
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--pairs", type=int, default=50)
+    parser.add_argument(
+        "--weight-limit",
+        type=int,
+        default=WEIGHT_LIMIT,
+        help="Request weight per minute, 0 to disable the limit.",
+    )
+    args = parser.parse_args()
+    print(f"Simulating {args.pairs} {QUOTE} pairs on http://127.0.0.1:{args.port}")
+    print(
+        "ccxt_config:",
+        orjson.dumps(simulator_ccxt_config(f"http://127.0.0.1:{args.port}")).decode(),
+    )
+    _serve(args.port, args.pairs, args.weight_limit or None)
+
+
+if __name__ == "__main__":
+    main()